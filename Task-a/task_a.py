@@ -24,40 +24,45 @@ Location: Meeting Room A
 Phone: 0401234567
 Email: anna.virtanen@example.com
 """
+import os
+import sys
 from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from shared.records import iter_records
+
 def main():
     # Define the file name directly in the code
     reservations = "reservations.txt"
 
-    # Open the file and read its contents
-    with open(reservations, "r", encoding="utf-8") as f:
-        reservation = f.read().strip()
+    # Read the first record; its fields are split only once
+    reservation = next(iter_records(reservations))
 
    # Try these
-    #print(reservation.split('|'))
-    reservationId = int(reservation.split('|')[0])
+    #print(reservation)
+    reservationId = int(reservation[0])
     print(f"Reservation number: {reservationId}")
-    booker = reservation.split('|')[1]
+    booker = reservation[1]
     print(f"Booker: {booker}")
-    day = datetime.strptime(reservation.split('|')[2], "%Y-%m-%d").date()
+    day = datetime.strptime(reservation[2], "%Y-%m-%d").date()
     finnish_day = day.strftime("%d.%m.%Y")
     print(f"Date: {finnish_day}")
-    time = datetime.strptime(reservation.split('|')[3], "%H:%M").time()
+    time = datetime.strptime(reservation[3], "%H:%M").time()
     finnish_time = time.strftime("%H.%M")
     print(f"Start time: {finnish_time}")
-    no_hrs = int(reservation.split('|')[4])
+    no_hrs = int(reservation[4])
     print(f"Number of hours: {no_hrs}")
-    hourly_price = float(reservation.split('|')[5])
+    hourly_price = float(reservation[5])
     print(f"Hourly price: {hourly_price:.2f}".replace('.',',')+ " €")
     total_price = no_hrs*hourly_price
     print(f"Total price: {total_price:.2f}".replace('.',',')+ " €")
-    paid = bool(reservation.split('|')[6])
+    paid = bool(reservation[6])
     print(f"Paid: {'Yes' if paid else 'No'}")
-    resource = reservation.split('|')[7]
+    resource = reservation[7]
     print(f"Location: {resource}")
-    phone = reservation.split('|')[8]
+    phone = reservation[8]
     print(f"Phone: {phone}")
-    email = reservation.split('|')[9]
+    email = reservation[9]
     print(f"Email: {email}")
     """
     The above should have printed the number 123,
@@ -1,4 +1,11 @@
-from datetime import datetime
+import os
+import sys
+from typing import List, Optional, TextIO
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from shared.dates import decode_date, decode_datetime, decode_time
+from shared.profiling import from_arg, stage
+from shared.records import iter_records
 
 FILE_PATH = r"C:\Users\Md Shahidul Islam\Desktop\Task-c\reservations.txt"
 
@@ -13,15 +20,15 @@ def convert_reservation_data(row):
     email = row[2]
     phone = row[3]
 
-    reservation_date = datetime.strptime(row[4], "%Y-%m-%d").date()
-    reservation_time = datetime.strptime(row[5], "%H:%M").time()
+    reservation_date = decode_date(row[4])
+    reservation_time = decode_time(row[5])
 
     duration_hours = int(row[6])
     price = float(row[7])
     confirmed = row[8] == "True"
 
     reserved_resource = row[9]
-    created_at = datetime.strptime(row[10], "%Y-%m-%d %H:%M:%S")
+    created_at = decode_datetime(row[10])
 
     return [
         reservation_id,
@@ -37,20 +44,12 @@ def convert_reservation_data(row):
         created_at,
     ]
 
+@stage("parse")
 def read_reservations():
     """
     Read all reservations from the text file and convert data types.
     """
-    reservations = []
-
-    with open(FILE_PATH, "r", encoding="utf-8") as file:
-        for line in file:
-            line = line.strip()
-            if not line:
-                continue
-            row = line.split("|")
-            reservations.append(convert_reservation_data(row))
-    return reservations
+    return [convert_reservation_data(row) for row in iter_records(FILE_PATH)]
 
 # ---------- PART B: Summaries ----------
 
@@ -94,15 +93,60 @@ def total_revenue(reservations):
     print("5) Total Revenue from Confirmed Reservations")
     print(f"Total revenue from confirmed reservations: {amount_str} €")
 
+# ---------- Single-pass report ----------
+
+@stage("format", rows=from_arg(0))
+def report_lines(reservations) -> List[str]:
+    """
+    Builds all five report sections in one pass over the reservations.
+    The lines are the same ones the functions above print.
+    """
+    confirmed_lines = ["1) Confirmed Reservations"]
+    long_lines = ["2) Long Reservations (≥ 3 h)"]
+    status_lines = ["3) Reservation Confirmation Status"]
+    confirmed_count = 0
+    not_confirmed_count = 0
+    total = 0
+
+    for r in reservations:
+        is_long = r[6] >= 3
+        if r[8] or is_long:
+            date_str = r[4].strftime("%d.%m.%Y")
+            time_str = r[5].strftime("%H.%M")
+        if r[8]:
+            confirmed_lines.append(f"- {r[1]}, {r[9]}, {date_str} at {time_str}")
+            status_lines.append(f"{r[1]} → Confirmed")
+            confirmed_count += 1
+            total += r[6] * r[7]
+        else:
+            status_lines.append(f"{r[1]} → NOT Confirmed")
+            not_confirmed_count += 1
+        if is_long:
+            long_lines.append(f"- {r[1]}, {date_str} at {time_str}, duration {r[6]} h, {r[9]}")
+
+    amount_str = f"{total:.2f}".replace(".", ",")
+    return [
+        *confirmed_lines, "",
+        *long_lines, "",
+        *status_lines, "",
+        "4) Confirmation Summary",
+        f"- Confirmed reservations: {confirmed_count} pcs",
+        f"- Not confirmed reservations: {not_confirmed_count} pcs",
+        "",
+        "5) Total Revenue from Confirmed Reservations",
+        f"Total revenue from confirmed reservations: {amount_str} €",
+    ]
+
+@stage("write", rows=from_arg(0))
+def write_report(lines: List[str], out: Optional[TextIO] = None) -> None:
+    """Writes the report with a single write call instead of one print per line."""
+    (out or sys.stdout).write("\n".join(lines) + "\n")
+
 # ---------- MAIN ----------
 
 def main():
     reservations = read_reservations()
-    confirmed_reservations(reservations)
-    long_reservations(reservations)
-    confirmation_statuses(reservations)
-    confirmation_summary(reservations)
-    total_revenue(reservations)
+    write_report(report_lines(reservations))
 
 if __name__ == "__main__":
     main()
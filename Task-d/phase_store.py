@@ -0,0 +1,105 @@
+"""
+Compact column store for the per-phase hourly records.
+
+A record dict from read_csv_data costs several hundred bytes: the dict
+itself, a datetime and six float objects. PhaseStore keeps the same data
+in seven contiguous arrays instead: the timestamp as epoch seconds of the
+local wall-clock time (array 'q') and one array 'd' per phase column,
+56 bytes per row.
+
+store[i] returns a PhaseRow, a read-only view that behaves like the
+record dict (row["timestamp"], row["consumption_1"], ...), so code
+written against the dicts keeps working. calculate_daily_totals reads
+the columns directly without creating views.
+"""
+
+from array import array
+from collections.abc import Mapping
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, Union
+
+# Record field names after the timestamp, in column order
+PHASE_FIELDS = (
+    "consumption_1", "consumption_2", "consumption_3",
+    "production_1", "production_2", "production_3",
+)
+
+EPOCH = datetime(1970, 1, 1)
+EPOCH_ORDINAL = EPOCH.toordinal()
+SECONDS_PER_DAY = 86400
+
+
+def to_epoch(moment: datetime) -> int:
+    """Seconds since 1970-01-01 00:00 of a naive wall-clock datetime."""
+    return (moment.toordinal() - EPOCH_ORDINAL) * SECONDS_PER_DAY + \
+        moment.hour * 3600 + moment.minute * 60 + moment.second
+
+
+class PhaseRow(Mapping):
+    """Read-only view of one row of a PhaseStore, keyed like the record dicts."""
+
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store: "PhaseStore", index: int):
+        self._store = store
+        self._index = index
+
+    def __getitem__(self, key: str) -> Union[datetime, float]:
+        if key == "timestamp":
+            return EPOCH + timedelta(seconds=self._store.timestamps[self._index])
+        try:
+            return self._store.columns[key][self._index]
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __iter__(self) -> Iterator[str]:
+        yield "timestamp"
+        yield from PHASE_FIELDS
+
+    def __len__(self) -> int:
+        return 1 + len(PHASE_FIELDS)
+
+    def __repr__(self) -> str:
+        return f"PhaseRow({dict(self)!r})"
+
+
+class PhaseStore:
+    """Per-phase hourly records stored as one typed array per column."""
+
+    def __init__(self) -> None:
+        self.timestamps = array("q")
+        self.columns: Dict[str, array] = {field: array("d") for field in PHASE_FIELDS}
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict]) -> "PhaseStore":
+        """Builds a store from record dicts, e.g. the iter_csv_data stream."""
+        store = cls()
+        for record in records:
+            store.append(record)
+        return store
+
+    def append(self, record: Dict) -> None:
+        self.timestamps.append(to_epoch(record["timestamp"]))
+        for field, column in self.columns.items():
+            column.append(record[field])
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __getitem__(self, index: int) -> PhaseRow:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("PhaseStore index out of range")
+        return PhaseRow(self, index)
+
+    def __iter__(self) -> Iterator[PhaseRow]:
+        return (PhaseRow(self, index) for index in range(len(self)))
+
+    def day_ordinals(self) -> array:
+        """The date.toordinal() of every row's local day."""
+        return array("q", (seconds // SECONDS_PER_DAY + EPOCH_ORDINAL for seconds in self.timestamps))
+
+    def nbytes(self) -> int:
+        """Bytes used by the column buffers."""
+        return sum(a.itemsize * len(a) for a in (self.timestamps, *self.columns.values()))
@@ -1,63 +1,104 @@
 import csv
-from datetime import datetime, date
-from typing import List, Dict
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Union
 import os  
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from shared.archive import open_lines
+from shared.profiling import from_arg, stage
+from shared.resample import Resampler
+from shared.timestamps import parse_local
+
+from phase_store import PhaseStore
 
 # Finnish weekday names, Monday = 0
 WEEKDAYS_FI = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
 
-def read_csv_data(file_path: str) -> List[Dict]:
+# Daily total key -> record field
+TOTAL_FIELDS = {
+    "cons_1": "consumption_1", "cons_2": "consumption_2", "cons_3": "consumption_3",
+    "prod_1": "production_1", "prod_2": "production_2", "prod_3": "production_3",
+}
+
+@stage("parse")
+def iter_csv_data(file_path: str) -> Iterator[Dict]:
     """
-    Reads electricity data from a CSV file with semicolon separators.
+    Streams electricity data from a CSV file with semicolon separators.
 
     Each row contains:
     - timestamp
     - consumption for three phases (Wh)
     - production for three phases (Wh)
 
-    Returns a list of dictionaries with values as floats and timestamp as datetime.
+    Yields one dictionary per row with values as floats and timestamp as datetime,
+    so only the current row is held in memory. Meter archives are read the same way.
     """
-    records = []
-    with open(file_path, mode="r", encoding="utf-8") as file:
+    with open_lines(file_path) as file:
         reader = csv.DictReader(file, delimiter=';')
         for row in reader:
-            ts = datetime.fromisoformat(row["Time"])
-            records.append({
-                "timestamp": ts,
+            yield {
+                "timestamp": parse_local(row["Time"]),
                 "consumption_1": float(row["Consumption phase 1 Wh"]),
                 "consumption_2": float(row["Consumption phase 2 Wh"]),
                 "consumption_3": float(row["Consumption phase 3 Wh"]),
                 "production_1": float(row["Production phase 1 Wh"]),
                 "production_2": float(row["Production phase 2 Wh"]),
                 "production_3": float(row["Production phase 3 Wh"]),
-            })
-    return records
+            }
 
-def calculate_daily_totals(records: List[Dict]) -> Dict[date, Dict[str, float]]:
+@stage("parse")
+def read_csv_data(file_path: str) -> List[Dict]:
     """
-    Groups hourly records by day and calculates total consumption and production per phase in kWh.
+    Reads electricity data from a CSV file with semicolon separators.
 
-    Returns a dictionary keyed by date.
+    Returns a list of dictionaries with values as floats and timestamp as datetime.
     """
-    totals_by_day: Dict[date, Dict[str, float]] = {}
-
-    for record in records:
-        day = record["timestamp"].date()
-        if day not in totals_by_day:
-            totals_by_day[day] = {
-                "cons_1": 0.0, "cons_2": 0.0, "cons_3": 0.0,
-                "prod_1": 0.0, "prod_2": 0.0, "prod_3": 0.0,
-            }
+    return list(iter_csv_data(file_path))
+
+@stage("parse")
+def read_csv_store(file_path: str) -> PhaseStore:
+    """
+    Reads electricity data from a CSV file into a compact PhaseStore.
+
+    Holds the same data as read_csv_data in about a tenth of the memory.
+    """
+    return PhaseStore.from_records(iter_csv_data(file_path))
+
+@stage("aggregate", rows=lambda args, resampler: resampler.rows)
+def resample_days(records: Union[PhaseStore, Iterable[Dict]]) -> Resampler:
+    """
+    Sums hourly records per day and phase in kWh.
 
-        totals_by_day[day]["cons_1"] += record["consumption_1"] / 1000
-        totals_by_day[day]["cons_2"] += record["consumption_2"] / 1000
-        totals_by_day[day]["cons_3"] += record["consumption_3"] / 1000
-        totals_by_day[day]["prod_1"] += record["production_1"] / 1000
-        totals_by_day[day]["prod_2"] += record["production_2"] / 1000
-        totals_by_day[day]["prod_3"] += record["production_3"] / 1000
+    Accepts a PhaseStore, a list or a stream of records. Records are resampled
+    in batches, so memory use is bounded by the number of days, not the number
+    of rows; a PhaseStore is resampled straight from its columns. The
+    returned Resampler counts the rows it consumed, which a stream cannot
+    report up front.
+    """
+    resampler = Resampler(list(TOTAL_FIELDS), "day", divisor=1000, extremes=False)
+    if isinstance(records, PhaseStore):
+        resampler.add_batch(
+            records.day_ordinals(),
+            {key: records.columns[field] for key, field in TOTAL_FIELDS.items()},
+        )
+    else:
+        resampler.add_stream(
+            records,
+            lambda record: record["timestamp"].toordinal(),
+            list(TOTAL_FIELDS.values()),
+        )
+    return resampler
+
+def calculate_daily_totals(records: Union[PhaseStore, Iterable[Dict]]) -> Dict[date, Dict[str, float]]:
+    """
+    Groups hourly records by day and calculates total consumption and production per phase in kWh.
 
-    return totals_by_day
+    Returns a dictionary keyed by date.
+    """
+    return resample_days(records).sums()
 
+@stage("format", rows=from_arg(0))
 def display_report(totals_by_day: Dict[date, Dict[str, float]]) -> None:
     """
     Prints a clear table of daily electricity consumption and production (kWh) for all phases.
@@ -84,14 +125,13 @@ def display_report(totals_by_day: Dict[date, Dict[str, float]]) -> None:
 
 def main() -> None:
     """
-    Main function: reads data, calculates daily totals, and prints the report.
+    Main function: streams data into daily totals and prints the report.
     """
     # Automatically find CSV in the same folder as the script
     script_dir = os.path.dirname(os.path.abspath(__file__))
     file_path = os.path.join(script_dir, "week42.csv")
 
-    records = read_csv_data(file_path)
-    daily_totals = calculate_daily_totals(records)
+    daily_totals = calculate_daily_totals(iter_csv_data(file_path))
     display_report(daily_totals)
 
 if __name__ == "__main__":
@@ -1,28 +1,48 @@
 # Copyright (c) 2026 Shaidul Islam
 # License: MIT
 
+import argparse
 import csv
+import json
 import os
-from datetime import datetime, date
-from collections import defaultdict
-from typing import List, Dict
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from typing import Any, Callable, List, Dict, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from shared.archive import is_archive, open_lines
+from shared.partitions import Span, partition_index, read_rows
+from shared.profiling import from_arg, stage
+from shared.resample import Resampler
+from shared.timestamps import parse_local
 
 
 WeekSummary = Dict[date, Dict[str, List[float]]]
 
+# (ISO year, ISO week)
+WeekKey = Tuple[int, int]
+
+# Below this many week files the pool start-up costs more than it saves
+PARALLEL_MIN_FILES = 8
+
+# Saved next to the week files; entries of another STATE_VERSION are ignored
+STATE_FILE = "summary_state.json"
+STATE_VERSION = 2
 
+CONSUMPTION_COLUMNS = ["Consumption phase 1 Wh", "Consumption phase 2 Wh", "Consumption phase 3 Wh"]
+PRODUCTION_COLUMNS = ["Production phase 1 Wh", "Production phase 2 Wh", "Production phase 3 Wh"]
+
+
+@stage("parse")
 def read_data(filename: str) -> List[Dict[str, str]]:
-    """Reads CSV file and returns rows as dictionaries."""
-    with open(filename, encoding="utf-8") as file:
+    """Reads CSV file (or meter archive) and returns rows as dictionaries."""
+    with open_lines(filename) as file:
         reader = csv.DictReader(file, delimiter=";")
         return list(reader)
 
 
-def wh_to_kwh(value: float) -> float:
-    """Converts Wh to kWh."""
-    return value / 1000.0
-
-
 def get_weekday(day: date) -> str:
     """Returns weekday name in English."""
     weekdays = [
@@ -32,28 +52,24 @@ def get_weekday(day: date) -> str:
     return weekdays[day.weekday()]
 
 
+@stage("aggregate", rows=from_arg(0))
 def calculate_daily_summary(rows: List[Dict[str, str]]) -> WeekSummary:
     """Calculates daily totals for consumption and production per phase."""
-    summary: WeekSummary = defaultdict(
-        lambda: {
-            "consumption": [0.0, 0.0, 0.0],
-            "production": [0.0, 0.0, 0.0]
-        }
+    columns = CONSUMPTION_COLUMNS + PRODUCTION_COLUMNS
+    resampler = Resampler(columns, "day", divisor=1000.0, extremes=False)
+    resampler.add_stream(
+        rows,
+        lambda row: parse_local(row["Time"]).toordinal(),
+        columns,
+        convert=float,
     )
-
-    for row in rows:
-        dt = datetime.fromisoformat(row["Time"])
-        day = dt.date()
-
-        summary[day]["consumption"][0] += wh_to_kwh(float(row["Consumption phase 1 Wh"]))
-        summary[day]["consumption"][1] += wh_to_kwh(float(row["Consumption phase 2 Wh"]))
-        summary[day]["consumption"][2] += wh_to_kwh(float(row["Consumption phase 3 Wh"]))
-
-        summary[day]["production"][0] += wh_to_kwh(float(row["Production phase 1 Wh"]))
-        summary[day]["production"][1] += wh_to_kwh(float(row["Production phase 2 Wh"]))
-        summary[day]["production"][2] += wh_to_kwh(float(row["Production phase 3 Wh"]))
-
-    return dict(summary)
+    return {
+        day: {
+            "consumption": [sums[column] for column in CONSUMPTION_COLUMNS],
+            "production": [sums[column] for column in PRODUCTION_COLUMNS],
+        }
+        for day, sums in resampler.sums().items()
+    }
 
 
 def format_number(value: float) -> str:
@@ -66,6 +82,7 @@ def format_date(day: date) -> str:
     return f"{day.day:02d}.{day.month:02d}.{day.year}"
 
 
+@stage("format", rows=from_arg(1))
 def format_week_section(week_number: int, summary: WeekSummary) -> str:
     """Formats one week's report section as a string."""
     lines = []
@@ -94,6 +111,177 @@ def format_week_section(week_number: int, summary: WeekSummary) -> str:
     return "\n".join(lines)
 
 
+def find_week_files(directory: str) -> Dict[int, str]:
+    """Finds weekNN.csv files in a directory, keyed by week number."""
+    files = {}
+    for name in os.listdir(directory):
+        match = re.fullmatch(r"week(\d+)\.csv", name)
+        if match:
+            files[int(match.group(1))] = os.path.join(directory, name)
+    return dict(sorted(files.items()))
+
+
+def process_week(item: Tuple[int, str]) -> str:
+    """Reads one week file and returns its formatted report section."""
+    week_number, filepath = item
+    rows = read_data(filepath)
+    summary = calculate_daily_summary(rows)
+    return format_week_section(week_number, summary)
+
+
+def process_week_state(item: Tuple[int, str]) -> Dict[str, Any]:
+    """Reads one week file and returns its state entry: source stamp and daily totals."""
+    week_number, filepath = item
+    stat = os.stat(filepath)
+    summary = calculate_daily_summary(read_data(filepath))
+    return {
+        "week": week_number,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "days": {day.isoformat(): totals for day, totals in summary.items()},
+    }
+
+
+def entry_summary(entry: Dict[str, Any]) -> WeekSummary:
+    """The daily totals of a state entry, keyed by date again."""
+    return {date.fromisoformat(day): totals for day, totals in entry["days"].items()}
+
+
+def process_partition(item: Tuple[int, str, int, Span]) -> str:
+    """Reads one week's byte range of a yearly export and returns its formatted report section."""
+    week_number, filepath, header_end, span = item
+    rows = read_rows(filepath, header_end, span)
+    summary = calculate_daily_summary(rows)
+    return format_week_section(week_number, summary)
+
+
+def run_weeks(func: Callable, items: List[Tuple], workers: Optional[int] = None) -> List[Any]:
+    """
+    Applies func to every (week number, ...) item and returns the results in order.
+
+    Items are spread across a process pool when there are enough of them,
+    otherwise they are processed serially. Both give identical results.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(items) < PARALLEL_MIN_FILES:
+        return [func(item) for item in items]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, items, chunksize=max(1, len(items) // (workers * 4))))
+
+
+def build_sections(files: Dict[int, str], workers: Optional[int] = None) -> List[str]:
+    """Builds the report sections for all week files in week order."""
+    return run_weeks(process_week, sorted(files.items()), workers)
+
+
+def build_sections_yearly(filepath: str, weeks: Optional[List[WeekKey]] = None,
+                          workers: Optional[int] = None) -> List[str]:
+    """
+    Builds weekly sections straight from a yearly per-phase export.
+
+    The export's partition index gives the byte range of every ISO week, so
+    each week parses only its own lines. weeks restricts the report to
+    those (ISO year, ISO week) pairs; an export that runs past New Year
+    has the same week number in two years. A meter archive is read in one
+    pass instead, since it cannot be partitioned by byte range.
+    """
+    if is_archive(filepath):
+        return archive_sections(filepath, weeks)
+    index = partition_index(filepath)
+    items = [
+        (week, filepath, index.header_end, span)
+        for year, week, span in index.iter_weeks()
+        if weeks is None or (year, week) in weeks
+    ]
+    return run_weeks(process_partition, items, workers)
+
+
+def archive_sections(filepath: str, weeks: Optional[List[WeekKey]] = None) -> List[str]:
+    """The weekly sections of a meter archive, from one pass over its rows."""
+    by_week: Dict[WeekKey, WeekSummary] = {}
+    for day, totals in calculate_daily_summary(read_data(filepath)).items():
+        iso = day.isocalendar()
+        by_week.setdefault((iso.year, iso.week), {})[day] = totals
+    return [
+        format_week_section(week, summary)
+        for (year, week), summary in sorted(by_week.items())
+        if weeks is None or (year, week) in weeks
+    ]
+
+
+def parse_week(text: str) -> WeekKey:
+    """Parses an ISO week given as 2025-W42."""
+    match = re.fullmatch(r"(\d{4})-W(\d{1,2})", text.strip())
+    if not match:
+        raise argparse.ArgumentTypeError(f"expected an ISO week like 2025-W42, not {text!r}")
+    return int(match.group(1)), int(match.group(2))
+
+
+def default_state_path(files: Dict[int, str]) -> str:
+    """The state file next to the week files (in the directory of the first one)."""
+    first = next(iter(files.values()), os.path.join(os.curdir, STATE_FILE))
+    return os.path.join(os.path.dirname(os.path.abspath(first)), STATE_FILE)
+
+
+def load_state(state_path: str) -> Dict[str, Dict[str, Any]]:
+    """Loads the saved per-file entries, or none if there is no state of this version."""
+    try:
+        with open(state_path, encoding="utf-8") as file:
+            state = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(state, dict) or state.get("version") != STATE_VERSION:
+        return {}
+    return state.get("weeks", {})
+
+
+def save_state(state_path: str, entries: Dict[str, Dict[str, Any]]) -> None:
+    tmp_path = state_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump({"version": STATE_VERSION, "weeks": entries}, file)
+    os.replace(tmp_path, state_path)
+
+
+def is_current(entry: Optional[Dict[str, Any]], week_number: int, filepath: str) -> bool:
+    """True if a state entry still matches the week file's size and mtime."""
+    if entry is None or entry.get("week") != week_number or "days" not in entry:
+        return False
+    stat = os.stat(filepath)
+    return entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns
+
+
+def build_sections_incremental(files: Dict[int, str], state_path: Optional[str] = None,
+                               workers: Optional[int] = None) -> List[str]:
+    """
+    Builds the report sections, re-reading only week files that are new or
+    have changed since the state file was written. Unchanged weeks reuse
+    their saved daily totals; every section is formatted from the totals.
+
+    The state file defaults to STATE_FILE next to the week files, with
+    entries keyed by file name relative to it.
+    """
+    if state_path is None:
+        state_path = default_state_path(files)
+    state_dir = os.path.dirname(os.path.abspath(state_path))
+    entries = load_state(state_path)
+    items = [(week, path, os.path.relpath(os.path.abspath(path), state_dir))
+             for week, path in sorted(files.items())]
+    stale = [(week, path, key) for week, path, key in items
+             if not is_current(entries.get(key), week, path)]
+
+    fresh = run_weeks(process_week_state, [(week, path) for week, path, _ in stale], workers)
+    for (_, _, key), entry in zip(stale, fresh):
+        entries[key] = entry
+
+    wanted = {key for _, _, key in items}
+    entries = {key: entry for key, entry in entries.items() if key in wanted}
+    if stale or len(entries) != len(wanted):
+        save_state(state_path, entries)
+    return [format_week_section(week, entry_summary(entries[key])) for week, _, key in items]
+
+
+@stage("write", rows=from_arg(0))
 def write_report(sections: List[str]) -> None:
     """Writes all weekly sections to summary.txt."""
     with open("summary.txt", "w", encoding="utf-8") as file:
@@ -101,26 +289,32 @@ def write_report(sections: List[str]) -> None:
             file.write(section + "\n")
 
 
-def main() -> None:
+def main(workers: Optional[int] = None, full: bool = False, yearly: Optional[str] = None,
+         weeks: Optional[List[WeekKey]] = None) -> None:
     """Main function: reads CSVs, computes summaries, writes report."""
     script_dir = os.path.dirname(os.path.abspath(__file__))
 
-    files = {
-        41: os.path.join(script_dir, "week41.csv"),
-        42: os.path.join(script_dir, "week42.csv"),
-        43: os.path.join(script_dir, "week43.csv")
-    }
-
-    sections = []
-
-    for week_number, filepath in files.items():
-        rows = read_data(filepath)
-        summary = calculate_daily_summary(rows)
-        sections.append(format_week_section(week_number, summary))
+    files = find_week_files(script_dir)
+    if yearly:
+        sections = build_sections_yearly(yearly, weeks, workers)
+    elif full:
+        sections = build_sections(files, workers)
+    else:
+        sections = build_sections_incremental(files, os.path.join(script_dir, STATE_FILE), workers)
 
     write_report(sections)
     print("Report successfully written to summary.txt")
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Weekly electricity summary report")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="number of worker processes (default: CPU count, 1 = serial)")
+    parser.add_argument("--full", action="store_true",
+                        help=f"re-read every week file instead of reusing {STATE_FILE}")
+    parser.add_argument("--yearly", metavar="CSV",
+                        help="summarise the weeks of one yearly per-phase export instead of weekNN.csv files")
+    parser.add_argument("--week", type=parse_week, action="append", dest="weeks", metavar="YYYY-Www",
+                        help="with --yearly, only this ISO week, e.g. 2025-W42 (repeatable)")
+    args = parser.parse_args()
+    main(args.workers, args.full, args.yearly, args.weeks)
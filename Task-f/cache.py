@@ -0,0 +1,100 @@
+# Copyright (c) 2025 Shaidul Islam
+# License: MIT
+
+"""
+Binary cache of the parsed hourly energy CSV.
+
+The cache is written next to the CSV (2025.csv -> 2025.csv.cache) as a
+small header followed by fixed-width records:
+
+    day ordinal (int32) | hour (int32) | consumption | production | temperature (float64)
+
+The header stores the size and mtime the source CSV had before it was
+parsed, so the cache is ignored as soon as the CSV changes, also when it
+changed while it was being parsed. A warm start maps the file with mmap
+and hands out a memoryview of the records, so they are read in place
+without any text parsing or copying.
+"""
+
+import mmap
+import os
+import struct
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+MAGIC = b"EFC1"
+HEADER = struct.Struct("<4sqqq")  # magic, source size, source mtime (ns), record count
+RECORD = struct.Struct("<iiddd")
+
+# (day ordinal, hour, consumption, production, temperature)
+Record = Tuple[int, int, float, float, float]
+
+
+def cache_path(filename: str) -> str:
+    return filename + ".cache"
+
+
+def source_stamp(filename: str) -> Tuple[int, int]:
+    """Size and mtime of the source CSV; take it before parsing and pass it to write_cache."""
+    stat = os.stat(filename)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def write_cache(filename: str, records: Iterable[Record], stamp: Tuple[int, int]) -> None:
+    """Writes records parsed from the source as it was at stamp. Failures are ignored."""
+    size, mtime = stamp
+    payload = b"".join(RECORD.pack(*record) for record in records)
+    tmp_path = cache_path(filename) + ".tmp"
+    try:
+        with open(tmp_path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, size, mtime, len(payload) // RECORD.size))
+            file.write(payload)
+        os.replace(tmp_path, cache_path(filename))
+    except OSError:
+        pass
+
+
+def read_cache(filename: str, stamp: Optional[Tuple[int, int]] = None) -> Optional[memoryview]:
+    """
+    Returns a read-only view of the record bytes of a valid cache for
+    filename (the map stays open while the view is referenced), or None
+    when there is no cache or it does not match stamp (default: the
+    source's current size and mtime).
+    """
+    path = cache_path(filename)
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size < HEADER.size:
+            return None
+        mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, size, mtime, count = HEADER.unpack_from(mm, 0)
+    end = HEADER.size + count * RECORD.size
+    if magic != MAGIC or (size, mtime) != (stamp or source_stamp(filename)) or len(mm) != end:
+        mm.close()
+        return None
+    return memoryview(mm)[HEADER.size:end]
+
+
+def iter_records(buffer: memoryview) -> Iterator[Record]:
+    return RECORD.iter_unpack(buffer)
+
+
+def records_from_rows(rows: List[Dict[str, Any]]) -> Iterator[Record]:
+    """Converts rows from read_data into cache records."""
+    for row in rows:
+        ts = row["time"]
+        yield ts.toordinal(), ts.hour, row["consumption"], row["production"], row["temperature"]
+
+
+def rows_from_records(records: Iterable[Record]) -> List[Dict[str, Any]]:
+    """Converts cache records back into rows shaped like read_data's output."""
+    return [
+        {
+            "time": datetime.fromordinal(ordinal) + timedelta(hours=hour),
+            "consumption": consumption,
+            "production": production,
+            "temperature": temperature,
+        }
+        for ordinal, hour, consumption, production, temperature in records
+    ]
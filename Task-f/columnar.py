@@ -0,0 +1,187 @@
+# Copyright (c) 2025 Shaidul Islam
+# License: MIT
+
+"""
+Columnar storage for the hourly energy data used by task_f.
+
+Time, consumption, production and temperature are kept as typed NumPy
+arrays together with their prefix sums, so the daily, monthly and yearly
+reports are answered with np.searchsorted and a subtraction instead of a
+Python loop over dicts. The prefix sums are int64 thousandths and the
+totals are settled as in range_index (a value on a rounding boundary is
+summed again with np.cumsum, which adds in row order like the original
+loop), so the reports match the other code paths.
+
+NumPy is optional: when it is not installed, HAS_NUMPY is False and
+task_f falls back to a RangeIndex over the rows from read_data.
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterator, List, Tuple
+
+from shared.archive import open_lines
+
+from cache import Record
+from range_index import SCALE, Totals, month_ranges, settle
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+if HAS_NUMPY:
+    # Matches cache.RECORD ("<iiddd")
+    RECORD_DTYPE = np.dtype([
+        ("ordinal", "<i4"), ("hour", "<i4"),
+        ("consumption", "<f8"), ("production", "<f8"), ("temperature", "<f8"),
+    ])
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+class EnergyColumns:
+    """Hourly energy data stored as one array per column."""
+
+    def __init__(self, days, hours, consumption, production, temperature) -> None:
+        order = np.lexsort((hours, days))
+        self.days = days[order]                # datetime64[D], local calendar day
+        self.hours = hours[order]              # int8, local hour of day
+        self.consumption = consumption[order]  # float64, kWh
+        self.production = production[order]    # float64, kWh
+        self.temperature = temperature[order]  # float64, °C
+        # Prefix sums in thousandths with a leading zero: rows [lo, hi) sum to cum[hi] - cum[lo]
+        self.cum_consumption = _prefix_sum(self.consumption)
+        self.cum_production = _prefix_sum(self.production)
+        self.cum_temperature = _prefix_sum(self.temperature)
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    @classmethod
+    def from_rows(cls, rows: List[Dict[str, Any]]) -> "EnergyColumns":
+        """Builds the columns from the list of dicts returned by read_data."""
+        days = np.array([row["time"].date() for row in rows], dtype="datetime64[D]")
+        return cls(
+            days,
+            np.array([row["time"].hour for row in rows], dtype=np.int8),
+            np.array([row["consumption"] for row in rows], dtype=np.float64),
+            np.array([row["production"] for row in rows], dtype=np.float64),
+            np.array([row["temperature"] for row in rows], dtype=np.float64),
+        )
+
+    @classmethod
+    def from_records(cls, buffer: memoryview) -> "EnergyColumns":
+        """Builds the columns from the record bytes of the binary cache, read in place."""
+        records = np.frombuffer(buffer, dtype=RECORD_DTYPE)
+        days = (records["ordinal"] - EPOCH_ORDINAL).astype("datetime64[D]")
+        # The fields are strided views into the map; sorting in __init__ makes the only copy
+        return cls(
+            days,
+            records["hour"].astype(np.int8),
+            records["consumption"],
+            records["production"],
+            records["temperature"],
+        )
+
+    def records(self) -> Iterator[Record]:
+        """Yields the rows as binary cache records."""
+        ordinals = self.days.astype(np.int64) + EPOCH_ORDINAL
+        return zip(
+            ordinals.tolist(),
+            self.hours.tolist(),
+            self.consumption.tolist(),
+            self.production.tolist(),
+            self.temperature.tolist(),
+        )
+
+    def _milli(self, lo: int, hi: int) -> Tuple[int, int, int, int]:
+        return (
+            int(self.cum_consumption[hi] - self.cum_consumption[lo]),
+            int(self.cum_production[hi] - self.cum_production[lo]),
+            int(self.cum_temperature[hi] - self.cum_temperature[lo]),
+            hi - lo,
+        )
+
+    def _range(self, start_date: date, end_date: date) -> Tuple[int, int]:
+        lo = int(np.searchsorted(self.days, np.datetime64(start_date, "D"), side="left"))
+        hi = int(np.searchsorted(self.days, np.datetime64(end_date, "D"), side="right"))
+        return lo, max(lo, hi)
+
+    def _float_sums(self, ranges: List[Tuple[int, int]]) -> Tuple[float, float, float]:
+        sums = []
+        for column in (self.consumption, self.production, self.temperature):
+            values = np.concatenate([column[lo:hi] for lo, hi in ranges])
+            # cumsum adds one value at a time, unlike the pairwise np.sum
+            sums.append(float(np.cumsum(values)[-1]) if len(values) else 0)
+        return sums[0], sums[1], sums[2]
+
+    def _totals(self, ranges: List[Tuple[int, int]]) -> Totals:
+        totals = [0, 0, 0, 0]
+        for lo, hi in ranges:
+            for i, value in enumerate(self._milli(lo, hi)):
+                totals[i] += value
+        return settle(*totals, lambda: self._float_sums(ranges))
+
+    def range_totals(self, start_date: date, end_date: date) -> Totals:
+        """Totals for all rows whose day is within [start_date, end_date]."""
+        return self._totals([self._range(start_date, end_date)])
+
+    def month_totals(self, month: int) -> Totals:
+        """Totals for the given month number (1-12) across every loaded year."""
+        if not len(self):
+            return 0.0, 0.0, 0.0, 0
+        first_year = self.days[0].astype(object).year
+        last_year = self.days[-1].astype(object).year
+        return self._totals([self._range(first, last)
+                             for first, last in month_ranges(first_year, last_year, month)])
+
+    def year_totals(self) -> Totals:
+        """Totals over the whole series."""
+        return self._totals([(0, len(self))])
+
+    def hourly(self, column: str = "consumption") -> Iterator[Tuple[datetime, float]]:
+        """Yields (time, value) of one column in time order."""
+        ordinals = (self.days.astype(np.int64) + EPOCH_ORDINAL).tolist()
+        for ordinal, hour, value in zip(ordinals, self.hours.tolist(), getattr(self, column).tolist()):
+            yield datetime.fromordinal(ordinal) + timedelta(hours=hour), value
+
+
+def _prefix_sum(values):
+    milli = np.rint(values * SCALE).astype(np.int64)
+    return np.concatenate((np.zeros(1, dtype=np.int64), np.cumsum(milli)))
+
+
+def read_columns(filename: str) -> EnergyColumns:
+    """Reads the semicolon separated CSV straight into columns."""
+    days: List[str] = []
+    hours: List[int] = []
+    consumption: List[float] = []
+    production: List[float] = []
+    temperature: List[float] = []
+    with open_lines(filename) as file:
+        header = [h.strip().lower() for h in next(file, "").strip().split(";")]
+        index = {}
+        for position, h in enumerate(header):
+            for key in ("time", "consumption", "production", "temperature"):
+                if key in h:
+                    index[key] = position
+                    break
+        t, c, p, temp = index["time"], index["consumption"], index["production"], index["temperature"]
+        for line in file:
+            values = line.strip().split(";")
+            if len(values) < len(header):
+                continue
+            days.append(values[t][:10])
+            hours.append(int(values[t][11:13]))
+            consumption.append(float(values[c].replace(",", ".")))
+            production.append(float(values[p].replace(",", ".")))
+            temperature.append(float(values[temp].replace(",", ".")))
+    return EnergyColumns(
+        np.array(days, dtype="datetime64[D]"),
+        np.array(hours, dtype=np.int8),
+        np.array(consumption, dtype=np.float64),
+        np.array(production, dtype=np.float64),
+        np.array(temperature, dtype=np.float64),
+    )
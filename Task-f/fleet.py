@@ -0,0 +1,267 @@
+# Copyright (c) 2026 Shaidul Islam
+# License: MIT
+
+"""
+Daily, monthly and yearly reports for a whole fleet of sites.
+
+Every site has its own hourly CSV (or .ema archive) in Task-f's format
+somewhere below one directory. The files are parsed in a process pool
+as a map-reduce:
+
+    map     each worker reads one file and returns its per-day totals
+            (consumption, production, temperature sum, hours). That is
+            at most 366 small tuples per year instead of 8760 rows.
+    reduce  the driver merges the day totals into every site's months
+            and years, and adds all sites up into fleet-wide totals.
+
+    python Task-f/fleet.py sites/                  # all cores
+    python Task-f/fleet.py sites/ --workers 4 --out fleet-report
+
+The site id is the file's path below the root without its extension,
+so sites/north/0042.csv is north/0042. Days use the local calendar date
+of the timestamp, as in task_f.py. Totals are kept in exact integer
+thousandths, so they are the same for any number of workers. On a
+half-cent tie the last digit can differ from task_f.py, which prints
+what the original row-by-row float loop gave (see range_index.py).
+
+Files that cannot be read are listed and left out of the totals.
+"""
+
+import argparse
+import fnmatch
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from shared.archive import open_lines
+from shared.profiling import stage
+
+from range_index import Totals, from_milli, to_milli
+from task_f import format_value
+
+# Below this many files the pool costs more than it saves
+PARALLEL_MIN_FILES = 8
+
+PATTERNS = ("*.csv", "*.ema")
+COLUMNS = ("time", "consumption", "production", "temperature")
+
+# Length of the key prefix that names each period: 2025-10-13, 2025-10, 2025
+PERIODS = {"day": 10, "month": 7, "year": 4}
+
+
+class SitePartial(NamedTuple):
+    """The map result for one site file; day totals are in thousandths (see rollup)."""
+    site: str
+    days: Dict[str, Totals]
+    rows: int
+    error: Optional[str] = None
+
+
+def find_sites(root: str, patterns: Iterable[str] = PATTERNS) -> List[Tuple[str, str]]:
+    """(site id, path) of every matching file below root, sorted by site id."""
+    patterns = tuple(patterns)
+    sites = []
+    for directory, subdirs, files in os.walk(root):
+        subdirs.sort()
+        for name in files:
+            if any(fnmatch.fnmatch(name, pattern) for pattern in patterns):
+                path = os.path.join(directory, name)
+                site = os.path.splitext(os.path.relpath(path, root))[0].replace(os.sep, "/")
+                sites.append((site, path))
+    return sorted(sites)
+
+
+def _column(header: List[str], name: str, path: str) -> int:
+    for position, column in enumerate(header):
+        if name in column:
+            return position
+    raise ValueError(f"{path}: no {name} column")
+
+
+def day_totals(path: str) -> Tuple[Dict[str, Totals], int]:
+    """One pass over a site file into per-day totals in thousandths, and the number of rows read."""
+    days: Dict[str, List[int]] = {}
+    rows = 0
+    with open_lines(path) as file:
+        header = [h.strip().lower() for h in next(file, "").strip().split(";")]
+        t, c, p, temp = (_column(header, name, path) for name in COLUMNS)
+        width = max(t, c, p, temp) + 1
+        current = None
+        totals: List[int] = []
+        for line in file:
+            values = line.split(";")
+            if len(values) < width:
+                continue
+            day = values[t].strip()[:10]
+            if day != current:
+                totals = days.get(day)
+                if totals is None:
+                    totals = days[day] = [0, 0, 0, 0]
+                current = day
+            totals[0] += to_milli(float(values[c].replace(",", ".")))
+            totals[1] += to_milli(float(values[p].replace(",", ".")))
+            totals[2] += to_milli(float(values[temp].replace(",", ".")))
+            totals[3] += 1
+            rows += 1
+    return {day: tuple(totals) for day, totals in days.items()}, rows
+
+
+def aggregate_site(item: Tuple[str, str]) -> SitePartial:
+    """Worker: the partial aggregate of one (site id, path) item."""
+    site, path = item
+    try:
+        days, rows = day_totals(path)
+    except (OSError, ValueError, UnicodeDecodeError) as error:
+        return SitePartial(site, {}, 0, str(error))
+    return SitePartial(site, days, rows)
+
+
+def map_sites(items: List[Tuple[str, str]], workers: Optional[int] = None) -> Iterator[SitePartial]:
+    """
+    Yields the partial of every item, in item order.
+
+    Items are spread across a process pool when there are enough of them,
+    otherwise they are processed serially. Both give identical results.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(items) < PARALLEL_MIN_FILES:
+        yield from map(aggregate_site, items)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(aggregate_site, items, chunksize=max(1, len(items) // (workers * 4)))
+
+
+def add_totals(target: Dict[str, List[int]], key: str, totals: Totals) -> None:
+    current = target.get(key)
+    if current is None:
+        target[key] = list(totals)
+    else:
+        current[0] += totals[0]
+        current[1] += totals[1]
+        current[2] += totals[2]
+        current[3] += totals[3]
+
+
+def rollup(days: Dict[str, Totals], period: str) -> Dict[str, Totals]:
+    """Day totals (in thousandths) summed into day, month or year totals, in key order."""
+    width = PERIODS[period]
+    merged: Dict[str, List[int]] = {}
+    for day in sorted(days):
+        add_totals(merged, day[:width], days[day])
+    return {key: from_milli(*totals) for key, totals in merged.items()}
+
+
+class FleetTotals:
+    """The reduce side: per-site day totals and their fleet-wide sum."""
+
+    def __init__(self) -> None:
+        self.sites: Dict[str, Dict[str, Totals]] = {}
+        self.fleet: Dict[str, List[int]] = {}
+        self.errors: Dict[str, str] = {}
+        self.rows = 0
+
+    def add(self, partial: SitePartial) -> None:
+        if partial.error is not None:
+            self.errors[partial.site] = partial.error
+            return
+        self.sites[partial.site] = partial.days
+        self.rows += partial.rows
+        for day, totals in partial.days.items():
+            add_totals(self.fleet, day, totals)
+
+    def report(self, period: str, site: Optional[str] = None) -> Dict[str, Totals]:
+        """Totals per period for one site, or for the whole fleet when site is None."""
+        days = self.sites[site] if site is not None else self.fleet
+        return rollup(days, period)
+
+
+@stage("parse", rows=lambda args, fleet: fleet.rows)
+def build_fleet(root: str, workers: Optional[int] = None,
+                patterns: Iterable[str] = PATTERNS) -> FleetTotals:
+    fleet = FleetTotals()
+    for partial in map_sites(find_sites(root, patterns), workers):
+        fleet.add(partial)
+    return fleet
+
+
+def average_temperature(totals: Totals) -> float:
+    return totals[2] / totals[3] if totals[3] else 0
+
+
+def report_lines(fleet: FleetTotals) -> List[str]:
+    """Fleet-wide yearly reports in task_f.py's layout, followed by a monthly table."""
+    lines = []
+    for year, totals in fleet.report("year").items():
+        lines += [
+            "-----------------------------------------------------",
+            f"Fleet report for the year: {year}",
+            f"- Sites: {sum(1 for days in fleet.sites.values() if any(d.startswith(year) for d in days))}",
+            f"- Total consumption: {format_value(totals[0])} kWh",
+            f"- Total production: {format_value(totals[1])} kWh",
+            f"- Average temperature: {format_value(average_temperature(totals))} °C",
+        ]
+    lines += [
+        "-----------------------------------------------------",
+        f"{'Month':<9}{'Consumption kWh':>18}{'Production kWh':>18}{'Avg temp °C':>13}",
+    ]
+    for month, totals in fleet.report("month").items():
+        lines.append(f"{month:<9}{format_value(totals[0]):>18}{format_value(totals[1]):>18}"
+                     f"{format_value(average_temperature(totals)):>13}")
+    return lines
+
+
+def csv_lines(fleet: FleetTotals, period: str) -> Iterator[str]:
+    """Semicolon-separated totals of every site and of the fleet (site "fleet") for a period."""
+    yield "Site;Period;Consumption kWh;Production kWh;Average temperature;Hours"
+    reports = [(site, fleet.report(period, site)) for site in sorted(fleet.sites)]
+    reports.append(("fleet", fleet.report(period)))
+    for site, report in reports:
+        for key, totals in report.items():
+            values = (totals[0], totals[1], average_temperature(totals))
+            yield f"{site};{key};" + ";".join(format_value(v) for v in values) + f";{totals[3]}"
+
+
+@stage("write")
+def write_reports(fleet: FleetTotals, out_dir: str) -> List[str]:
+    """Writes daily.csv, monthly.csv and yearly.csv into out_dir and returns their paths."""
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    for period, name in (("day", "daily.csv"), ("month", "monthly.csv"), ("year", "yearly.csv")):
+        path = os.path.join(out_dir, name)
+        with open(path, "w", encoding="utf-8") as file:
+            for line in csv_lines(fleet, period):
+                file.write(line + "\n")
+        paths.append(path)
+    return paths
+
+
+def main(root: str, workers: Optional[int], out_dir: Optional[str]) -> int:
+    started = time.perf_counter()
+    fleet = build_fleet(root, workers)
+    seconds = time.perf_counter() - started
+    if not fleet.sites and not fleet.errors:
+        print(f"No site files found below {root}")
+        return 1
+    print(f"{len(fleet.sites)} sites, {fleet.rows:,} hours read in {seconds:.2f} s "
+          f"({workers or os.cpu_count() or 1} workers)")
+    for site, error in sorted(fleet.errors.items()):
+        print(f"Skipped {site}: {error}")
+    for line in report_lines(fleet):
+        print(line)
+    if out_dir:
+        for path in write_reports(fleet, out_dir):
+            print(f"Report written to {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Daily, monthly and yearly reports for a fleet of site CSVs")
+    parser.add_argument("root", help="directory searched recursively for site .csv and .ema files")
+    parser.add_argument("--workers", type=int, help="worker processes (default: all cores)")
+    parser.add_argument("--out", metavar="DIR", help="write per-site and fleet daily/monthly/yearly CSVs here")
+    args = parser.parse_args()
+    sys.exit(main(args.root, args.workers, args.out))
@@ -0,0 +1,125 @@
+# Copyright (c) 2026 Shaidul Islam
+# License: MIT
+
+"""
+Background loading of the hourly energy data.
+
+BackgroundLoader parses the CSV on a daemon thread, one chunk of rows at
+a time, while the menu is already shown. The CSV is in time order, so
+after every chunk all days before the last parsed row are complete and
+a report only has to wait until its own last day is ready:
+
+    loader.data_through(date(2025, 1, 31))  # rows parsed so far, once January is in
+    loader.data_through(None)               # the full index, once loading has finished
+
+Before loading finishes, data_through() returns the list of rows parsed
+so far, which task_f answers with its plain list code. Afterwards it
+returns the prefix-sum index built by the finish callback.
+"""
+
+import sys
+import threading
+import time
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+Row = Dict[str, Any]
+
+# (rows, characters of the file consumed so far)
+Chunk = Tuple[List[Row], int]
+
+
+class BackgroundLoader:
+    """Loads rows on a background thread and tracks which days are ready."""
+
+    def __init__(self, chunks: Iterable[Chunk], finish: Callable[[List[Row]], Any],
+                 last_day: Optional[date] = None, total_size: int = 0) -> None:
+        self.last_day = last_day      # last day in the file, if known up front
+        self.total_size = total_size  # file size, for the progress percentage
+        self.rows: List[Row] = []
+        self.consumed = 0
+        self.ready_through: Optional[date] = None
+        self.data: Any = None
+        self.error: Optional[BaseException] = None
+        self.started = time.perf_counter()
+        self.load_seconds: Optional[float] = None
+        self._chunks = chunks
+        self._finish = finish
+        self._changed = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="energy-loader", daemon=True)
+
+    def start(self) -> "BackgroundLoader":
+        self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        try:
+            for rows, consumed in self._chunks:
+                with self._changed:
+                    self.rows.extend(rows)
+                    self.consumed = consumed
+                    if rows:
+                        # The last parsed day may continue in the next chunk
+                        self.ready_through = rows[-1]["time"].date() - timedelta(days=1)
+                    self._changed.notify_all()
+            data = self._finish(self.rows)
+            with self._changed:
+                self.data = data
+                self.load_seconds = time.perf_counter() - self.started
+                self._changed.notify_all()
+        except BaseException as exc:
+            with self._changed:
+                self.error = exc
+                self._changed.notify_all()
+
+    @property
+    def done(self) -> bool:
+        return self.data is not None or self.error is not None
+
+    def is_ready(self, day: Optional[date]) -> bool:
+        """True once every row up to and including day has been parsed (None: everything)."""
+        if self.done:
+            return True
+        if day is None or self.ready_through is None:
+            return False
+        return day <= self.ready_through
+
+    def progress(self) -> float:
+        """Share of the file consumed so far (0.0-1.0)."""
+        if self.done:
+            return 1.0
+        if not self.total_size:
+            return 0.0
+        return min(self.consumed / self.total_size, 1.0)
+
+    def status(self) -> str:
+        """One-line readiness indicator for the menu."""
+        if self.error is not None:
+            return f"Data: loading failed ({self.error})"
+        if self.data is not None:
+            return f"Data: ready, {len(self.data)} rows loaded in {self.load_seconds:.2f} s"
+        through = f", ready through {self.ready_through:%d.%m.%Y}" if self.ready_through else ""
+        return f"Data: loading {self.progress():.0%}{through}"
+
+    def data_through(self, day: Optional[date], show_progress: bool = True) -> Any:
+        """
+        Waits until every row up to day (None: the whole file) is parsed.
+
+        Returns the full index once loading has finished, otherwise a
+        snapshot of the rows parsed so far. While waiting, a progress line
+        is written to stderr.
+        """
+        waited = False
+        with self._changed:
+            while not self.is_ready(day):
+                if show_progress:
+                    print(f"\rWaiting for data... {self.status()}", end="", file=sys.stderr, flush=True)
+                    waited = True
+                self._changed.wait(0.2)
+            if waited:
+                print(file=sys.stderr)
+            if self.error is not None:
+                raise self.error
+            if self.data is not None:
+                return self.data
+            return self.rows[:]
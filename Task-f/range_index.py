@@ -0,0 +1,160 @@
+# Copyright (c) 2025 Shaidul Islam
+# License: MIT
+
+"""
+Prefix-sum index over the hourly energy data.
+
+Rows are keyed by their hour offset from the start of the series and
+cumulative sums of consumption, production and temperature are stored
+next to the keys. Any date range is then answered with two binary
+searches and a subtraction, independent of how much history is loaded.
+
+The source values have at most three decimals, so the cumulative sums
+are kept as integers in thousandths and every range sum is exact. The
+reports still have to print what the original row-by-row float loop
+printed, and that loop's result differs from the exact sum by rounding
+noise. Two decimals only depend on that noise when the exact value sits
+on a rounding boundary: a total of exactly x.xx5 (or 0, where the noise
+decides between "0,00" and "-0,00"), or an average of exactly x.xx5.
+settle() therefore uses the exact sums, and only in those cases sums
+the selected rows again in row order with float additions, as the loop
+did. Every code path settles the same way and prints the same report as
+the original loop.
+"""
+
+import calendar
+from bisect import bisect_left
+from datetime import date, datetime
+from itertools import accumulate
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+# (total consumption, total production, temperature sum, row count)
+Totals = Tuple[float, float, float, int]
+
+# Prefix sums are integers in units of 1/SCALE (the source has three decimals)
+SCALE = 1000
+
+# Sequential float sums of (consumption, production, temperature), computed on demand
+FloatSums = Callable[[], Tuple[float, float, float]]
+
+
+def to_milli(value: float) -> int:
+    return round(value * SCALE)
+
+
+def from_milli(consumption: int, production: int, temperature: int, count: int) -> Totals:
+    """Totals from exact sums in thousandths; the division rounds once, correctly."""
+    return consumption / SCALE, production / SCALE, temperature / SCALE, count
+
+
+def _total_on_boundary(milli: int) -> bool:
+    return milli % 10 == 5 or milli == 0
+
+
+def _average_on_boundary(milli: int, count: int) -> bool:
+    # milli / (SCALE * count) has a 5 in the third decimal exactly when 2 * milli
+    # is an odd multiple of 10 * count
+    return count > 0 and (milli == 0 or 2 * milli % (20 * count) == 10 * count)
+
+
+def settle(consumption: int, production: int, temperature: int, count: int,
+           float_sums: FloatSums) -> Totals:
+    """
+    Totals from exact sums in thousandths that print like the row-by-row
+    float loop: values on a rounding boundary are taken from float_sums().
+    """
+    totals = [consumption / SCALE, production / SCALE, temperature / SCALE]
+    boundary = (_total_on_boundary(consumption), _total_on_boundary(production),
+                _average_on_boundary(temperature, count))
+    if any(boundary):
+        loop = float_sums()
+        totals = [loop[i] if on else value for i, (value, on) in enumerate(zip(totals, boundary))]
+    return totals[0], totals[1], totals[2], count
+
+
+def float_sums(rows: Iterable[Dict[str, Any]]) -> Tuple[float, float, float]:
+    """Sums of read_data rows in row order, exactly as the original report loop added them."""
+    consumption = production = temperature = 0
+    for row in rows:
+        consumption += row["consumption"]
+        production += row["production"]
+        temperature += row["temperature"]
+    return consumption, production, temperature
+
+
+def exact_totals(rows: List[Dict[str, Any]]) -> Totals:
+    """Totals of read_data rows, summed in thousandths and settled like the prefix sums."""
+    consumption = production = temperature = 0
+    for row in rows:
+        consumption += round(row["consumption"] * SCALE)
+        production += round(row["production"] * SCALE)
+        temperature += round(row["temperature"] * SCALE)
+    return settle(consumption, production, temperature, len(rows), lambda: float_sums(rows))
+
+
+def month_ranges(first_year: int, last_year: int, month: int) -> Iterable[Tuple[date, date]]:
+    """Yields (first day, last day) of the given month for every year in the span."""
+    for year in range(first_year, last_year + 1):
+        yield date(year, month, 1), date(year, month, calendar.monthrange(year, month)[1])
+
+
+class RangeIndex:
+    """Cumulative sums over rows from read_data, keyed by hour offset."""
+
+    def __init__(self, rows: List[Dict[str, Any]]) -> None:
+        self.rows = sorted(rows, key=lambda row: row["time"])
+        self.start = self.rows[0]["time"].date() if self.rows else date.min
+        origin = self.start.toordinal()
+        self.hours = [
+            (row["time"].toordinal() - origin) * 24 + row["time"].hour for row in self.rows
+        ]
+        self.cum_consumption = [0, *accumulate(to_milli(row["consumption"]) for row in self.rows)]
+        self.cum_production = [0, *accumulate(to_milli(row["production"]) for row in self.rows)]
+        self.cum_temperature = [0, *accumulate(to_milli(row["temperature"]) for row in self.rows)]
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def _hour_offset(self, day: date) -> int:
+        return (day.toordinal() - self.start.toordinal()) * 24
+
+    def _milli(self, lo: int, hi: int) -> Tuple[int, int, int, int]:
+        return (
+            self.cum_consumption[hi] - self.cum_consumption[lo],
+            self.cum_production[hi] - self.cum_production[lo],
+            self.cum_temperature[hi] - self.cum_temperature[lo],
+            hi - lo,
+        )
+
+    def _range(self, start_date: date, end_date: date) -> Tuple[int, int]:
+        lo = bisect_left(self.hours, self._hour_offset(start_date))
+        hi = bisect_left(self.hours, self._hour_offset(end_date) + 24)
+        return lo, max(lo, hi)
+
+    def _totals(self, ranges: List[Tuple[int, int]]) -> Totals:
+        totals = [0, 0, 0, 0]
+        for lo, hi in ranges:
+            for i, value in enumerate(self._milli(lo, hi)):
+                totals[i] += value
+        rows = self.rows
+        return settle(*totals, lambda: float_sums(row for lo, hi in ranges for row in rows[lo:hi]))
+
+    def range_totals(self, start_date: date, end_date: date) -> Totals:
+        """Totals for all rows whose day is within [start_date, end_date]."""
+        return self._totals([self._range(start_date, end_date)])
+
+    def month_totals(self, month: int) -> Totals:
+        """Totals for the given month number (1-12) across every loaded year."""
+        if not self.rows:
+            return 0.0, 0.0, 0.0, 0
+        last_year = self.rows[-1]["time"].year
+        return self._totals([self._range(first, last)
+                             for first, last in month_ranges(self.start.year, last_year, month)])
+
+    def year_totals(self) -> Totals:
+        """Totals over the whole series."""
+        return self._totals([(0, len(self.rows))])
+
+    def hourly(self, column: str = "consumption") -> Iterator[Tuple[datetime, float]]:
+        """Yields (time, value) of one column in time order."""
+        return ((row["time"], row[column]) for row in self.rows)
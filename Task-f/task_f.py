@@ -1,13 +1,47 @@
 # Copyright (c) 2025 Shaidul Islam
 # License: MIT
 
-from datetime import datetime, date
-from typing import List, Dict, Any
+import calendar
+import os
+import sys
+import time
+import weakref
+from datetime import datetime, date, timedelta
+from itertools import islice
+from typing import Iterator, List, Dict, Any, Optional, Tuple, Union
 
-def read_data(filename: str) -> List[Dict[str, Any]]:
-    data = []
-    with open(filename, encoding="utf-8") as file:
-        header = file.readline().strip().split(";")
+# Start of the time-to-first-menu measurement, before the heavier imports below
+STARTED = time.perf_counter()
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from shared.archive import MeterArchive, is_archive, open_lines
+from shared.profiling import from_arg, stage
+from shared.resample import resample
+from shared.sketches import LoadProfiles, LoadSummary
+from shared.timestamps import parse_local, parse_timestamps
+
+from cache import iter_records, read_cache, records_from_rows, rows_from_records, source_stamp, write_cache
+from columnar import HAS_NUMPY, EnergyColumns, read_columns
+from loader import BackgroundLoader, Chunk
+from range_index import RangeIndex, Totals, exact_totals, float_sums, settle, to_milli
+
+EnergyData = Union[List[Dict[str, Any]], EnergyColumns, RangeIndex, BackgroundLoader]
+
+def row_count(args: tuple, totals: Totals) -> int:
+    """Rows covered by a totals query, for the stage profiler."""
+    return totals[3]
+
+@stage("parse", item_rows=lambda chunk: len(chunk[0]))
+def iter_data_chunks(filename: str, chunk_size: int = 4096) -> Iterator[Chunk]:
+    """
+    Parses the CSV in chunks of rows shaped like read_data's output.
+
+    Yields (rows, characters consumed so far) so a caller can report progress.
+    """
+    with open_lines(filename) as file:
+        first = next(file, "")
+        consumed = len(first)
+        header = first.strip().split(";")
         header = [h.strip().lower() for h in header]
         key_map = {}
         for h in header:
@@ -19,18 +53,245 @@ def read_data(filename: str) -> List[Dict[str, Any]]:
                 key_map[h] = "production"
             elif "temperature" in h:
                 key_map[h] = "temperature"
-        for line in file:
-            values = line.strip().split(";")
-            row = dict(zip(header, values))
-            row = {key_map[k]: v for k, v in row.items()}
-            row["time"] = datetime.fromisoformat(row["time"].replace("+02:00",""))
-            row["consumption"] = float(row["consumption"].replace(",", "."))
-            row["production"] = float(row["production"].replace(",", "."))
-            row["temperature"] = float(row["temperature"].replace(",", "."))
-            data.append(row)
+        while True:
+            lines = list(islice(file, chunk_size))
+            if not lines:
+                return
+            data = []
+            for line in lines:
+                consumed += len(line)
+                values = line.strip().split(";")
+                row = dict(zip(header, values))
+                row = {key_map[k]: v for k, v in row.items()}
+                row["consumption"] = float(row["consumption"].replace(",", "."))
+                row["production"] = float(row["production"].replace(",", "."))
+                row["temperature"] = float(row["temperature"].replace(",", "."))
+                data.append(row)
+            # Local wall-clock time; +02:00 and summer-time +03:00 rows decode the same way
+            for row, ts in zip(data, parse_timestamps([row["time"] for row in data])):
+                row["time"] = ts
+            yield data, consumed
+
+@stage("parse")
+def read_data(filename: str) -> List[Dict[str, Any]]:
+    data = []
+    for rows, _ in iter_data_chunks(filename):
+        data.extend(rows)
     return data
 
-def show_main_menu() -> str:
+@stage("parse")
+def index_from_cache(cached: memoryview) -> Union[EnergyColumns, RangeIndex]:
+    """Builds the report index from the records of a valid binary cache."""
+    if HAS_NUMPY:
+        return EnergyColumns.from_records(cached)
+    return RangeIndex(rows_from_records(iter_records(cached)))
+
+@stage("parse")
+def load_data(filename: str) -> EnergyData:
+    """
+    Loads the CSV and builds a prefix-sum index over it for the reports.
+
+    A valid binary cache next to the CSV is used instead of parsing the text;
+    otherwise the CSV is parsed and the cache is (re)written.
+    """
+    stamp = source_stamp(filename)
+    cached = read_cache(filename, stamp)
+    if cached is not None:
+        return index_from_cache(cached)
+    if HAS_NUMPY:
+        columns = read_columns(filename)
+        write_cache(filename, columns.records(), stamp)
+        return columns
+    rows = read_data(filename)
+    write_cache(filename, records_from_rows(rows), stamp)
+    return RangeIndex(rows)
+
+@stage("aggregate")
+def build_index(filename: str, rows: List[Dict[str, Any]], stamp: Tuple[int, int]) -> Union[EnergyColumns, RangeIndex]:
+    """Builds the report index over rows parsed from the source as it was at stamp, and writes the binary cache."""
+    index = EnergyColumns.from_rows(rows) if HAS_NUMPY else RangeIndex(rows)
+    write_cache(filename, index.records() if HAS_NUMPY else records_from_rows(rows), stamp)
+    return index
+
+def peek_last_day(filename: str) -> Optional[date]:
+    """The day of the last row, read from the end of the file without parsing the rest."""
+    if is_archive(filename):
+        blocks = MeterArchive(filename).blocks
+        return blocks[-1].last_day if blocks else None
+    with open(filename, "rb") as file:
+        file.seek(0, os.SEEK_END)
+        file.seek(max(0, file.tell() - 512))
+        lines = file.read().decode("utf-8", errors="replace").strip().splitlines()
+    if len(lines) < 2:
+        return None
+    try:
+        return parse_local(lines[-1].split(";")[0].strip()).date()
+    except ValueError:
+        return None
+
+def profiled(chunks: Iterator[Chunk], profiles: LoadProfiles) -> Iterator[Chunk]:
+    """Passes chunks through, adding each one's hourly consumption to profiles first."""
+    for rows, consumed in chunks:
+        profiles.add((row["time"], row["consumption"]) for row in rows)
+        yield rows, consumed
+
+def record_pairs(cached: memoryview) -> Iterator[Tuple[datetime, float]]:
+    """(time, consumption) of every record of the binary cache."""
+    for ordinal, hour, consumption, _, _ in iter_records(cached):
+        yield datetime.fromordinal(ordinal) + timedelta(hours=hour), consumption
+
+def start_loading(filename: str) -> BackgroundLoader:
+    """
+    Starts loading the data on a background thread.
+
+    A valid binary cache is loaded in one step; otherwise the CSV is parsed
+    in chunks so reports can be served from the days already parsed. The
+    load profiles are filled from the same stream, chunk by chunk.
+    """
+    profiles = LoadProfiles()
+    stamp = source_stamp(filename)
+    cached = read_cache(filename, stamp)
+    if cached is not None:
+        def finish(rows: List[Dict[str, Any]]) -> EnergyData:
+            profiles.add(record_pairs(cached))
+            return _with_profiles(index_from_cache(cached), profiles)
+        loader = BackgroundLoader((), finish)
+    else:
+        loader = BackgroundLoader(
+            profiled(iter_data_chunks(filename), profiles),
+            lambda rows: _with_profiles(build_index(filename, rows, stamp), profiles),
+            last_day=peek_last_day(filename),
+            total_size=os.path.getsize(filename),
+        )
+    return _with_profiles(loader, profiles).start()
+
+def month_last_day(last_day: Optional[date], month_num: int) -> Optional[date]:
+    """The last day of the latest occurrence of month_num in the data, or None if unknown."""
+    if last_day is None:
+        return None
+    year = last_day.year if month_num <= last_day.month else last_day.year - 1
+    return min(last_day, date(year, month_num, calendar.monthrange(year, month_num)[1]))
+
+@stage("aggregate", rows=row_count)
+def range_totals(data: EnergyData, start_date: date, end_date: date) -> Totals:
+    if isinstance(data, BackgroundLoader):
+        data = data.data_through(end_date)
+    if isinstance(data, (EnergyColumns, RangeIndex)):
+        return data.range_totals(start_date, end_date)
+    return exact_totals([row for row in data if start_date <= row["time"].date() <= end_date])
+
+@stage("aggregate", rows=row_count)
+def month_totals(data: EnergyData, month_num: int) -> Totals:
+    if isinstance(data, BackgroundLoader):
+        data = data.data_through(month_last_day(data.last_day, month_num))
+    if isinstance(data, (EnergyColumns, RangeIndex)):
+        return data.month_totals(month_num)
+    buckets = resample_rows(data, "month")
+    return sum_buckets((stats for (_, month), stats in buckets.items() if month == month_num),
+                       lambda: float_sums(row for row in data if row["time"].month == month_num))
+
+@stage("aggregate", rows=row_count)
+def year_totals(data: EnergyData) -> Totals:
+    if isinstance(data, BackgroundLoader):
+        data = data.data_through(None)
+    if isinstance(data, (EnergyColumns, RangeIndex)):
+        return data.year_totals()
+    return sum_buckets(resample_rows(data, "year").values(), lambda: float_sums(data))
+
+def resample_rows(data: List[Dict[str, Any]], freq: str) -> Dict[Any, Dict[str, Any]]:
+    """Resamples read_data rows into day, week, month or year buckets of exact thousandths."""
+    columns = ("consumption", "production", "temperature")
+    return resample(
+        [row["time"].toordinal() for row in data],
+        {column: [to_milli(row[column]) for row in data] for column in columns},
+        freq,
+    )
+
+def sum_buckets(buckets, loop_sums) -> Totals:
+    """Totals of resampled buckets, settled with loop_sums() like the prefix sums."""
+    total_consumption = 0
+    total_production = 0
+    temp_sum = 0
+    count = 0
+    for stats in buckets:
+        total_consumption += int(stats["consumption"].sum)
+        total_production += int(stats["production"].sum)
+        temp_sum += int(stats["temperature"].sum)
+        count += stats["consumption"].count
+    return settle(total_consumption, total_production, temp_sum, count, loop_sums)
+
+# Load profiles of every loader and index, filled while their data streamed in
+_profiles: "weakref.WeakKeyDictionary[Any, LoadProfiles]" = weakref.WeakKeyDictionary()
+
+def _with_profiles(data: Any, profiles: LoadProfiles) -> Any:
+    _profiles[data] = profiles
+    return data
+
+def load_profiles(data: EnergyData) -> LoadProfiles:
+    """
+    The per-day hourly consumption profiles of data.
+
+    Data from start_loading already has them; for rows or an index built
+    elsewhere they are computed from its rows once.
+    """
+    profiles = _profiles.get(data) if not isinstance(data, list) else None
+    if profiles is None:
+        profiles = LoadProfiles()
+        profiles.add(data.hourly("consumption") if isinstance(data, (EnergyColumns, RangeIndex))
+                     else ((row["time"], row["consumption"]) for row in data))
+        if not isinstance(data, list):
+            _profiles[data] = profiles
+    return profiles
+
+def _ready_profiles(data: EnergyData, day: Optional[date]) -> LoadProfiles:
+    if isinstance(data, BackgroundLoader):
+        # The profiles of every day up to day are complete once its rows are
+        data.data_through(day)
+    return load_profiles(data)
+
+def range_profile(data: EnergyData, start_date: date, end_date: date) -> LoadSummary:
+    """Hourly consumption summary (peak, percentiles, histogram) of the days in a date range."""
+    return _ready_profiles(data, end_date).between(start_date, end_date)
+
+def month_profile(data: EnergyData, month_num: int) -> LoadSummary:
+    """The given month number merged across every loaded year."""
+    last_day = data.last_day if isinstance(data, BackgroundLoader) else None
+    return _ready_profiles(data, month_last_day(last_day, month_num)).select(lambda day: day.month == month_num)
+
+def year_profile(data: EnergyData) -> LoadSummary:
+    return _ready_profiles(data, None).select(lambda day: True)
+
+def format_histogram(profile: LoadSummary) -> str:
+    parts = []
+    for low, high, count in profile.histogram.buckets():
+        if low is None:
+            label = f"<{format_edge(high)}"
+        elif high is None:
+            label = f"≥{format_edge(low)}"
+        else:
+            label = f"{format_edge(low)}–{format_edge(high)}"
+        parts.append(f"{label}: {count}")
+    return " | ".join(parts)
+
+def format_edge(value: float) -> str:
+    return f"{value:g}".replace(".", ",")
+
+def profile_lines(profile: LoadSummary) -> List[str]:
+    """Peak hour, percentiles and histogram lines of a report."""
+    if not profile.count:
+        return []
+    p50, p95, p99 = profile.percentiles()
+    return [
+        f"- Peak hourly consumption: {format_value(profile.peak.high)} kWh "
+        f"({profile.peak.high_at:%d.%m.%Y %H:%M})",
+        f"- Hourly consumption p50 / p95 / p99: "
+        f"{format_value(p50)} / {format_value(p95)} / {format_value(p99)} kWh",
+        f"- Hours by consumption (kWh): {format_histogram(profile)}",
+    ]
+
+def show_main_menu(status: str = "") -> str:
+    if status:
+        print(status)
     print("Choose a report type:")
     print("1) Daily summary for a date range")
     print("2) Monthly summary for one month")
@@ -38,65 +299,48 @@ def show_main_menu() -> str:
     print("4) Exit the program")
     return input("Enter your choice: ")
 
-def create_daily_report(data: List[Dict[str, Any]]) -> List[str]:
+def create_daily_report(data: EnergyData) -> List[str]:
     start_str = input("Enter start date (dd.mm.yyyy): ")
     end_str = input("Enter end date (dd.mm.yyyy): ")
     start_date = datetime.strptime(start_str, "%d.%m.%Y").date()
     end_date = datetime.strptime(end_str, "%d.%m.%Y").date()
-    total_consumption = 0
-    total_production = 0
-    temp_sum = 0
-    count = 0
-    for row in data:
-        day = row["time"].date()
-        if start_date <= day <= end_date:
-            total_consumption += row["consumption"]
-            total_production += row["production"]
-            temp_sum += row["temperature"]
-            count += 1
+    total_consumption, total_production, temp_sum, count = range_totals(data, start_date, end_date)
     avg_temp = temp_sum / count if count else 0
     lines = [
         "-----------------------------------------------------",
         f"Report for the period {start_str}–{end_str}",
         f"- Total consumption: {format_value(total_consumption)} kWh",
         f"- Total production: {format_value(total_production)} kWh",
-        f"- Average temperature: {format_value(avg_temp)} °C"
+        f"- Average temperature: {format_value(avg_temp)} °C",
+        *profile_lines(range_profile(data, start_date, end_date)),
     ]
     return lines
 
-def create_monthly_report(data: List[Dict[str, Any]]) -> List[str]:
+def create_monthly_report(data: EnergyData) -> List[str]:
     month_num = int(input("Enter month number (1–12): "))
-    total_consumption = 0
-    total_production = 0
-    temp_sum = 0
-    count = 0
-    for row in data:
-        if row["time"].month == month_num:
-            total_consumption += row["consumption"]
-            total_production += row["production"]
-            temp_sum += row["temperature"]
-            count += 1
+    total_consumption, total_production, temp_sum, count = month_totals(data, month_num)
     avg_temp = temp_sum / count if count else 0
-    month_name = row["time"].strftime("%B")
+    month_name = date(2025, month_num, 1).strftime("%B")
     lines = [
         "-----------------------------------------------------",
         f"Report for the month: {month_name}",
         f"- Total consumption: {format_value(total_consumption)} kWh",
         f"- Total production: {format_value(total_production)} kWh",
-        f"- Average temperature: {format_value(avg_temp)} °C"
+        f"- Average temperature: {format_value(avg_temp)} °C",
+        *profile_lines(month_profile(data, month_num)),
     ]
     return lines
 
-def create_yearly_report(data: List[Dict[str, Any]]) -> List[str]:
-    total_consumption = sum(row["consumption"] for row in data)
-    total_production = sum(row["production"] for row in data)
-    avg_temp = sum(row["temperature"] for row in data) / len(data) if data else 0
+def create_yearly_report(data: EnergyData) -> List[str]:
+    total_consumption, total_production, temp_sum, count = year_totals(data)
+    avg_temp = temp_sum / count if count else 0
     lines = [
         "-----------------------------------------------------",
         "Report for the year: 2025",
         f"- Total consumption: {format_value(total_consumption)} kWh",
         f"- Total production: {format_value(total_production)} kWh",
-        f"- Average temperature: {format_value(avg_temp)} °C"
+        f"- Average temperature: {format_value(avg_temp)} °C",
+        *profile_lines(year_profile(data)),
     ]
     return lines
 
@@ -107,6 +351,7 @@ def print_report_to_console(lines: List[str]) -> None:
     for line in lines:
         print(line)
 
+@stage("write", rows=from_arg(0))
 def write_report_to_file(lines: List[str]) -> None:
     with open("report.txt", "w", encoding="utf-8") as file:
         for line in lines:
@@ -114,12 +359,14 @@ def write_report_to_file(lines: List[str]) -> None:
     print("Report successfully written to report.txt")
 
 def main() -> None:
-    import os
     script_dir = os.path.dirname(os.path.abspath(__file__))
     filename = os.path.join(script_dir, "2025.csv")
-    data = read_data(filename)
+    data = start_loading(filename)
+    first_menu = f" (menu shown {(time.perf_counter() - STARTED) * 1000:.1f} ms after start)"
     while True:
-        choice = show_main_menu()
+        # Read the status only now: the previous report may have waited for more data
+        choice = show_main_menu(data.status() + first_menu)
+        first_menu = ""
         if choice == "1":
             report = create_daily_report(data)
         elif choice == "2":
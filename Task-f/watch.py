@@ -0,0 +1,124 @@
+# Copyright (c) 2026 Shaidul Islam
+# License: MIT
+
+"""
+Flags anomalous hours in an hourly energy CSV.
+
+Every hour is compared with the same hour over the previous weeks (see
+shared.anomaly) and the outliers are printed:
+
+    python Task-f/watch.py                    # 2025.csv next to this script
+    python Task-f/watch.py data.csv --threshold 4 --season week
+    python Task-f/watch.py data.csv --follow  # keep watching appended rows
+
+In follow mode the file is read like a log through shared.tail.FileTail:
+only newline-terminated lines are parsed (a last line still being
+written waits for the next poll), and a truncated or replaced file is
+read again from the start with a fresh baseline.
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Iterator, List, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from shared.anomaly import SEASONS, Anomaly, AnomalyDetector
+from shared.tail import FileTail
+from shared.timestamps import parse_local
+
+from task_f import format_value, read_data
+
+COLUMNS = ("consumption", "production", "temperature")
+
+
+class CsvTail:
+    """Returns the (time, value) samples of the lines appended since the last poll."""
+
+    def __init__(self, filename: str, column: str = "consumption") -> None:
+        self.tail = FileTail(filename)
+        self.column = column
+        self.header: Optional[str] = None
+        self.positions = (0, 0)
+
+    @property
+    def resets(self) -> int:
+        return self.tail.resets
+
+    def poll(self) -> List[Tuple[datetime, float]]:
+        lines = self.tail.poll()
+        if self.tail.header is None:
+            return []
+        if self.tail.header != self.header:
+            # First read, or the file was replaced: find the columns again
+            header = [h.strip().lower() for h in self.tail.header.split(";")]
+            time_at = next(i for i, h in enumerate(header) if "time" in h)
+            value_at = next(i for i, h in enumerate(header) if self.column in h)
+            self.header, self.positions = self.tail.header, (time_at, value_at)
+        time_at, value_at = self.positions
+        samples = []
+        for line in lines:
+            values = line.split(";")
+            if len(values) <= max(time_at, value_at):
+                continue
+            samples.append((parse_local(values[time_at].strip()),
+                            float(values[value_at].replace(",", "."))))
+        return samples
+
+    def follow(self, interval: float = 5.0) -> Iterator[List[Tuple[datetime, float]]]:
+        while True:
+            samples = self.poll()
+            if samples:
+                yield samples
+            time.sleep(interval)
+
+
+def format_anomaly(anomaly: Anomaly) -> str:
+    z = f"{anomaly.z:+.1f}".replace(".", ",")
+    return (f"{anomaly.time:%d.%m.%Y %H:%M}  {format_value(anomaly.value):>7}  "
+            f"baseline {format_value(anomaly.mean)} ± {format_value(anomaly.std)}  z = {z}")
+
+
+def main(filename: str, column: str, weeks: int, threshold: float, season: str,
+         follow: bool, interval: float) -> None:
+    detector = AnomalyDetector(weeks=weeks, threshold=threshold, season=season)
+    print(f"Hours with {column} more than {threshold:g} σ from the same "
+          f"{'hour' if season == 'day' else 'weekday and hour'} over the previous {weeks} weeks:")
+    if not follow:
+        rows = sorted(read_data(filename), key=lambda row: row["time"])
+        for anomaly in detector.run((row["time"], row[column]) for row in rows):
+            print(format_anomaly(anomaly))
+        print(f"{detector.flagged} of {detector.samples} hours flagged")
+        return
+
+    tail = CsvTail(filename, column)
+    try:
+        for anomaly in detector.run(tail.poll()):
+            print(format_anomaly(anomaly))
+        print(f"Following {filename} ({detector.samples} hours read, Ctrl+C to stop)")
+        resets = tail.resets
+        for samples in tail.follow(interval):
+            if tail.resets != resets:
+                detector = AnomalyDetector(weeks=weeks, threshold=threshold, season=season)
+                resets = tail.resets
+            for anomaly in detector.run(samples):
+                print(format_anomaly(anomaly), flush=True)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Flag anomalous hours in an hourly energy CSV")
+    parser.add_argument("filename", nargs="?",
+                        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "2025.csv"))
+    parser.add_argument("--column", choices=COLUMNS, default="consumption")
+    parser.add_argument("--weeks", type=int, default=4, help="length of the baseline window")
+    parser.add_argument("--threshold", type=float, default=3.0, help="flag beyond this many standard deviations")
+    parser.add_argument("--season", choices=SEASONS, default="day",
+                        help="compare with the same hour of day, or the same hour of the same weekday")
+    parser.add_argument("--follow", action="store_true", help="keep watching the file for appended rows")
+    parser.add_argument("--interval", type=float, default=5.0, help="seconds between polls in follow mode")
+    args = parser.parse_args()
+    main(args.filename, args.column, args.weeks, args.threshold, args.season, args.follow, args.interval)
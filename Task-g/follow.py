@@ -0,0 +1,61 @@
+"""
+Follow mode for an append-only reservations file.
+
+The file is read through shared.tail.FileTail: every poll parses only the
+newline-terminated lines appended since the last one, and a truncated or
+replaced file (rotation) is read again from byte 0 with the header
+skipped, like fetch_reservations. A line still being written is left for
+a later poll, also right after a rotation. A follower can be seeded with
+reservations that were already loaded from the file's complete lines
+(see shared.tail.complete_end), so the file is not parsed twice.
+
+The follower keeps the parsed reservations and a RevenueCube current, so
+totals never need a rescan.
+"""
+
+import os
+import sys
+import time
+from typing import Any, Iterable, Iterator, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from shared.tail import FileTail
+
+from revenue_cube import RevenueCube
+from task_g_class import Reservation, convert_reservation
+
+
+class ReservationFollower:
+    def __init__(self, filename: str, reservations: Iterable[Any] = (), offset: int = 0,
+                 inode: Optional[int] = None):
+        """Starts after the first offset bytes of the file (whole lines), already loaded as reservations."""
+        self.filename = filename
+        self.tail = FileTail(filename, offset, inode)
+        self.reservations: List[Any] = list(reservations)
+        self.cube = RevenueCube(self.reservations)
+        self.resets = 0
+
+    def poll(self) -> List[Reservation]:
+        """Reads newly appended complete lines and returns the reservations parsed from them."""
+        lines = self.tail.poll()
+        if self.tail.resets != self.resets:
+            # The file was truncated or replaced and is being read from the start
+            self.reservations = []
+            self.cube = RevenueCube()
+            self.resets = self.tail.resets
+        new = []
+        for line in lines:
+            r = convert_reservation(line.split("|"))
+            if r:
+                new.append(r)
+                self.cube.add(r)
+        self.reservations.extend(new)
+        return new
+
+    def follow(self, interval: float = 1.0) -> Iterator[List[Reservation]]:
+        """Polls forever, yielding each non-empty batch of new reservations."""
+        while True:
+            new = self.poll()
+            if new:
+                yield new
+            time.sleep(interval)
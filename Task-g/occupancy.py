@@ -0,0 +1,126 @@
+"""
+Occupancy calendar: one bitset per resource per day.
+
+Each day is split into 15-minute slots (reservations start on quarter
+hours), so a day is a 96-bit integer where bit n means slot n is booked.
+Availability checks are a mask AND, and utilisation rollups are popcounts.
+
+Works with any reservation objects that have date, time, duration and
+resource attributes (task_g_class.Reservation, ReservationTable rows).
+Reservations can be added in bulk and added or removed one at a time;
+overlapping bookings are reference counted so removing one of them does
+not free a slot the other still holds.
+"""
+
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, Tuple
+
+SLOTS_PER_HOUR = 4
+SLOTS_PER_DAY = 24 * SLOTS_PER_HOUR
+FULL_DAY = (1 << SLOTS_PER_DAY) - 1
+
+
+def _slot(moment: datetime) -> int:
+    return (moment.hour * 60 + moment.minute) * SLOTS_PER_HOUR // 60
+
+
+def day_masks(start: datetime, end: datetime) -> Iterator[Tuple[int, int]]:
+    """Splits [start, end) into (day ordinal, slot mask) pairs, one per day touched."""
+    day = start.date()
+    while datetime.combine(day, datetime.min.time()) < end:
+        day_start = datetime.combine(day, datetime.min.time())
+        first = _slot(start) if start > day_start else 0
+        if end >= day_start + timedelta(days=1):
+            last = SLOTS_PER_DAY
+        else:
+            # Round a partially used last slot up so it counts as occupied
+            minutes = end.hour * 60 + end.minute
+            last = -(-minutes * SLOTS_PER_HOUR // 60)
+        if last > first:
+            yield day.toordinal(), ((1 << last) - 1) ^ ((1 << first) - 1)
+        day += timedelta(days=1)
+
+
+def _reservation_masks(r: Any) -> Iterator[Tuple[int, int]]:
+    start = datetime.combine(r.date, r.time)
+    return day_masks(start, start + timedelta(hours=r.duration))
+
+
+class OccupancyCalendar:
+    """Per-resource, per-day slot bitsets."""
+
+    def __init__(self, reservations: Iterable[Any] = ()):
+        self._days: Dict[str, Dict[int, int]] = defaultdict(dict)
+        # Extra bookings per (resource, day ordinal, slot) beyond the first
+        self._overlaps: Counter = Counter()
+        self.add_all(reservations)
+
+    def add_all(self, reservations: Iterable[Any]) -> None:
+        for r in reservations:
+            self.add(r)
+
+    def add(self, r: Any) -> None:
+        days = self._days[r.resource]
+        for ordinal, mask in _reservation_masks(r):
+            bits = days.get(ordinal, 0)
+            collision = bits & mask
+            while collision:
+                low = collision & -collision
+                self._overlaps[(r.resource, ordinal, low.bit_length() - 1)] += 1
+                collision ^= low
+            days[ordinal] = bits | mask
+
+    def remove(self, r: Any) -> None:
+        days = self._days.get(r.resource)
+        if days is None:
+            return
+        for ordinal, mask in _reservation_masks(r):
+            clear = mask
+            remaining = mask
+            while remaining:
+                low = remaining & -remaining
+                key = (r.resource, ordinal, low.bit_length() - 1)
+                if self._overlaps[key]:
+                    self._overlaps[key] -= 1
+                    if not self._overlaps[key]:
+                        del self._overlaps[key]
+                    clear ^= low
+                remaining ^= low
+            bits = days.get(ordinal, 0) & ~clear
+            if bits:
+                days[ordinal] = bits
+            else:
+                days.pop(ordinal, None)
+
+    def resources(self) -> list:
+        return sorted(resource for resource, days in self._days.items() if days)
+
+    def day_bits(self, resource: str, day: date) -> int:
+        return self._days.get(resource, {}).get(day.toordinal(), 0)
+
+    def is_free(self, resource: str, start: datetime, end: datetime) -> bool:
+        """True if the resource has no booking anywhere in [start, end)."""
+        days = self._days.get(resource, {})
+        return all(not days.get(ordinal, 0) & mask for ordinal, mask in day_masks(start, end))
+
+    def booked_hours(self, resource: str, first_day: date, last_day: date) -> float:
+        """Booked hours of a resource over the days [first_day, last_day]."""
+        days = self._days.get(resource, {})
+        slots = sum(days.get(n, 0).bit_count() for n in range(first_day.toordinal(), last_day.toordinal() + 1))
+        return slots / SLOTS_PER_HOUR
+
+    def utilisation(self, resource: str, first_day: date, last_day: date) -> float:
+        """Share of the hours in [first_day, last_day] that the resource is booked (0.0-1.0)."""
+        day_count = last_day.toordinal() - first_day.toordinal() + 1
+        if day_count <= 0:
+            return 0.0
+        return self.booked_hours(resource, first_day, last_day) / (24 * day_count)
+
+    def weekly_utilisation(self, resource: str) -> Dict[Tuple[int, int], float]:
+        """Utilisation of a resource per ISO (year, week) that has bookings."""
+        slots: Counter = Counter()
+        for ordinal, bits in self._days.get(resource, {}).items():
+            iso = date.fromordinal(ordinal).isocalendar()
+            slots[(iso.year, iso.week)] += bits.bit_count()
+        return {week: slots[week] / (7 * SLOTS_PER_DAY) for week in sorted(slots)}
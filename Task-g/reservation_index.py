@@ -0,0 +1,169 @@
+"""
+In-memory indexes over parsed reservations.
+
+Works with any reservation objects that have the attributes used by
+task_g_class.Reservation (date, time, duration, confirmed, resource),
+including ReservationTable rows.
+
+- hash indexes by resource and by confirmation status
+- a date-sorted index for date range lookups
+- one interval tree per resource over (start, start + duration)
+
+An overlap query reporting k intervals costs O(log n + k), and finding
+all double-bookings is a sweep over each resource's intervals instead of
+comparing every pair.
+"""
+
+import heapq
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Any, Iterable, Iterator, List, Sequence, Tuple
+
+
+def reservation_interval(r: Any) -> Tuple[datetime, datetime]:
+    """Start and end of a reservation as datetimes."""
+    start = datetime.combine(r.date, r.time)
+    return start, start + timedelta(hours=r.duration)
+
+
+class IntervalTree:
+    """
+    Static centered interval tree over half-open intervals [start, end).
+
+    Every node has a center point and holds the intervals that contain it,
+    once sorted by start and once by end (descending); intervals entirely
+    before the center go to the left subtree, entirely after it to the
+    right. The center is the median start of the node's intervals, so each
+    subtree holds at most half of them and the depth is O(log n).
+
+    An interval overlaps [start, end) exactly when it contains the point
+    start, or begins inside (start, end). The first set is a stabbing query
+    down one root-to-leaf path that stops scanning each node's list at the
+    first miss; the second is a slice of the intervals sorted by start. Both
+    report k intervals in O(log n + k).
+    """
+
+    def __init__(self, intervals: Iterable[Tuple[Any, Any, Any]]):
+        self._intervals = sorted(intervals, key=lambda interval: interval[0])
+        self._starts = [interval[0] for interval in self._intervals]
+        # Empty intervals contain no point; they are only found by their start
+        self._root = self._build([interval for interval in self._intervals if interval[0] < interval[1]])
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    @classmethod
+    def _build(cls, intervals: List[Tuple[Any, Any, Any]]) -> Any:
+        """A node (center, by start, by end descending, left, right) over intervals sorted by start."""
+        if not intervals:
+            return None
+        center = intervals[len(intervals) // 2][0]
+        before, here, after = [], [], []
+        for interval in intervals:
+            if interval[1] <= center:
+                before.append(interval)
+            elif interval[0] > center:
+                after.append(interval)
+            else:
+                here.append(interval)
+        by_end = sorted(here, key=lambda interval: interval[1], reverse=True)
+        return center, here, by_end, cls._build(before), cls._build(after)
+
+    def _containing(self, point: Any) -> Iterator[Tuple[Any, Any, Any]]:
+        node = self._root
+        while node is not None:
+            center, by_start, by_end, before, after = node
+            if point < center:
+                # All of them end after the center, so they contain point if they start by it
+                for interval in by_start:
+                    if interval[0] > point:
+                        break
+                    yield interval
+                node = before
+            else:
+                # All of them start at or before the center, so they contain point if they end after it
+                for interval in by_end:
+                    if interval[1] <= point:
+                        break
+                    yield interval
+                node = after
+
+    def overlapping(self, start: Any, end: Any) -> Iterator[Tuple[Any, Any, Any]]:
+        """Yields (start, end, item) for every stored interval overlapping [start, end)."""
+        for interval in self._containing(start):
+            if interval[0] < end:  # only fails for an empty or reversed query
+                yield interval
+        lo = bisect_right(self._starts, start)
+        hi = bisect_left(self._starts, end)
+        yield from self._intervals[lo:hi]
+
+
+class ReservationIndex:
+    """Hash, sorted and interval indexes over a list of reservations."""
+
+    def __init__(self, reservations: Sequence[Any]):
+        self.reservations = list(reservations)
+        self._by_resource = defaultdict(list)
+        self._by_status = defaultdict(list)
+        for r in self.reservations:
+            self._by_resource[r.resource].append(r)
+            self._by_status[bool(r.confirmed)].append(r)
+
+        by_date = sorted(self.reservations, key=lambda r: (r.date, r.time))
+        self._dates = [r.date for r in by_date]
+        self._by_date = by_date
+
+        self._trees = {
+            resource: IntervalTree((*reservation_interval(r), r) for r in items)
+            for resource, items in self._by_resource.items()
+        }
+
+    def resources(self) -> List[str]:
+        return sorted(self._by_resource)
+
+    def by_resource(self, resource: str) -> List[Any]:
+        return list(self._by_resource.get(resource, []))
+
+    def by_status(self, confirmed: bool) -> List[Any]:
+        return list(self._by_status.get(confirmed, []))
+
+    def between(self, start_date: date, end_date: date) -> List[Any]:
+        """Reservations dated within [start_date, end_date], in date and time order."""
+        lo = bisect_left(self._dates, start_date)
+        hi = bisect_right(self._dates, end_date)
+        return self._by_date[lo:hi]
+
+    def overlapping(self, resource: str, start: datetime, end: datetime) -> List[Any]:
+        """Reservations of a resource that overlap the slot [start, end)."""
+        tree = self._trees.get(resource)
+        if tree is None:
+            return []
+        return sorted((item for _, _, item in tree.overlapping(start, end)),
+                      key=lambda r: (r.date, r.time))
+
+    def is_free(self, resource: str, start: datetime, end: datetime) -> bool:
+        tree = self._trees.get(resource)
+        return tree is None or next(tree.overlapping(start, end), None) is None
+
+    def double_bookings(self, confirmed_only: bool = False) -> List[Tuple[Any, Any]]:
+        """
+        All pairs of reservations of the same resource whose slots overlap.
+
+        Each resource is swept in start order while a heap holds the end
+        times of still-running reservations, so the cost is O(n log n + k).
+        """
+        conflicts = []
+        for resource in self.resources():
+            items = self._by_resource[resource]
+            if confirmed_only:
+                items = [r for r in items if r.confirmed]
+            intervals = sorted(((*reservation_interval(r), n, r) for n, r in enumerate(items)),
+                               key=lambda interval: (interval[0], interval[2]))
+            active: List[Tuple[datetime, int, Any]] = []
+            for start, end, n, r in intervals:
+                while active and active[0][0] <= start:
+                    heapq.heappop(active)
+                conflicts.extend((other, r) for _, _, other in active)
+                heapq.heappush(active, (end, n, r))
+        return conflicts
@@ -0,0 +1,118 @@
+"""
+Materialised revenue cube over reservations.
+
+Counts, booked hours and revenue (duration * price) are kept per
+(resource, year-month, confirmed) cell, together with every roll-up of
+those three dimensions (ALL in place of any of them). Adding a
+reservation updates the 8 affected cells (changing its status only the 4
+that carry the status), and any slice or total is then a single
+dictionary lookup:
+
+    cube.get()                                   # everything
+    cube.get(confirmed=True).revenue             # task_c total_revenue
+    cube.get(resource="Red Room", month="2025-10")
+
+Works with reservation objects (task_g_class.Reservation, ReservationTable
+rows) through add(), and with Task-c style lists through add_row().
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from itertools import product
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+ALL = None
+
+CellKey = Tuple[Optional[str], Optional[str], Optional[bool]]
+
+
+@dataclass
+class Cell:
+    count: int = 0
+    hours: float = 0
+    revenue: float = 0.0
+
+
+def month_key(day: date) -> str:
+    return f"{day.year:04d}-{day.month:02d}"
+
+
+class RevenueCube:
+    """Counts, hours and revenue per (resource, year-month, confirmed) with all roll-ups."""
+
+    def __init__(self, reservations: Iterable[Any] = ()):
+        self._cells: Dict[CellKey, Cell] = {}
+        for r in reservations:
+            self.add(r)
+
+    @staticmethod
+    def _keys(resource: str, day: date, confirmed: bool) -> list:
+        base = (resource, month_key(day), bool(confirmed))
+        return [tuple(ALL if rolled else value for rolled, value in zip(mask, base))
+                for mask in product((False, True), repeat=3)]
+
+    def _apply(self, signs: Dict[CellKey, int], hours: float, price: float) -> None:
+        """Adds sign * (1, hours, revenue) to every cell, after checking no count goes negative."""
+        for key, sign in signs.items():
+            cell = self._cells.get(key)
+            if (cell.count if cell else 0) + sign < 0:
+                raise ValueError(f"no reservation to remove in cell {key}")
+        revenue = hours * price
+        for key, sign in signs.items():
+            cell = self._cells.get(key)
+            if cell is None:
+                cell = self._cells[key] = Cell()
+            cell.count += sign
+            cell.hours += sign * hours
+            cell.revenue += sign * revenue
+            if cell.count == 0:
+                del self._cells[key]
+
+    def _update(self, resource: str, day: date, hours: float, price: float,
+                confirmed: bool, sign: int) -> None:
+        self._apply(dict.fromkeys(self._keys(resource, day, confirmed), sign), hours, price)
+
+    def add(self, r: Any) -> None:
+        """Adds a reservation object (resource, date, duration, price, confirmed)."""
+        self._update(r.resource, r.date, r.duration, r.price, r.confirmed, 1)
+
+    def remove(self, r: Any) -> None:
+        """Removes a reservation added earlier; ValueError (cube unchanged) if its cell is empty."""
+        self._update(r.resource, r.date, r.duration, r.price, r.confirmed, -1)
+
+    def set_confirmed(self, r: Any, old: bool, new: bool) -> None:
+        """
+        Moves a reservation from status old to status new. r is only read
+        (its confirmed field is ignored), so read-only rows work too; the
+        caller updates its own copy of the status.
+        """
+        if bool(old) == bool(new):
+            return
+        signs = dict.fromkeys(self._keys(r.resource, r.date, old), -1)
+        for key in self._keys(r.resource, r.date, new):
+            signs[key] = signs.get(key, 0) + 1
+        # The roll-ups over the status cancel out; only the old and new status cells change
+        self._apply({key: sign for key, sign in signs.items() if sign}, r.duration, r.price)
+
+    def add_row(self, row: list) -> None:
+        """Adds a Task-c style converted row (list indexed as in convert_reservation_data)."""
+        self._update(row[9], row[4], row[6], row[7], row[8], 1)
+
+    def remove_row(self, row: list) -> None:
+        """Removes a row added earlier; ValueError (cube unchanged) if its cell is empty."""
+        self._update(row[9], row[4], row[6], row[7], row[8], -1)
+
+    def get(self, resource: Optional[str] = ALL, month: Optional[str] = ALL,
+            confirmed: Optional[bool] = ALL) -> Cell:
+        """The aggregate for one slice; pass ALL (None) to roll a dimension up."""
+        cell = self._cells.get((resource, month, confirmed))
+        return Cell(cell.count, cell.hours, cell.revenue) if cell else Cell()
+
+    def total_revenue(self, confirmed: Optional[bool] = ALL) -> float:
+        return self.get(confirmed=confirmed).revenue
+
+    def resources(self) -> list:
+        return sorted(key[0] for key in self._cells if key[0] is not ALL and key[1:] == (ALL, ALL))
+
+    def months(self) -> list:
+        return sorted(key[1] for key in self._cells if key[1] is not ALL and key[0] is ALL and key[2] is ALL)
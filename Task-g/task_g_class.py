@@ -1,7 +1,19 @@
-from datetime import datetime
+from array import array
+from datetime import date, datetime, time, timedelta
+from itertools import compress
+from operator import mul
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from shared.dates import decode_date, decode_iso_datetime, decode_time
+from shared.records import iter_records
+from shared.tail import complete_end
 
 class Reservation:
+    __slots__ = ("reservation_id", "name", "email", "phone", "date", "time",
+                 "duration", "price", "confirmed", "resource", "created")
+
     def __init__(self, reservation_id, name, email, phone,
                  date, time, duration, price,
                  confirmed, resource, created):
@@ -30,68 +42,234 @@ class Reservation:
         return f"{self.name}, {self.resource}, {self.date.strftime('%d.%m.%Y')}, {self.duration}h, {self.total_price():.2f}€"
 
 
-def convert_reservation(data: list[str]) -> Reservation | None:
-    """Convert a list of strings to a Reservation object."""
+class ReservationView:
+    """Lightweight read-only view of one row in a ReservationTable."""
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "ReservationTable", index: int):
+        self._table = table
+        self._index = index
+
+    reservation_id = property(lambda self: self._table.ids[self._index])
+    name = property(lambda self: self._table.names[self._index])
+    email = property(lambda self: self._table.emails[self._index])
+    phone = property(lambda self: self._table.phones[self._index])
+    date = property(lambda self: date.fromordinal(self._table.dates[self._index]))
+    time = property(lambda self: _minutes_to_time(self._table.times[self._index]))
+    duration = property(lambda self: self._table.durations[self._index])
+    price = property(lambda self: self._table.prices[self._index])
+    confirmed = property(lambda self: bool(self._table.confirmed[self._index]))
+    resource = property(lambda self: self._table.resources[self._index])
+    created = property(lambda self: _DATETIME_EPOCH + timedelta(seconds=self._table.created[self._index]))
+
+    is_confirmed = Reservation.is_confirmed
+    is_long = Reservation.is_long
+    total_price = Reservation.total_price
+    __str__ = Reservation.__str__
+
+
+_DATETIME_EPOCH = datetime(1, 1, 1)
+
+
+def _minutes_to_time(minutes: int) -> time:
+    return time(minutes // 60, minutes % 60)
+
+
+class ReservationTable:
+    """
+    Reservations stored column by column: numbers, dates and times in typed
+    arrays, text fields in lists (resource names are interned).
+    Indexing or iterating hands out ReservationView rows.
+    """
+
+    def __init__(self):
+        self.ids = array("q")
+        self.names: list[str] = []
+        self.emails: list[str] = []
+        self.phones: list[str] = []
+        self.dates = array("l")      # date ordinal
+        self.times = array("h")      # minutes since midnight
+        self.durations = array("l")  # hours
+        self.prices = array("d")
+        self.confirmed = array("b")
+        self.resources: list[str] = []
+        self.created = array("q")    # seconds since datetime(1, 1, 1)
+
+    @classmethod
+    def from_reservations(cls, reservations) -> "ReservationTable":
+        table = cls()
+        for r in reservations:
+            table.append(r)
+        return table
+
+    def append(self, r: Reservation) -> None:
+        self.append_fields(r.reservation_id, r.name, r.email, r.phone, r.date, r.time,
+                           r.duration, r.price, r.confirmed, r.resource, r.created)
+
+    def append_fields(self, reservation_id, name, email, phone, date, time,
+                      duration, price, confirmed, resource, created) -> None:
+        """Appends one reservation given as Reservation's constructor arguments."""
+        self.ids.append(reservation_id)
+        self.names.append(name)
+        self.emails.append(email)
+        self.phones.append(phone)
+        self.dates.append(date.toordinal())
+        self.times.append(time.hour * 60 + time.minute)
+        self.durations.append(duration)
+        self.prices.append(price)
+        self.confirmed.append(confirmed)
+        self.resources.append(sys.intern(resource))
+        self.created.append(int((created - _DATETIME_EPOCH).total_seconds()))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: int) -> ReservationView:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("reservation index out of range")
+        return ReservationView(self, index)
+
+    def __iter__(self):
+        return (ReservationView(self, i) for i in range(len(self)))
+
+    def confirmed_rows(self):
+        """Indices of confirmed reservations, from a scan of the confirmed column."""
+        return compress(range(len(self)), self.confirmed)
+
+    def long_rows(self):
+        """Indices of reservations of 3 hours or more, from a scan of the durations column."""
+        return (i for i, duration in enumerate(self.durations) if duration >= 3)
+
+    def total_revenue(self) -> float:
+        return sum(map(mul, self.durations, self.prices))
+
+
+def parse_fields(data: list[str]) -> tuple | None:
+    """Convert a list of strings to Reservation's constructor arguments."""
     if not data or all(not field.strip() for field in data):
         return None
     try:
-        return Reservation(
-            reservation_id=int(data[0].strip()),
-            name=data[1].strip(),
-            email=data[2].strip(),
-            phone=data[3].strip(),
-            date=datetime.strptime(data[4].strip(), "%Y-%m-%d").date(),
-            time=datetime.strptime(data[5].strip(), "%H:%M").time(),
-            duration=int(data[6].strip()),
-            price=float(data[7].strip()),
-            confirmed=data[8].strip().lower() == "true",
-            resource=data[9].strip(),
-            created=datetime.fromisoformat(data[10].strip())
+        return (
+            int(data[0].strip()),
+            data[1].strip(),
+            data[2].strip(),
+            data[3].strip(),
+            decode_date(data[4].strip()),
+            decode_time(data[5].strip()),
+            int(data[6].strip()),
+            float(data[7].strip()),
+            data[8].strip().lower() == "true",
+            data[9].strip(),
+            decode_iso_datetime(data[10].strip())
         )
     except (IndexError, ValueError) as e:
         print(f"Skipping invalid line: {data} ({e})")
         return None
 
 
-def fetch_reservations(filename: str) -> list[Reservation]:
-    """Read reservations from a file and return a list of Reservation objects."""
+def convert_reservation(data: list[str]) -> Reservation | None:
+    """Convert a list of strings to a Reservation object."""
+    fields = parse_fields(data)
+    return Reservation(*fields) if fields else None
+
+
+def fetch_reservations(filename: str, limit: int | None = None) -> list[Reservation]:
+    """Read reservations from a file (its first limit bytes) and return a list of Reservation objects."""
     reservations = []
     try:
-        with open(filename, "r", encoding="utf-8") as f:
-            header = next(f, None)  # skip header if present
-            for line in f:
-                parts = line.strip().split("|")
-                r = convert_reservation(parts)
-                if r:
-                    reservations.append(r)
+        records = iter_records(filename, limit=limit)
+        header = next(records, None)  # skip header if present
+        for parts in records:
+            r = convert_reservation(parts)
+            if r:
+                reservations.append(r)
     except FileNotFoundError:
         print(f"File not found: {filename}")
     return reservations
 
 
-def print_confirmed(reservations: list[Reservation]) -> None:
+def fetch_reservation_table(filename: str, limit: int | None = None) -> ReservationTable:
+    """Read reservations from a file (its first limit bytes) straight into a column-oriented ReservationTable."""
+    table = ReservationTable()
+    try:
+        records = iter_records(filename, limit=limit)
+        header = next(records, None)  # skip header if present
+        for parts in records:
+            fields = parse_fields(parts)
+            if fields:
+                table.append_fields(*fields)
+    except FileNotFoundError:
+        print(f"File not found: {filename}")
+    return table
+
+
+def print_confirmed(reservations: list[Reservation] | ReservationTable) -> None:
     print("Confirmed Reservations:")
+    if isinstance(reservations, ReservationTable):
+        t = reservations
+        for i in t.confirmed_rows():
+            print(f"- {t.names[i]}, {t.resources[i]}, {date.fromordinal(t.dates[i]).strftime('%d.%m.%Y')}")
+        return
     for r in reservations:
         if r.is_confirmed():
             print(f"- {r.name}, {r.resource}, {r.date.strftime('%d.%m.%Y')}")
 
 
-def print_long(reservations: list[Reservation]) -> None:
+def print_long(reservations: list[Reservation] | ReservationTable) -> None:
     print("\nLong Reservations (>= 3 hours):")
+    if isinstance(reservations, ReservationTable):
+        t = reservations
+        for i in t.long_rows():
+            print(f"- {t.names[i]}, {t.durations[i]}h, {t.resources[i]}")
+        return
     for r in reservations:
         if r.is_long():
             print(f"- {r.name}, {r.duration}h, {r.resource}")
 
 
-def total_revenue(reservations: list[Reservation]) -> float:
+def total_revenue(reservations: list[Reservation] | ReservationTable) -> float:
+    if isinstance(reservations, ReservationTable):
+        return reservations.total_revenue()
     return sum(r.total_price() for r in reservations)
 
 
-def main() -> None:
+def follow_reservations(filename: str, reservations: ReservationTable, offset: int, inode: int,
+                        interval: float = 1.0) -> None:
+    """
+    Keep watching the file and print reservations as they are appended.
+
+    The follower continues after the offset bytes (whole lines) that
+    reservations were read from, so the file is not parsed again.
+    """
+    from follow import ReservationFollower
+
+    follower = ReservationFollower(filename, reservations, offset, inode)
+    print(f"\nFollowing {filename} ({len(follower.reservations)} reservations loaded, Ctrl+C to stop)")
+    try:
+        for batch in follower.follow(interval):
+            for r in batch:
+                print(f"+ {r}")
+            print(f"Total Revenue: {follower.cube.total_revenue():.2f} €")
+    except KeyboardInterrupt:
+        pass
+
+
+def main(follow: bool = False, interval: float = 1.0) -> None:
     # Look for reservations.txt in the same folder as this script
     filename = os.path.join(os.path.dirname(__file__), "reservations.txt")
-    
-    reservations = fetch_reservations(filename)
+
+    try:
+        stat = os.stat(filename)
+    except FileNotFoundError:
+        stat = None
+    limit = None
+    if stat and follow:
+        # Only whole lines: the writer may still be in the middle of the last one.
+        # The follower continues from exactly there.
+        limit = complete_end(filename, stat.st_size)
+    reservations = fetch_reservation_table(filename, limit)
     if not reservations:
         print("No valid reservations found.")
         return
@@ -101,6 +279,15 @@ def main() -> None:
     revenue = total_revenue(reservations)
     print(f"\nTotal Revenue: {revenue:.2f} €")
 
+    if follow:
+        follow_reservations(filename, reservations, limit, stat.st_ino, interval)
+
 
 if __name__ == "__main__":
-    main()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Reservation report")
+    parser.add_argument("--follow", action="store_true", help="keep watching reservations.txt for appended lines")
+    parser.add_argument("--interval", type=float, default=1.0, help="seconds between polls in follow mode")
+    args = parser.parse_args()
+    main(args.follow, args.interval)
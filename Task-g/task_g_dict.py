@@ -1,5 +1,9 @@
-from datetime import datetime
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from shared.dates import decode_date, decode_iso_datetime, decode_time
+from shared.records import iter_records
 
 def convert_reservation(data: list[str]) -> dict | None:
     """Convert a list of strings into a reservation dictionary."""
@@ -11,13 +15,13 @@ def convert_reservation(data: list[str]) -> dict | None:
             "name": data[1].strip(),
             "email": data[2].strip(),
             "phone": data[3].strip(),
-            "date": datetime.strptime(data[4].strip(), "%Y-%m-%d").date(),
-            "time": datetime.strptime(data[5].strip(), "%H:%M").time(),
+            "date": decode_date(data[4].strip()),
+            "time": decode_time(data[5].strip()),
             "duration": int(data[6].strip()),
             "price": float(data[7].strip()),
             "confirmed": data[8].strip().lower() == "true",
             "resource": data[9].strip(),
-            "created": datetime.fromisoformat(data[10].strip())
+            "created": decode_iso_datetime(data[10].strip())
         }
     except (IndexError, ValueError) as e:
         print(f"Skipping invalid line: {data} ({e})")
@@ -27,13 +31,12 @@ def fetch_reservations(filename: str) -> list[dict]:
     """Read reservations from a file and return a list of dictionaries."""
     reservations = []
     try:
-        with open(filename, "r", encoding="utf-8") as f:
-            header = next(f, None)  # skip header if present
-            for line in f:
-                parts = line.strip().split("|")
-                r = convert_reservation(parts)
-                if r:
-                    reservations.append(r)
+        records = iter_records(filename)
+        header = next(records, None)  # skip header if present
+        for parts in records:
+            r = convert_reservation(parts)
+            if r:
+                reservations.append(r)
     except FileNotFoundError:
         print(f"File not found: {filename}")
     return reservations
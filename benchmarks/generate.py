@@ -0,0 +1,168 @@
+# Copyright (c) 2026 Shaidul Islam
+# License: MIT
+
+"""
+Synthetic data generator for the benchmarks.
+
+Writes files in the same layouts the tasks read:
+
+- reservations.txt   pipe-delimited, 11 fields (Task-c, Task-g)
+- reservation_a.txt  pipe-delimited single reservation (Task-a)
+- phases.csv         semicolon CSV, per-phase Wh (Task-d, Task-e)
+- net.csv            semicolon CSV, net kWh with +02:00/+03:00 offsets (Task-f)
+- fleet/site-NNN.csv one net.csv-style file per site (Task-f fleet.py), with --sites
+
+Usage:
+    python benchmarks/generate.py --reservations 1000000 --years 10 --out /tmp/bench-data
+"""
+
+import argparse
+import math
+import os
+import random
+from datetime import date, datetime, timedelta
+from typing import Iterator, Tuple
+
+FIRST_NAMES = ["Moomin", "Snork", "Little", "Sniff", "Hemulen", "Snufkin", "Mymble", "Toffle", "Fillyjonk", "Groke"]
+LAST_NAMES = ["Valley", "Maiden", "My", "Moneywise", "Collector", "Wanderer", "Storm", "Gardener", "Baker", "North"]
+RESOURCES = ["Forest Area 1", "Flower Room", "Red Room", "Storage Area N", "Botanical Lab",
+             "Meeting Room A", "Meeting Room B", "Sauna", "Boat House", "Library"]
+
+PHASE_HEADER = ("Time;Consumption phase 1 Wh;Consumption phase 2 Wh;Consumption phase 3 Wh;"
+                "Production phase 1 Wh;Production phase 2 Wh;Production phase 3 Wh")
+NET_HEADER = "Time; Consumption (net) kWh; Production (net) kWh; Daily average temperature"
+
+
+def reservation_lines(count: int, seed: int = 1, start_id: int = 1) -> Iterator[str]:
+    """Yields reservation lines in the Task-c/Task-g layout."""
+    rng = random.Random(seed)
+    first_day = date(2025, 1, 1).toordinal()
+    for n in range(count):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        day = date.fromordinal(first_day + rng.randrange(730))
+        created = datetime.combine(day, datetime.min.time()) - timedelta(seconds=rng.randrange(90 * 86400))
+        yield "|".join([
+            str(start_id + n),
+            f"{first} {last}",
+            f"{first.lower()}.{last.lower()}{n}@example.com",
+            f"04{rng.randrange(10**8):08d}",
+            day.isoformat(),
+            f"{rng.randrange(7, 21):02d}:{rng.choice((0, 15, 30, 45)):02d}",
+            str(rng.randint(1, 6)),
+            f"{rng.randrange(900, 5000) / 100:.2f}",
+            str(rng.random() < 0.6),
+            rng.choice(RESOURCES),
+            created.strftime("%Y-%m-%d %H:%M:%S"),
+        ])
+
+
+def task_a_line(seed: int = 1) -> str:
+    """One reservation in the Task-a layout."""
+    rng = random.Random(seed)
+    return "|".join([
+        str(rng.randrange(100, 1000)), "Anna Virtanen", "2025-10-31", "10:00", "2", "19.95",
+        "True", rng.choice(RESOURCES), "0401234567", "anna.virtanen@example.com",
+    ])
+
+
+def _consumption(rng: random.Random, hour: int) -> float:
+    """Hourly consumption shape in kWh: low at night, peaks morning and evening."""
+    base = 0.5 + 0.4 * math.exp(-((hour - 8) ** 2) / 6) + 0.8 * math.exp(-((hour - 19) ** 2) / 8)
+    return base * rng.uniform(0.6, 1.6)
+
+
+def _production(rng: random.Random, day: date, hour: int) -> float:
+    """Solar production in kWh: zero at night and in deep winter."""
+    season = math.sin(math.pi * (day.timetuple().tm_yday - 80) / 365)
+    if season <= 0.05 or not 6 <= hour <= 20:
+        return 0.0
+    return max(0.0, season * 3.0 * math.sin(math.pi * (hour - 6) / 14) * rng.uniform(0.2, 1.0))
+
+
+def phase_lines(start: date, hours: int, seed: int = 1) -> Iterator[str]:
+    """Yields Task-d/Task-e rows (no offset, Wh per phase) for consecutive hours."""
+    rng = random.Random(seed)
+    ts = datetime.combine(start, datetime.min.time())
+    for _ in range(hours):
+        cons = [round(_consumption(rng, ts.hour) * 1000 * share) for share in (0.6, 0.25, 0.15)]
+        prod = [round(_production(rng, ts.date(), ts.hour) * 1000 / 3) for _ in range(3)]
+        yield ts.strftime("%Y-%m-%dT%H:%M:%S") + ";" + ";".join(str(v) for v in cons + prod)
+        ts += timedelta(hours=1)
+
+
+def _last_sunday(year: int, month: int) -> date:
+    day = date(year, month + 1, 1) - timedelta(days=1)
+    return day - timedelta(days=(day.weekday() + 1) % 7)
+
+
+def _local_hours(first_year: int, years: int) -> Iterator[Tuple[datetime, int]]:
+    """Local wall-clock hours with their UTC offset (EET/EEST)."""
+    utc = datetime(first_year, 1, 1) - timedelta(hours=2)
+    end = datetime(first_year + years, 1, 1) - timedelta(hours=2)
+    while utc < end:
+        summer_start = datetime.combine(_last_sunday(utc.year, 3), datetime.min.time()) + timedelta(hours=1)
+        summer_end = datetime.combine(_last_sunday(utc.year, 10), datetime.min.time()) + timedelta(hours=1)
+        offset = 3 if summer_start <= utc < summer_end else 2
+        yield utc + timedelta(hours=offset), offset
+        utc += timedelta(hours=1)
+
+
+def net_lines(first_year: int, years: int, seed: int = 1) -> Iterator[str]:
+    """Yields Task-f rows (net kWh with decimal commas and UTC offsets)."""
+    rng = random.Random(seed)
+    temperature = 0.0
+    for local, offset in _local_hours(first_year, years):
+        if local.hour == 0 or temperature == 0.0:
+            season = -math.cos(2 * math.pi * (local.timetuple().tm_yday - 15) / 365)
+            temperature = round(5 + 14 * season + rng.uniform(-4, 4), 1)
+        values = [_consumption(rng, local.hour) * 1.8, _production(rng, local.date(), local.hour)]
+        fields = [f"{v:.3f}".replace(".", ",") for v in values] + [f"{temperature}".replace(".", ",")]
+        yield f"{local.strftime('%Y-%m-%dT%H:%M:%S')}.000+0{offset}:00;" + ";".join(fields)
+
+
+def write_lines(path: str, lines: Iterator[str], header: str = "") -> str:
+    with open(path, "w", encoding="utf-8") as file:
+        if header:
+            file.write(header + "\n")
+        for line in lines:
+            file.write(line + "\n")
+    return path
+
+
+def generate_fleet(out_dir: str, sites: int, years: int, seed: int = 1) -> str:
+    """Writes one Task-f CSV per site into out_dir/fleet and returns the directory."""
+    fleet_dir = os.path.join(out_dir, "fleet")
+    os.makedirs(fleet_dir, exist_ok=True)
+    for site in range(sites):
+        write_lines(os.path.join(fleet_dir, f"site-{site:04d}.csv"),
+                    net_lines(2025, years, seed + site), NET_HEADER)
+    return fleet_dir
+
+
+def generate(out_dir: str, reservations: int, years: int, seed: int = 1, sites: int = 0) -> dict:
+    """Writes every dataset into out_dir and returns their paths."""
+    os.makedirs(out_dir, exist_ok=True)
+    hours = (date(2025 + years, 1, 1) - date(2025, 1, 1)).days * 24
+    paths = {
+        "reservations": write_lines(os.path.join(out_dir, "reservations.txt"),
+                                    reservation_lines(reservations, seed)),
+        "reservation_a": write_lines(os.path.join(out_dir, "reservation_a.txt"), iter([task_a_line(seed)])),
+        "phases": write_lines(os.path.join(out_dir, "phases.csv"),
+                              phase_lines(date(2025, 1, 1), hours, seed), PHASE_HEADER),
+        "net": write_lines(os.path.join(out_dir, "net.csv"), net_lines(2025, years, seed), NET_HEADER),
+    }
+    if sites:
+        paths["fleet"] = generate_fleet(out_dir, sites, years, seed)
+    return paths
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate synthetic benchmark data")
+    parser.add_argument("--out", default="bench-data", help="output directory")
+    parser.add_argument("--reservations", type=int, default=100_000, help="number of reservations")
+    parser.add_argument("--years", type=int, default=1, help="years of hourly meter data")
+    parser.add_argument("--sites", type=int, default=0, help="also write this many per-site fleet files")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    for name, path in generate(args.out, args.reservations, args.years, args.seed, args.sites).items():
+        print(f"{name:<14} {path}")
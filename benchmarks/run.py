@@ -0,0 +1,272 @@
+# Copyright (c) 2026 Shaidul Islam
+# License: MIT
+
+"""
+Benchmark harness for the task loaders and reports.
+
+Generates synthetic data (see generate.py), then times the parse, aggregate
+and format stages of every task's entry points separately and prints wall
+time, throughput and peak memory per stage. Peak memory is measured with
+tracemalloc in a second run of each stage, so it does not skew the timings.
+
+Usage:
+    python benchmarks/run.py --reservations 1000000 --years 10
+    python benchmarks/run.py --save-baseline baseline.json
+    python benchmarks/run.py --compare baseline.json --threshold 0.2
+    python benchmarks/run.py --only fleet --sites 256 --workers 1 2 4 8
+
+With --compare the exit status is 1 when any stage is slower than the
+baseline by more than the threshold.
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple
+
+from generate import generate
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+
+
+class Result(NamedTuple):
+    task: str
+    stage: str
+    rows: int
+    seconds: float
+    peak_bytes: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.task}/{self.stage}"
+
+
+def load_module(task_dir: str, filename: str, name: str):
+    """Imports a task script by path; its own directory is put on sys.path for sibling imports."""
+    directory = os.path.join(ROOT, task_dir)
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+    spec = importlib.util.spec_from_file_location(name, os.path.join(directory, filename))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def measure(func: Callable[[], Any], with_memory: bool = True, repeat: int = 1) -> Tuple[Any, float, int]:
+    """Runs func, returning its result, best wall time of `repeat` runs and (optionally) peak traced memory."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        seconds = float("inf")
+        for _ in range(max(1, repeat)):
+            start = time.perf_counter()
+            value = func()
+            seconds = min(seconds, time.perf_counter() - start)
+        peak = 0
+        if with_memory:
+            tracemalloc.start()
+            func()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+    return value, seconds, peak
+
+
+class Suite:
+    def __init__(self, with_memory: bool, repeat: int = 1):
+        self.with_memory = with_memory
+        self.repeat = repeat
+        self.results: List[Result] = []
+
+    def stage(self, task: str, stage: str, rows: int, func: Callable[[], Any]) -> Any:
+        value, seconds, peak = measure(func, self.with_memory, self.repeat)
+        self.results.append(Result(task, stage, rows, seconds, peak))
+        return value
+
+
+def count_lines(path: str, header: bool = False) -> int:
+    with open(path, "rb") as file:
+        return sum(1 for _ in file) - (1 if header else 0)
+
+
+def bench_task_a(suite: Suite, paths: Dict[str, str]) -> None:
+    task_a = load_module("Task-a", "task_a.py", "bench_task_a")
+    with tempfile.TemporaryDirectory() as work:
+        with open(paths["reservation_a"], encoding="utf-8") as src, \
+                open(os.path.join(work, "reservations.txt"), "w", encoding="utf-8") as dst:
+            dst.write(src.read())
+        cwd = os.getcwd()
+        os.chdir(work)
+        try:
+            suite.stage("task_a", "main", 1, task_a.main)
+        finally:
+            os.chdir(cwd)
+
+
+def bench_task_c(suite: Suite, paths: Dict[str, str]) -> None:
+    task_c = load_module("Task-c", "task_c.py", "bench_task_c")
+    task_c.FILE_PATH = paths["reservations"]
+    rows = count_lines(paths["reservations"])
+    reservations = suite.stage("task_c", "parse", rows, task_c.read_reservations)
+
+    def report() -> None:
+        task_c.confirmed_reservations(reservations)
+        task_c.long_reservations(reservations)
+        task_c.confirmation_statuses(reservations)
+        task_c.confirmation_summary(reservations)
+        task_c.total_revenue(reservations)
+
+    suite.stage("task_c", "report", rows, report)
+
+
+def bench_task_g(suite: Suite, paths: Dict[str, str]) -> None:
+    rows = count_lines(paths["reservations"])
+    for label, filename in (("task_g_class", "task_g_class.py"), ("task_g_dict", "task_g_dict.py")):
+        module = load_module("Task-g", filename, f"bench_{label}")
+        reservations = suite.stage(label, "parse", rows, lambda: module.fetch_reservations(paths["reservations"]))
+        suite.stage(label, "aggregate", rows, lambda: module.total_revenue(reservations))
+        suite.stage(label, "format", rows, lambda: (module.print_confirmed(reservations),
+                                                    module.print_long(reservations)))
+        if hasattr(module, "ReservationTable"):
+            table = suite.stage(label, "table_build", rows,
+                                lambda: module.ReservationTable.from_reservations(reservations))
+            suite.stage(label, "table_aggregate", rows, lambda: module.total_revenue(table))
+            suite.stage(label, "table_format", rows, lambda: (module.print_confirmed(table),
+                                                              module.print_long(table)))
+
+
+def bench_task_d(suite: Suite, paths: Dict[str, str]) -> None:
+    task_d = load_module("Task-d", "task_d.py", "bench_task_d")
+    rows = count_lines(paths["phases"], header=True)
+    records = suite.stage("task_d", "parse", rows, lambda: task_d.read_csv_data(paths["phases"]))
+    totals = suite.stage("task_d", "aggregate", rows, lambda: task_d.calculate_daily_totals(records))
+    suite.stage("task_d", "format", len(totals), lambda: task_d.display_report(totals))
+    suite.stage("task_d", "stream", rows,
+                lambda: task_d.calculate_daily_totals(task_d.iter_csv_data(paths["phases"])))
+
+
+def bench_task_e(suite: Suite, paths: Dict[str, str]) -> None:
+    task_e = load_module("Task-e", "task_e.py", "bench_task_e")
+    rows = count_lines(paths["phases"], header=True)
+    data = suite.stage("task_e", "parse", rows, lambda: task_e.read_data(paths["phases"]))
+    summary = suite.stage("task_e", "aggregate", rows, lambda: task_e.calculate_daily_summary(data))
+    suite.stage("task_e", "format", len(summary), lambda: task_e.format_week_section(0, summary))
+
+
+def bench_task_f(suite: Suite, paths: Dict[str, str]) -> None:
+    task_f = load_module("Task-f", "task_f.py", "bench_task_f")
+    rows = count_lines(paths["net"], header=True)
+    data = suite.stage("task_f", "parse", rows, lambda: task_f.read_data(paths["net"]))
+    index = suite.stage("task_f", "index", rows, lambda: task_f.RangeIndex(data))
+    datasets = [("dict", data), ("index", index)]
+    if task_f.HAS_NUMPY:
+        columns = suite.stage("task_f", "parse_columns", rows, lambda: task_f.read_columns(paths["net"]))
+        datasets.append(("columns", columns))
+
+    first, last = data[0]["time"].date(), data[-1]["time"].date()
+    days = [date.fromordinal(n) for n in range(first.toordinal(), last.toordinal() + 1, 7)]
+    for label, dataset in datasets:
+        def queries() -> None:
+            for day in days:
+                task_f.range_totals(dataset, day, day)
+            for month in range(1, 13):
+                task_f.month_totals(dataset, month)
+        suite.stage("task_f", f"query_{label}", len(days) + 12, queries)
+    suite.stage("task_f", "format", rows, lambda: task_f.create_yearly_report(index))
+
+
+def bench_fleet(suite: Suite, paths: Dict[str, str]) -> None:
+    """Times Task-f's fleet driver over the per-site files once per worker count."""
+    if "fleet" not in paths:
+        return
+    # Registered as "fleet" so worker processes can unpickle its functions
+    fleet = load_module("Task-f", "fleet.py", "fleet")
+    files = [path for _, path in fleet.find_sites(paths["fleet"])]
+    rows = sum(count_lines(path, header=True) for path in files)
+    for workers in FLEET_WORKERS:
+        suite.stage("fleet", f"workers_{workers}", rows, lambda: fleet.build_fleet(paths["fleet"], workers))
+
+
+# Worker counts timed by bench_fleet; --workers overrides
+FLEET_WORKERS = [1, 2, 4, 8]
+
+BENCHES = {
+    "task_a": bench_task_a,
+    "task_c": bench_task_c,
+    "task_g": bench_task_g,
+    "task_d": bench_task_d,
+    "task_e": bench_task_e,
+    "task_f": bench_task_f,
+    "fleet": bench_fleet,
+}
+
+
+def print_results(results: List[Result], baseline: Dict[str, float], threshold: float) -> List[Result]:
+    """Prints the result table and returns the stages that regressed against the baseline."""
+    regressions = []
+    print(f"{'stage':<32} {'rows':>10} {'time [s]':>10} {'rows/s':>12} {'peak [MB]':>10}  baseline")
+    print("-" * 90)
+    for result in results:
+        rate = result.rows / result.seconds if result.seconds else float("inf")
+        note = ""
+        if result.key in baseline and baseline[result.key] > 0:
+            ratio = result.seconds / baseline[result.key]
+            note = f"{ratio:5.2f}x"
+            if ratio > 1 + threshold:
+                note += "  REGRESSION"
+                regressions.append(result)
+        print(f"{result.key:<32} {result.rows:>10} {result.seconds:>10.4f} {rate:>12,.0f} "
+              f"{result.peak_bytes / 1e6:>10.1f}  {note}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the task loaders and reports")
+    parser.add_argument("--reservations", type=int, default=100_000, help="number of synthetic reservations")
+    parser.add_argument("--years", type=int, default=1, help="years of synthetic hourly data")
+    parser.add_argument("--sites", type=int, default=32, help="per-site files for the fleet benchmark (0 skips it)")
+    parser.add_argument("--workers", type=int, nargs="+", default=FLEET_WORKERS,
+                        help="worker counts timed by the fleet benchmark (default 1 2 4 8)")
+    parser.add_argument("--data", help="directory for generated data (default: a temporary directory)")
+    parser.add_argument("--only", nargs="*", choices=sorted(BENCHES), help="run only these tasks")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per stage, best is kept (default 3)")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc peak memory runs")
+    parser.add_argument("--save-baseline", metavar="FILE", help="write stage timings to FILE")
+    parser.add_argument("--compare", metavar="FILE", help="compare stage timings with a saved baseline")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="relative slowdown that counts as a regression (default 0.2)")
+    args = parser.parse_args()
+    FLEET_WORKERS[:] = args.workers
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = args.data or tmp
+        sites = args.sites if not args.only or "fleet" in args.only else 0
+        paths = generate(data_dir, args.reservations, args.years, sites=sites)
+        suite = Suite(with_memory=not args.no_memory, repeat=args.repeat)
+        for name in args.only or BENCHES:
+            BENCHES[name](suite, paths)
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+    regressions = print_results(suite.results, baseline, args.threshold)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as file:
+            json.dump({result.key: result.seconds for result in suite.results}, file, indent=2)
+        print(f"Baseline written to {args.save_baseline}")
+    if regressions:
+        print(f"{len(regressions)} stage(s) regressed by more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Helpers shared by the task scripts: timestamp decoding and record readers."""
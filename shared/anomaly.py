@@ -0,0 +1,153 @@
+# Copyright (c) 2026 Shaidul Islam
+# License: MIT
+
+"""
+Streaming anomaly detection for hourly meter series.
+
+Every hour is compared with the same hour of day over the previous four
+weeks (28 samples). If it lies more than three standard deviations from
+their mean, it is flagged:
+
+    detector = AnomalyDetector(weeks=4, threshold=3.0)
+    for when, value in series:
+        anomaly = detector.add(when, value)
+        if anomaly:
+            print(anomaly)
+
+Each hour-of-day slot keeps a fixed-size ring buffer with a rolling sum
+and sum of squares. A sample is therefore O(1) work: one comparison, then
+one value in and one out. Rounding drift in the rolling sums is removed
+by recomputing them from the buffer once per full turn, which adds O(1)
+amortised.
+
+Use season="week" to compare with the same hour of the same weekday
+instead (168 slots of `weeks` samples each). The window is the last N
+samples of a slot, which is the previous N days or weeks when the series
+has no gaps. A slot is only judged once its buffer is full.
+
+FleetDetector keeps one detector per meter id, for many meters fed from
+one stream.
+"""
+
+from array import array
+from datetime import datetime
+from typing import Dict, Hashable, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+SEASONS = ("day", "week")
+
+
+class Anomaly(NamedTuple):
+    time: datetime
+    value: float
+    mean: float       # baseline mean of the slot
+    std: float        # baseline standard deviation of the slot
+    z: float          # (value - mean) / std
+    meter: Optional[Hashable] = None
+
+
+class RollingWindow:
+    """Fixed-size ring buffer with O(1) rolling mean and standard deviation."""
+
+    __slots__ = ("values", "size", "count", "position", "total", "squares")
+
+    def __init__(self, size: int) -> None:
+        self.values = array("d", bytes(8 * size))
+        self.size = size
+        self.count = 0
+        self.position = 0
+        self.total = 0.0
+        self.squares = 0.0
+
+    def push(self, value: float) -> None:
+        old = self.values[self.position]
+        self.values[self.position] = value
+        self.position += 1
+        if self.count < self.size:
+            self.count += 1
+            self.total += value
+            self.squares += value * value
+        else:
+            self.total += value - old
+            self.squares += value * value - old * old
+        if self.position == self.size:
+            self.position = 0
+            # Once per turn: drop the rounding drift of the rolling sums
+            self.total = sum(self.values)
+            self.squares = sum(v * v for v in self.values)
+
+    @property
+    def full(self) -> bool:
+        return self.count == self.size
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def std(self) -> float:
+        """Sample standard deviation of the window."""
+        if self.count < 2:
+            return 0.0
+        variance = (self.squares - self.total * self.total / self.count) / (self.count - 1)
+        return variance ** 0.5 if variance > 0 else 0.0
+
+
+class AnomalyDetector:
+    """Flags samples far from the rolling baseline of their hour-of-day (or hour-of-week) slot."""
+
+    def __init__(self, weeks: int = 4, threshold: float = 3.0, season: str = "day",
+                 min_std: float = 1e-6, meter: Optional[Hashable] = None) -> None:
+        if season not in SEASONS:
+            raise ValueError(f"season must be one of {SEASONS}, not {season!r}")
+        self.threshold = threshold
+        self.season = season
+        # A flat baseline (std 0) still flags any change larger than this
+        self.min_std = min_std
+        self.meter = meter
+        slots, size = (24, weeks * 7) if season == "day" else (168, weeks)
+        self.windows = [RollingWindow(size) for _ in range(slots)]
+        self.samples = 0
+        self.flagged = 0
+
+    def add(self, when: datetime, value: float) -> Optional[Anomaly]:
+        """Judges one sample against its slot's baseline, then adds it to the baseline."""
+        slot = when.hour if self.season == "day" else when.weekday() * 24 + when.hour
+        window = self.windows[slot]
+        self.samples += 1
+        anomaly = None
+        if window.full:
+            mean = window.total / window.count
+            std = max(window.std(), self.min_std)
+            z = (value - mean) / std
+            if z > self.threshold or z < -self.threshold:
+                anomaly = Anomaly(when, value, mean, std, z, self.meter)
+                self.flagged += 1
+        window.push(value)
+        return anomaly
+
+    def run(self, samples: Iterable[Tuple[datetime, float]]) -> Iterator[Anomaly]:
+        """Feeds (time, value) samples and yields the flagged ones."""
+        add = self.add
+        for when, value in samples:
+            anomaly = add(when, value)
+            if anomaly is not None:
+                yield anomaly
+
+
+class FleetDetector:
+    """One AnomalyDetector per meter id, created on the meter's first sample."""
+
+    def __init__(self, **options) -> None:
+        self.options = options
+        self.detectors: Dict[Hashable, AnomalyDetector] = {}
+
+    def add(self, meter: Hashable, when: datetime, value: float) -> Optional[Anomaly]:
+        detector = self.detectors.get(meter)
+        if detector is None:
+            detector = self.detectors[meter] = AnomalyDetector(meter=meter, **self.options)
+        return detector.add(when, value)
+
+    def run(self, samples: Iterable[Tuple[Hashable, datetime, float]]) -> Iterator[Anomaly]:
+        """Feeds (meter, time, value) samples and yields the flagged ones."""
+        for meter, when, value in samples:
+            anomaly = self.add(meter, when, value)
+            if anomaly is not None:
+                yield anomaly
@@ -0,0 +1,531 @@
+# Copyright (c) 2026 Shaidul Islam
+# License: MIT
+
+"""
+Compact archive format for the hourly meter CSVs.
+
+Converts the semicolon separated exports read by Task-d, Task-e and
+Task-f (a timestamp column followed by decimal columns) into a binary
+archive and back, using only the standard library:
+
+    csv_to_archive("2025.csv", "2025.ema")
+    archive_to_csv("2025.ema", "2025.csv")
+
+Rows are stored in blocks of one ISO week (Monday to Sunday, local time).
+Every block holds one integer stream for the timestamps, one for the UTC
+offsets and one per column:
+
+- timestamps are local wall-clock seconds, delta encoded, so an hourly
+  series becomes a single run of 3600s
+- values are fixed-point integers: "1,303" with three decimals is 1303,
+  so they come back exactly
+- every stream is run-length encoded as zigzag varints, which folds the
+  zero production at night and in winter and the repeated daily
+  temperature into a few bytes; a column is delta encoded as well when
+  that is shorter
+- the block is then compressed with zlib
+
+Block summaries (first and last timestamp, and per column min, max and
+sum) are kept in a directory at the end of the file. range_stats() uses
+them for every block fully inside the range and decodes only the blocks
+at its edges.
+
+open_lines() yields an archive's CSV text lines, so the existing CSV
+readers (csv.DictReader, Task-f's line parser) read archives unchanged.
+Each column must use one number of decimals throughout, as meter exports
+do, for the text to round-trip byte for byte (a "-0,0" comes back as
+"0,0").
+
+From the command line:
+
+    python -m shared.archive pack 2025.csv 2025.ema
+    python -m shared.archive unpack 2025.ema 2025.csv
+
+Layout:
+    b"EMA1" | varint n | n bytes header JSON | blocks |
+    directory | uint64 directory offset | b"EMA1"
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import struct
+import zlib
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from shared.resample import Stats
+from shared.timestamps import parse_local, parse_offset
+
+MAGIC = b"EMA1"
+VERSION = 1
+TRAILER = struct.Struct("<Q4s")
+
+EPOCH = datetime(1970, 1, 1)
+EPOCH_ORDINAL = EPOCH.toordinal()
+SECONDS_PER_DAY = 86400
+DAYS_PER_BLOCK = 7
+
+# Shortest repeat worth a run token instead of literals
+MIN_RUN = 3
+
+# Column stream encodings
+RAW = 0
+DELTA = 1
+
+
+# ---------- integer streams ----------
+
+def _put_varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _put_signed(out: bytearray, value: int) -> None:
+    _put_varint(out, value << 1 if value >= 0 else (-value << 1) - 1)
+
+
+def _get_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _get_signed(data: bytes, pos: int) -> Tuple[int, int]:
+    value, pos = _get_varint(data, pos)
+    return (value >> 1) ^ -(value & 1), pos
+
+
+def encode_runs(values: Sequence[int]) -> bytes:
+    """
+    Run-length encodes integers. Each token starts with (n << 1) | kind:
+    kind 1 is a run of n copies of the value that follows, kind 0 is n
+    literal values.
+    """
+    out = bytearray()
+    literals: List[int] = []
+
+    def flush() -> None:
+        if literals:
+            _put_varint(out, len(literals) << 1)
+            for literal in literals:
+                _put_signed(out, literal)
+            literals.clear()
+
+    i, count = 0, len(values)
+    while i < count:
+        value = values[i]
+        end = i + 1
+        while end < count and values[end] == value:
+            end += 1
+        if end - i >= MIN_RUN:
+            flush()
+            _put_varint(out, ((end - i) << 1) | 1)
+            _put_signed(out, value)
+        else:
+            literals.extend(values[i:end])
+        i = end
+    flush()
+    return bytes(out)
+
+
+def decode_runs(data: bytes, pos: int = 0, end: Optional[int] = None) -> List[int]:
+    """Inverse of encode_runs over data[pos:end]."""
+    end = len(data) if end is None else end
+    values: List[int] = []
+    while pos < end:
+        token, pos = _get_varint(data, pos)
+        count = token >> 1
+        if token & 1:
+            value, pos = _get_signed(data, pos)
+            values.extend([value] * count)
+        else:
+            for _ in range(count):
+                value, pos = _get_signed(data, pos)
+                values.append(value)
+    return values
+
+
+def _deltas(values: Sequence[int]) -> List[int]:
+    previous = 0
+    out = []
+    for value in values:
+        out.append(value - previous)
+        previous = value
+    return out
+
+
+def _undelta(deltas: Sequence[int]) -> List[int]:
+    total = 0
+    out = []
+    for delta in deltas:
+        total += delta
+        out.append(total)
+    return out
+
+
+# ---------- text fields ----------
+
+def _parse_fixed(text: str, decimal: str, scale: int) -> int:
+    text = text.strip()
+    negative = text.startswith("-")
+    whole, _, fraction = text.lstrip("+-").partition(decimal)
+    value = int(whole or "0") * 10 ** scale + int((fraction + "0" * scale)[:scale] or "0")
+    return -value if negative else value
+
+
+def _format_fixed(value: int, decimal: str, scale: int) -> str:
+    if not scale:
+        return str(value)
+    sign = "-" if value < 0 else ""
+    whole, fraction = divmod(abs(value), 10 ** scale)
+    return f"{sign}{whole}{decimal}{fraction:0{scale}d}"
+
+
+def _decimals(text: str, decimal: str) -> int:
+    _, separator, fraction = text.strip().partition(decimal)
+    return len(fraction) if separator else 0
+
+
+def _local_seconds(moment: datetime) -> int:
+    return (moment.toordinal() - EPOCH_ORDINAL) * SECONDS_PER_DAY + \
+        moment.hour * 3600 + moment.minute * 60 + moment.second
+
+
+def _format_offset(minutes: int) -> str:
+    sign = "-" if minutes < 0 else "+"
+    hours, minutes = divmod(abs(minutes), 60)
+    return f"{sign}{hours:02d}:{minutes:02d}"
+
+
+# ---------- blocks ----------
+
+class BlockSummary(NamedTuple):
+    offset: int
+    length: int
+    count: int
+    first: int          # local seconds of the first row
+    last: int           # local seconds of the last row
+    mins: List[int]     # per column, fixed point
+    maxs: List[int]
+    sums: List[int]
+
+    @property
+    def first_day(self) -> date:
+        return date.fromordinal(self.first // SECONDS_PER_DAY + EPOCH_ORDINAL)
+
+    @property
+    def last_day(self) -> date:
+        return date.fromordinal(self.last // SECONDS_PER_DAY + EPOCH_ORDINAL)
+
+
+class Block(NamedTuple):
+    seconds: List[int]            # local wall-clock seconds since 1970-01-01
+    offsets: List[int]            # UTC offset in minutes (0 when the export has none)
+    columns: List[List[int]]      # fixed-point values per column
+
+
+def _encode_block(seconds: List[int], offsets: List[int], columns: List[List[int]]) -> bytes:
+    out = bytearray()
+    for stream in (encode_runs(_deltas(seconds)), encode_runs(offsets)):
+        _put_varint(out, len(stream))
+        out += stream
+    for values in columns:
+        raw, delta = encode_runs(values), encode_runs(_deltas(values))
+        kind, stream = (DELTA, delta) if len(delta) < len(raw) else (RAW, raw)
+        out.append(kind)
+        _put_varint(out, len(stream))
+        out += stream
+    return zlib.compress(bytes(out))
+
+
+def _decode_block(payload: bytes, width: int) -> Block:
+    data = zlib.decompress(payload)
+    length, pos = _get_varint(data, 0)
+    seconds = _undelta(decode_runs(data, pos, pos + length))
+    pos += length
+    length, pos = _get_varint(data, pos)
+    offsets = decode_runs(data, pos, pos + length)
+    pos += length
+    columns = []
+    for _ in range(width):
+        kind = data[pos]
+        length, pos = _get_varint(data, pos + 1)
+        values = decode_runs(data, pos, pos + length)
+        columns.append(_undelta(values) if kind == DELTA else values)
+        pos += length
+    return Block(seconds, offsets, columns)
+
+
+def _encode_directory(blocks: List[BlockSummary]) -> bytes:
+    out = bytearray()
+    _put_varint(out, len(blocks))
+    for block in blocks:
+        for value in block[:5]:
+            _put_signed(out, value)
+        for values in block[5:]:
+            for value in values:
+                _put_signed(out, value)
+    return bytes(out)
+
+
+def _decode_directory(data: bytes, width: int) -> List[BlockSummary]:
+    count, pos = _get_varint(data, 0)
+    blocks = []
+    for _ in range(count):
+        fields: List = []
+        for _ in range(5):
+            value, pos = _get_signed(data, pos)
+            fields.append(value)
+        for _ in range(3):
+            values = []
+            for _ in range(width):
+                value, pos = _get_signed(data, pos)
+                values.append(value)
+            fields.append(values)
+        blocks.append(BlockSummary(*fields))
+    return blocks
+
+
+# ---------- conversion ----------
+
+def csv_to_archive(csv_path: str, archive_path: str, delimiter: str = ";") -> int:
+    """Converts a meter CSV into an archive. Returns the number of rows stored."""
+    with open(csv_path, encoding="utf-8", newline="") as file:
+        text = file.read()
+    newline = "\r\n" if "\r\n" in text else "\n"
+    lines = text.split(newline)
+    trailing_newline = lines[-1] == ""
+    if trailing_newline:
+        lines.pop()
+    header, rows = lines[0], [line.split(delimiter) for line in lines[1:] if line.strip()]
+    names = header.split(delimiter)
+    width = len(names) - 1
+
+    sample = [field for row in rows[:1000] for field in row[1:]]
+    decimal = "," if any("," in field for field in sample) else "."
+    scales = [max((_decimals(row[i + 1], decimal) for row in rows), default=0) for i in range(width)]
+    first_time = rows[0][0].strip() if rows else ""
+    meta = {
+        "version": VERSION,
+        "header": header,
+        "delimiter": delimiter,
+        "newline": newline,
+        "trailing_newline": trailing_newline,
+        "decimal": decimal,
+        "scales": scales,
+        "millis": len(first_time) > 19 and first_time[19] == ".",
+        "offset": parse_offset(first_time) is not None if first_time else False,
+    }
+
+    seconds = [_local_seconds(parse_local(row[0].strip())) for row in rows]
+    offsets = [
+        int(offset.total_seconds() // 60) if (offset := parse_offset(row[0].strip())) is not None else 0
+        for row in rows
+    ] if meta["offset"] else [0] * len(rows)
+    columns = [[_parse_fixed(row[i + 1], decimal, scales[i]) for row in rows] for i in range(width)]
+
+    meta_bytes = json.dumps(meta).encode("utf-8")
+    out = bytearray(MAGIC)
+    _put_varint(out, len(meta_bytes))
+    out += meta_bytes
+    summaries = []
+    start = 0
+    while start < len(rows):
+        # Blocks hold one ISO week: ordinal 1 (0001-01-01) is a Monday
+        week = (seconds[start] // SECONDS_PER_DAY + EPOCH_ORDINAL - 1) // DAYS_PER_BLOCK
+        end = start + 1
+        while end < len(rows) and \
+                (seconds[end] // SECONDS_PER_DAY + EPOCH_ORDINAL - 1) // DAYS_PER_BLOCK == week:
+            end += 1
+        block_columns = [values[start:end] for values in columns]
+        payload = _encode_block(seconds[start:end], offsets[start:end], block_columns)
+        summaries.append(BlockSummary(
+            len(out), len(payload), end - start, seconds[start], seconds[end - 1],
+            [min(values) for values in block_columns],
+            [max(values) for values in block_columns],
+            [sum(values) for values in block_columns],
+        ))
+        out += payload
+        start = end
+    directory_offset = len(out)
+    out += _encode_directory(summaries)
+    out += TRAILER.pack(directory_offset, MAGIC)
+    with open(archive_path, "wb") as file:
+        file.write(out)
+    return len(rows)
+
+
+def archive_to_csv(archive_path: str, csv_path: str) -> int:
+    """Writes an archive back out as the original CSV. Returns the number of rows written."""
+    archive = MeterArchive(archive_path)
+    with open(csv_path, "w", encoding="utf-8", newline="") as file:
+        file.writelines(archive.iter_lines())
+    return len(archive)
+
+
+def is_archive(path: str) -> bool:
+    try:
+        with open(path, "rb") as file:
+            return file.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+@contextlib.contextmanager
+def open_lines(path: str) -> Iterator[Iterator[str]]:
+    """
+    Opens a meter CSV or archive for reading text lines. The CSV readers
+    use this instead of open(), so they accept either format.
+    """
+    if is_archive(path):
+        yield MeterArchive(path).iter_lines()
+    else:
+        with open(path, encoding="utf-8") as file:
+            yield file
+
+
+# ---------- reading ----------
+
+class MeterArchive:
+    """Read access to an archive: blocks, text lines and block-level range statistics."""
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as file:
+            self._data = file.read()
+        data = self._data
+        if data[:4] != MAGIC or len(data) < len(MAGIC) + TRAILER.size:
+            raise ValueError(f"{path} is not a meter archive")
+        directory_offset, magic = TRAILER.unpack_from(data, len(data) - TRAILER.size)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is truncated")
+        length, pos = _get_varint(data, len(MAGIC))
+        self.meta = json.loads(data[pos:pos + length].decode("utf-8"))
+        if self.meta.get("version") != VERSION:
+            raise ValueError(f"{path}: unsupported archive version {self.meta.get('version')}")
+        self.path = path
+        self.delimiter: str = self.meta["delimiter"]
+        self.names: List[str] = self.meta["header"].split(self.delimiter)
+        self.columns: List[str] = [name.strip() for name in self.names[1:]]
+        self.scales: List[int] = self.meta["scales"]
+        self.blocks = _decode_directory(data[directory_offset:len(data) - TRAILER.size], len(self.columns))
+
+    def __len__(self) -> int:
+        return sum(block.count for block in self.blocks)
+
+    def block(self, index: int) -> Block:
+        summary = self.blocks[index]
+        return _decode_block(self._data[summary.offset:summary.offset + summary.length], len(self.columns))
+
+    def iter_blocks(self) -> Iterator[Block]:
+        for index in range(len(self.blocks)):
+            yield self.block(index)
+
+    def iter_fields(self) -> Iterator[List[str]]:
+        """Yields every row as its list of CSV text fields."""
+        decimal = self.meta["decimal"]
+        millis, with_offset = self.meta["millis"], self.meta["offset"]
+        timespec = "milliseconds" if millis else "seconds"
+        for block in self.iter_blocks():
+            texts = [
+                [_format_fixed(value, decimal, scale) for value in values]
+                for values, scale in zip(block.columns, self.scales)
+            ]
+            for i, seconds in enumerate(block.seconds):
+                stamp = (EPOCH + timedelta(seconds=seconds)).isoformat(timespec=timespec)
+                if with_offset:
+                    stamp += _format_offset(block.offsets[i])
+                yield [stamp, *(column[i] for column in texts)]
+
+    def iter_lines(self) -> Iterator[str]:
+        """Yields the header and every row as CSV text lines, as in the original file."""
+        newline = self.meta["newline"]
+        yield self.meta["header"] + newline
+        lines = (self.delimiter.join(fields) for fields in self.iter_fields())
+        previous = next(lines, None)
+        for line in lines:
+            yield previous + newline
+            previous = line
+        if previous is not None:
+            yield previous + (newline if self.meta["trailing_newline"] else "")
+
+    def iter_values(self) -> Iterator[Tuple[List[datetime], List[List[float]]]]:
+        """Yields (local times, float columns) per block, without going through text."""
+        for block in self.iter_blocks():
+            times = [EPOCH + timedelta(seconds=seconds) for seconds in block.seconds]
+            yield times, [
+                [value / 10 ** scale for value in values] if scale else [float(value) for value in values]
+                for values, scale in zip(block.columns, self.scales)
+            ]
+
+    def range_stats(self, start_date: date, end_date: date) -> Dict[str, Stats]:
+        """
+        Sum, mean, min and max per column over the days [start_date, end_date].
+
+        Blocks inside the range are answered from their summaries; only
+        blocks that straddle an edge are decoded. Sums are exact.
+        """
+        width = len(self.columns)
+        lo = (start_date.toordinal() - EPOCH_ORDINAL) * SECONDS_PER_DAY
+        hi = (end_date.toordinal() + 1 - EPOCH_ORDINAL) * SECONDS_PER_DAY
+        count = 0
+        sums = [0] * width
+        mins: List[Optional[int]] = [None] * width
+        maxs: List[Optional[int]] = [None] * width
+
+        def merge(i: int, low: int, high: int) -> None:
+            mins[i] = low if mins[i] is None else min(mins[i], low)
+            maxs[i] = high if maxs[i] is None else max(maxs[i], high)
+
+        for index, summary in enumerate(self.blocks):
+            if summary.last < lo or summary.first >= hi:
+                continue
+            if lo <= summary.first and summary.last < hi:
+                count += summary.count
+                for i in range(width):
+                    sums[i] += summary.sums[i]
+                    merge(i, summary.mins[i], summary.maxs[i])
+                continue
+            block = self.block(index)
+            inside = [n for n, seconds in enumerate(block.seconds) if lo <= seconds < hi]
+            if not inside:
+                continue
+            count += len(inside)
+            for i, values in enumerate(block.columns):
+                selected = [values[n] for n in inside]
+                sums[i] += sum(selected)
+                merge(i, min(selected), max(selected))
+
+        stats = {}
+        for i, name in enumerate(self.columns):
+            unit = 10 ** self.scales[i]
+            total = sums[i] / unit
+            stats[name] = Stats(
+                total,
+                total / count if count else 0.0,
+                mins[i] / unit if mins[i] is not None else 0.0,
+                maxs[i] / unit if maxs[i] is not None else 0.0,
+                count,
+            )
+        return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert meter CSVs to and from the archive format")
+    parser.add_argument("command", choices=("pack", "unpack"))
+    parser.add_argument("source")
+    parser.add_argument("target")
+    args = parser.parse_args()
+    if args.command == "pack":
+        rows = csv_to_archive(args.source, args.target)
+    else:
+        rows = archive_to_csv(args.source, args.target)
+    print(f"{rows} rows, {os.path.getsize(args.source)} -> {os.path.getsize(args.target)} bytes")
@@ -0,0 +1,83 @@
+# Copyright (c) 2026 Shaidul Islam
+# License: MIT
+
+"""
+Memoized decoders for the reservation date and time fields.
+
+Booking files repeat the same few hundred dates and quarter-hour start
+times, so reservationDate, reservationTime and createdAt are decoded
+through bounded LRU caches. A miss uses the C fromisoformat parsers only
+when the text has exactly the fixed layout below (its length and
+separator positions); fromisoformat accepts much more, such as
+"20251112", "09:00:00" or a UTC offset, which the formats reject.
+Anything else goes to strptime with the original format, so looser
+input it allows (such as an unpadded "9:00") still decodes and the rest
+still raises ValueError:
+
+    reservationDate  2025-11-12           -> date
+    reservationTime  09:00                -> time
+    createdAt        2025-08-12 14:33:20  -> datetime
+
+Task-g has always read createdAt with datetime.fromisoformat, which also
+takes a "T" separator, fractional seconds or an offset; it decodes it
+with decode_iso_datetime, which accepts exactly what fromisoformat does.
+
+cache_stats() returns the hit/miss counters of every cache.
+"""
+
+from datetime import date, datetime, time
+from functools import lru_cache
+from typing import Dict
+
+
+@lru_cache(maxsize=4096)
+def decode_date(text: str) -> date:
+    """Decodes a YYYY-MM-DD reservation date."""
+    if len(text) == 10 and text[4] == text[7] == "-":
+        try:
+            return date.fromisoformat(text)
+        except ValueError:
+            pass
+    return datetime.strptime(text, "%Y-%m-%d").date()
+
+
+@lru_cache(maxsize=1024)
+def decode_time(text: str) -> time:
+    """Decodes an HH:MM reservation start time."""
+    if len(text) == 5 and text[2] == ":":
+        try:
+            return time.fromisoformat(text)
+        except ValueError:
+            pass
+    return datetime.strptime(text, "%H:%M").time()
+
+
+@lru_cache(maxsize=1024)
+def decode_datetime(text: str) -> datetime:
+    """Decodes a YYYY-MM-DD HH:MM:SS creation timestamp."""
+    if (len(text) == 19 and text[4] == text[7] == "-" and text[10] == " "
+            and text[13] == text[16] == ":"):
+        try:
+            return datetime.fromisoformat(text)
+        except ValueError:
+            pass
+    return datetime.strptime(text, "%Y-%m-%d %H:%M:%S")
+
+
+@lru_cache(maxsize=1024)
+def decode_iso_datetime(text: str) -> datetime:
+    """Decodes an ISO 8601 creation timestamp, as datetime.fromisoformat does."""
+    return datetime.fromisoformat(text)
+
+
+_DECODERS = (decode_date, decode_time, decode_datetime, decode_iso_datetime)
+
+
+def cache_stats() -> Dict[str, dict]:
+    """Hit/miss counters and sizes of the caches."""
+    return {func.__name__: func.cache_info()._asdict() for func in _DECODERS}
+
+
+def clear_caches() -> None:
+    for func in _DECODERS:
+        func.cache_clear()
@@ -0,0 +1,208 @@
+# Copyright (c) 2026 Shaidul Islam
+# License: MIT
+
+"""
+Byte-offset partition index for the hourly energy CSVs.
+
+A yearly export (Task-f's 2025.csv, or a per-phase export in the Task-d
+and Task-e layout) is sorted by time, so every day, ISO week and month
+is one contiguous run of lines. The index records the [start, end) byte
+range of each run. A week or month can then be read by seeking straight
+to it and parsing only its lines:
+
+    index = partition_index("2025.csv")
+    rows = index.rows(index.week(2025, 42))   # csv.DictReader rows of week 42
+
+The index is built in one pass that only looks at the date prefix of
+each line. It is stored next to the CSV (2025.csv -> 2025.csv.index.json)
+together with the size and mtime of the CSV, and rebuilt as soon as the
+CSV changes. Partition keys use the local calendar day of the
+timestamp, so +02:00 and +03:00 rows fall on the day they were recorded.
+
+Meter archives (shared.archive) are not indexed: they are compressed,
+so a week is no byte range of text, and they are already stored in
+blocks of one ISO week. PartitionIndex.build raises ValueError for them.
+
+Keys:
+    day    2025-10-13
+    week   2025-W42   (ISO year and week)
+    month  2025-10
+"""
+
+import csv
+import io
+import json
+import os
+from datetime import date
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from shared.archive import is_archive
+
+VERSION = 1
+
+Span = Tuple[int, int]
+
+
+def index_path(filename: str) -> str:
+    return filename + ".index.json"
+
+
+def day_key(day: date) -> str:
+    return day.isoformat()
+
+
+def week_key(year: int, week: int) -> str:
+    return f"{year:04d}-W{week:02d}"
+
+
+def month_key(year: int, month: int) -> str:
+    return f"{year:04d}-{month:02d}"
+
+
+def _source_stamp(filename: str) -> Tuple[int, int]:
+    stat = os.stat(filename)
+    return stat.st_size, stat.st_mtime_ns
+
+
+class PartitionIndex:
+    """Byte ranges of every day, ISO week and month of a time-sorted CSV."""
+
+    def __init__(self, filename: str, header_end: int, days: Dict[str, Span],
+                 weeks: Dict[str, Span], months: Dict[str, Span]) -> None:
+        self.filename = filename
+        self.header_end = header_end
+        self.days = days
+        self.weeks = weeks
+        self.months = months
+
+    @classmethod
+    def build(cls, filename: str) -> "PartitionIndex":
+        """
+        Scans the CSV once. Raises ValueError if the rows are not in time
+        order, because a partition would then not be one byte range, or if
+        the file is a meter archive.
+        """
+        if is_archive(filename):
+            raise ValueError(f"{filename} is a meter archive, not a CSV; read its weekly "
+                             "blocks with shared.archive.MeterArchive or unpack it first")
+        days: Dict[str, Span] = {}
+        with open(filename, "rb") as file:
+            header_end = len(file.readline())
+            offset = header_end
+            current = None
+            start = offset
+            for line in file:
+                key = line[:10].decode("ascii", errors="replace")
+                if key != current and line.strip():
+                    if current is not None:
+                        days[current] = (start, offset)
+                    if key in days:
+                        raise ValueError(f"{filename}: rows are not in time order at {key}")
+                    current, start = key, offset
+                offset += len(line)
+            if current is not None:
+                days[current] = (start, offset)
+
+        weeks: Dict[str, Span] = {}
+        months: Dict[str, Span] = {}
+        for key, (start, end) in days.items():
+            day = date.fromisoformat(key)
+            iso = day.isocalendar()
+            for spans, span_key in ((weeks, week_key(iso.year, iso.week)),
+                                    (months, month_key(day.year, day.month))):
+                if span_key in spans:
+                    spans[span_key] = (spans[span_key][0], end)
+                else:
+                    spans[span_key] = (start, end)
+        return cls(filename, header_end, days, weeks, months)
+
+    @classmethod
+    def load(cls, filename: str) -> Optional["PartitionIndex"]:
+        """The saved index of filename, or None if there is none or the CSV has changed."""
+        try:
+            with open(index_path(filename), encoding="utf-8") as file:
+                saved = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if saved.get("version") != VERSION or \
+                (saved.get("size"), saved.get("mtime_ns")) != _source_stamp(filename):
+            return None
+        return cls(
+            filename,
+            saved["header_end"],
+            {key: tuple(span) for key, span in saved["days"].items()},
+            {key: tuple(span) for key, span in saved["weeks"].items()},
+            {key: tuple(span) for key, span in saved["months"].items()},
+        )
+
+    def save(self) -> None:
+        """Writes the index next to the CSV. Failures are ignored."""
+        size, mtime = _source_stamp(self.filename)
+        payload = {
+            "version": VERSION,
+            "size": size,
+            "mtime_ns": mtime,
+            "header_end": self.header_end,
+            "days": self.days,
+            "weeks": self.weeks,
+            "months": self.months,
+        }
+        tmp_path = index_path(self.filename) + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump(payload, file)
+            os.replace(tmp_path, index_path(self.filename))
+        except OSError:
+            pass
+
+    def day(self, day: date) -> Optional[Span]:
+        return self.days.get(day_key(day))
+
+    def week(self, year: int, week: int) -> Optional[Span]:
+        return self.weeks.get(week_key(year, week))
+
+    def month(self, year: int, month: int) -> Optional[Span]:
+        return self.months.get(month_key(year, month))
+
+    def iter_weeks(self) -> Iterator[Tuple[int, int, Span]]:
+        """Yields (ISO year, ISO week, span) in file order."""
+        for key, span in self.weeks.items():
+            year, week = key.split("-W")
+            yield int(year), int(week), span
+
+    def read_text(self, span: Span) -> str:
+        """The raw lines of a span, without the header."""
+        start, end = span
+        with open(self.filename, "rb") as file:
+            file.seek(start)
+            return file.read(end - start).decode("utf-8")
+
+    def rows(self, span: Optional[Span], delimiter: str = ";") -> List[Dict[str, str]]:
+        """The lines of a span as csv.DictReader rows keyed by the CSV header."""
+        if span is None:
+            return []
+        return read_rows(self.filename, self.header_end, span, delimiter)
+
+
+def read_rows(filename: str, header_end: int, span: Span, delimiter: str = ";") -> List[Dict[str, str]]:
+    """
+    Reads the header and one span of a CSV as csv.DictReader rows.
+
+    Takes plain values instead of a PartitionIndex so it can be sent to
+    worker processes cheaply.
+    """
+    start, end = span
+    with open(filename, "rb") as file:
+        header = file.read(header_end)
+        file.seek(start)
+        text = (header + file.read(end - start)).decode("utf-8")
+    return list(csv.DictReader(io.StringIO(text), delimiter=delimiter))
+
+
+def partition_index(filename: str) -> PartitionIndex:
+    """The partition index of filename, built and saved if missing or out of date."""
+    index = PartitionIndex.load(filename)
+    if index is None:
+        index = PartitionIndex.build(filename)
+        index.save()
+    return index
@@ -0,0 +1,240 @@
+# Copyright (c) 2026 Shaidul Islam
+# License: MIT
+
+"""
+Opt-in stage profiling for the task scripts.
+
+Entry points are marked with the stage decorator and a stage kind
+(parse, aggregate, format or write):
+
+    @stage("parse")
+    def read_data(filename): ...
+
+    @stage("aggregate", rows=from_arg(0))
+    def calculate_daily_summary(rows): ...
+
+Profiling is switched on by the TASK_PROFILE environment variable or a
+--profile flag on the command line; the flag is removed from sys.argv so
+the scripts' own argument parsing never sees it:
+
+    TASK_PROFILE=1 python Task-e/task_e.py             # JSON summary on stderr
+    TASK_PROFILE=profile.json python Task-e/task_e.py  # JSON summary to a file
+    python Task-d/task_d.py --profile[=profile.json]
+
+The decision is made once, when this module is imported. When profiling
+is off, stage() returns the function unchanged, so there is no overhead
+at all.
+
+When it is on, every stage records calls, wall time, time spent in the
+stage itself excluding nested stages, rows processed, rows/sec and peak
+traced memory above the stage's starting point (tracemalloc, which slows
+the run down; set TASK_PROFILE_MEMORY=0 to skip it). Generators are timed
+while they are consumed and count the items they yield. The summary is
+written at exit. Stages that run in worker processes (Task-e with many
+week files) are not included.
+"""
+
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from functools import wraps
+from inspect import isgenerator
+from typing import Any, Callable, Dict, List, Optional
+
+RowCounter = Callable[[tuple, Any], Optional[int]]
+
+STAGE_KINDS = ("parse", "aggregate", "format", "write")
+
+
+def _option_from_argv() -> Optional[str]:
+    for i, arg in enumerate(sys.argv[1:], 1):
+        if arg == "--profile" or arg.startswith("--profile="):
+            del sys.argv[i]
+            return arg.partition("=")[2] or "1"
+    return None
+
+
+_OUTPUT = _option_from_argv() or os.environ.get("TASK_PROFILE", "")
+ENABLED = _OUTPUT not in ("", "0")
+TRACE_MEMORY = ENABLED and os.environ.get("TASK_PROFILE_MEMORY", "1") != "0"
+
+
+def _size(value: Any) -> Optional[int]:
+    try:
+        return len(value)
+    except TypeError:
+        return None
+
+
+def from_result(args: tuple, result: Any) -> Optional[int]:
+    """Rows processed = len() of the return value (the default)."""
+    return _size(result)
+
+
+def from_arg(position: int) -> RowCounter:
+    """Rows processed = len() of a positional argument."""
+    def count(args: tuple, result: Any) -> Optional[int]:
+        return _size(args[position]) if position < len(args) else None
+    return count
+
+
+class _StageStats:
+    __slots__ = ("calls", "seconds", "self_seconds", "rows", "peak_bytes")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.seconds = 0.0
+        self.self_seconds = 0.0
+        self.rows: Optional[int] = None
+        self.peak_bytes = 0
+
+    def as_dict(self, name: str) -> Dict[str, Any]:
+        return {
+            "stage": name,
+            "calls": self.calls,
+            "seconds": round(self.seconds, 6),
+            "self_seconds": round(self.self_seconds, 6),
+            "rows": self.rows,
+            "rows_per_sec": round(self.rows / self.seconds) if self.rows and self.seconds else None,
+            "peak_bytes": self.peak_bytes if TRACE_MEMORY else None,
+        }
+
+
+class _Frame:
+    __slots__ = ("started", "child_seconds", "base_bytes", "peak")
+
+    def __init__(self) -> None:
+        self.child_seconds = 0.0
+        self.base_bytes = 0
+        self.peak = 0
+        if TRACE_MEMORY:
+            current, _ = tracemalloc.get_traced_memory()
+            self.base_bytes = self.peak = current
+        self.started = time.perf_counter()
+
+
+_stats: Dict[str, _StageStats] = {}
+_lock = threading.Lock()
+_local = threading.local()
+_started = time.perf_counter()
+
+
+def _stack() -> List[_Frame]:
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def _enter() -> _Frame:
+    stack = _stack()
+    if TRACE_MEMORY:
+        if stack:
+            # Keep the enclosing stage's peak before the counter is reset
+            stack[-1].peak = max(stack[-1].peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+    frame = _Frame()
+    stack.append(frame)
+    return frame
+
+
+def _exit(name: str, frame: _Frame, rows: Optional[int], calls: int = 1) -> None:
+    elapsed = time.perf_counter() - frame.started
+    stack = _stack()
+    stack.pop()
+    peak = 0
+    if TRACE_MEMORY:
+        peak = max(frame.peak, tracemalloc.get_traced_memory()[1])
+    if stack:
+        stack[-1].child_seconds += elapsed
+        stack[-1].peak = max(stack[-1].peak, peak)
+    with _lock:
+        stats = _stats.get(name)
+        if stats is None:
+            stats = _stats[name] = _StageStats()
+        stats.calls += calls
+        stats.seconds += elapsed
+        stats.self_seconds += elapsed - frame.child_seconds
+        if rows is not None:
+            stats.rows = (stats.rows or 0) + rows
+        stats.peak_bytes = max(stats.peak_bytes, peak - frame.base_bytes)
+
+
+def _timed_generator(name: str, generator, item_rows: Optional[Callable[[Any], int]]):
+    count = 0
+    while True:
+        frame = _enter()
+        try:
+            item = next(generator)
+        except StopIteration:
+            _exit(name, frame, count, calls=0)
+            return
+        except BaseException:
+            _exit(name, frame, count, calls=0)
+            raise
+        _exit(name, frame, None, calls=0)
+        count += item_rows(item) if item_rows else 1
+        yield item
+
+
+def stage(kind: str, rows: RowCounter = from_result,
+          item_rows: Optional[Callable[[Any], int]] = None) -> Callable:
+    """
+    Marks a function as a pipeline stage of the given kind; a no-op unless profiling is on.
+
+    rows counts the rows of a call; a generator instead counts the items it
+    yields, or item_rows(item) per item when given.
+    """
+    if kind not in STAGE_KINDS:
+        raise ValueError(f"kind must be one of {STAGE_KINDS}, not {kind!r}")
+
+    def decorate(func: Callable) -> Callable:
+        if not ENABLED:
+            return func
+        name = f"{kind}:{func.__name__}"
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            frame = _enter()
+            try:
+                result = func(*args, **kwargs)
+            except BaseException:
+                _exit(name, frame, None)
+                raise
+            if isgenerator(result):
+                _exit(name, frame, None)
+                return _timed_generator(name, result, item_rows)
+            _exit(name, frame, rows(args, result))
+            return result
+        return wrapper
+    return decorate
+
+
+def summary() -> Dict[str, Any]:
+    """The statistics recorded so far, one entry per stage in first-call order."""
+    with _lock:
+        stages = [stats.as_dict(name) for name, stats in _stats.items()]
+    return {
+        "script": os.path.basename(sys.argv[0]),
+        "total_seconds": round(time.perf_counter() - _started, 6),
+        "stages": stages,
+    }
+
+
+def _write_summary() -> None:
+    text = json.dumps(summary(), indent=2)
+    if _OUTPUT == "1":
+        print(text, file=sys.stderr)
+        return
+    with open(_OUTPUT, "w", encoding="utf-8") as file:
+        file.write(text + "\n")
+
+
+if ENABLED:
+    if TRACE_MEMORY:
+        tracemalloc.start()
+    atexit.register(_write_summary)
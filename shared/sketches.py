@@ -0,0 +1,310 @@
+# Copyright (c) 2026 Shaidul Islam
+# License: MIT
+
+"""
+Mergeable one-pass summaries of hourly load.
+
+Everything here is built while streaming the rows once, uses memory that
+does not grow with the length of the history, and can be merged, so
+summaries from different files, months or worker processes combine into
+the summary of their union without going back to the rows:
+
+    QuantileSketch  percentiles within a relative error (1% by default).
+                    Values fall into logarithmic buckets, as in DDSketch,
+                    so merging is adding bucket counts and no sort is
+                    needed.
+    Peak            the smallest and largest value with their timestamps
+    Histogram       counts per fixed bucket
+    LoadSummary     all of the above plus count and sum for one series
+
+summarize() groups a stream of (timestamp, value) pairs into day, ISO
+week, month or year LoadSummaries. A year is the merge of its months:
+
+    months = summarize(pairs, "month")
+    year = LoadSummary.merged(months.values())
+    year.quantile(0.95), year.peak.high, year.histogram.counts
+
+LoadProfiles keeps one LoadSummary per day and is fed batch by batch
+while a file streams in; any day, date range, month or year is then a
+merge of its days:
+
+    profiles = LoadProfiles()
+    for rows in chunks:
+        profiles.add((row["time"], row["consumption"]) for row in rows)
+    profiles.periods("month")[2025, 10], profiles.between(first, last)
+"""
+
+import math
+from bisect import bisect_right
+from datetime import date, datetime
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+from shared.resample import key_function
+
+# Default load histogram edges (kWh per hour)
+LOAD_EDGES = (0.5, 1.0, 2.0, 3.0, 4.0)
+
+# Magnitudes below this count as zero in the quantile sketch
+MIN_MAGNITUDE = 1e-9
+
+
+class QuantileSketch:
+    """
+    Relative-error quantile sketch with logarithmic buckets.
+
+    A value v > 0 is counted in bucket ceil(log_gamma(v)), with
+    gamma = (1 + a) / (1 - a), so every quantile is returned within a
+    relative error of a. Negative values use a mirrored set of buckets.
+    With more than max_buckets buckets, the smallest are folded together,
+    which only loses accuracy at the low end.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.positive: Dict[int, int] = {}
+        self.negative: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def _index(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _value(self, index: int) -> float:
+        # Midpoint of bucket (gamma^(i-1), gamma^i] in relative terms
+        return 2 * self.gamma ** index / (self.gamma + 1)
+
+    def add(self, value: float, weight: int = 1) -> None:
+        if value > MIN_MAGNITUDE:
+            store = self.positive
+            index = self._index(value)
+        elif value < -MIN_MAGNITUDE:
+            store = self.negative
+            index = self._index(-value)
+        else:
+            self.zero_count += weight
+            self.count += weight
+            return
+        store[index] = store.get(index, 0) + weight
+        self.count += weight
+        if len(store) > self.max_buckets:
+            self._collapse(store)
+
+    def _collapse(self, store: Dict[int, int]) -> None:
+        keys = sorted(store)
+        excess = len(keys) - self.max_buckets
+        folded = sum(store.pop(key) for key in keys[:excess + 1])
+        store[keys[excess]] = folded
+
+    def merge(self, other: "QuantileSketch") -> None:
+        if other.gamma != self.gamma:
+            raise ValueError("cannot merge sketches with different relative accuracy")
+        for store, other_store in ((self.positive, other.positive), (self.negative, other.negative)):
+            for index, count in other_store.items():
+                store[index] = store.get(index, 0) + count
+            if len(store) > self.max_buckets:
+                self._collapse(store)
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """The q-quantile (0.0-1.0), or None for an empty sketch."""
+        if not self.count:
+            return None
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        rank = q * (self.count - 1)
+        seen = 0
+        for index in sorted(self.negative, reverse=True):
+            seen += self.negative[index]
+            if seen > rank:
+                return -self._value(index)
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for index in sorted(self.positive):
+            seen += self.positive[index]
+            if seen > rank:
+                return self._value(index)
+        return self._value(max(self.positive))
+
+
+class Peak:
+    """Smallest and largest value seen, each with the timestamp it was seen at."""
+
+    __slots__ = ("low", "low_at", "high", "high_at")
+
+    def __init__(self) -> None:
+        self.low: Optional[float] = None
+        self.low_at: Optional[datetime] = None
+        self.high: Optional[float] = None
+        self.high_at: Optional[datetime] = None
+
+    def add(self, value: float, when: Optional[datetime] = None) -> None:
+        # Ties keep the earliest timestamp
+        if self.high is None or value > self.high:
+            self.high, self.high_at = value, when
+        if self.low is None or value < self.low:
+            self.low, self.low_at = value, when
+
+    def merge(self, other: "Peak") -> None:
+        if other.high is not None:
+            if self.high is None or other.high > self.high or \
+                    (other.high == self.high and _earlier(other.high_at, self.high_at)):
+                self.high, self.high_at = other.high, other.high_at
+        if other.low is not None:
+            if self.low is None or other.low < self.low or \
+                    (other.low == self.low and _earlier(other.low_at, self.low_at)):
+                self.low, self.low_at = other.low, other.low_at
+
+
+def _earlier(a: Optional[datetime], b: Optional[datetime]) -> bool:
+    return a is not None and (b is None or a < b)
+
+
+class Histogram:
+    """
+    Counts per fixed bucket. With edges e0 < e1 < ... < en there are n + 2
+    buckets: (-inf, e0), [e0, e1), ..., [en, inf).
+    """
+
+    def __init__(self, edges: Sequence[float] = LOAD_EDGES) -> None:
+        self.edges = tuple(edges)
+        if list(self.edges) != sorted(set(self.edges)):
+            raise ValueError("histogram edges must be strictly increasing")
+        self.counts = [0] * (len(self.edges) + 1)
+
+    def add(self, value: float, weight: int = 1) -> None:
+        self.counts[bisect_right(self.edges, value)] += weight
+
+    def merge(self, other: "Histogram") -> None:
+        if other.edges != self.edges:
+            raise ValueError("cannot merge histograms with different edges")
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+
+    def buckets(self) -> List[Tuple[Optional[float], Optional[float], int]]:
+        """(lower edge, upper edge, count) per bucket; None for an open end."""
+        bounds = [None, *self.edges, None]
+        return [(bounds[i], bounds[i + 1], count) for i, count in enumerate(self.counts)]
+
+
+class LoadSummary:
+    """Count, sum, peaks, quantile sketch and histogram of one series."""
+
+    def __init__(self, edges: Sequence[float] = LOAD_EDGES, relative_accuracy: float = 0.01) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.peak = Peak()
+        self.sketch = QuantileSketch(relative_accuracy)
+        self.histogram = Histogram(edges)
+
+    @classmethod
+    def merged(cls, summaries: Iterable["LoadSummary"], edges: Sequence[float] = LOAD_EDGES,
+               relative_accuracy: float = 0.01) -> "LoadSummary":
+        result = cls(edges, relative_accuracy)
+        for summary in summaries:
+            result.merge(summary)
+        return result
+
+    def add(self, value: float, when: Optional[datetime] = None) -> None:
+        self.count += 1
+        self.total += value
+        self.peak.add(value, when)
+        self.sketch.add(value)
+        self.histogram.add(value)
+
+    def merge(self, other: "LoadSummary") -> None:
+        self.count += other.count
+        self.total += other.total
+        self.peak.merge(other.peak)
+        self.sketch.merge(other.sketch)
+        self.histogram.merge(other.histogram)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> Optional[float]:
+        return self.sketch.quantile(q)
+
+    def percentiles(self, qs: Sequence[float] = (0.5, 0.95, 0.99)) -> List[Optional[float]]:
+        return [self.sketch.quantile(q) for q in qs]
+
+
+def summarize(pairs: Iterable[Tuple[datetime, float]], freq: str = "month",
+              edges: Sequence[float] = LOAD_EDGES,
+              relative_accuracy: float = 0.01) -> Dict[Hashable, LoadSummary]:
+    """
+    One pass over (timestamp, value) pairs into a LoadSummary per day,
+    ISO week, month or year bucket (keys as in shared.resample), in key order.
+    """
+    key_of = key_function(freq)
+    summaries: Dict[Hashable, LoadSummary] = {}
+    last_ordinal = None
+    summary = None
+    for when, value in pairs:
+        ordinal = when.toordinal()
+        if ordinal != last_ordinal:
+            key = key_of(ordinal)
+            summary = summaries.get(key)
+            if summary is None:
+                summary = summaries[key] = LoadSummary(edges, relative_accuracy)
+            last_ordinal = ordinal
+        summary.add(value, when)
+    return {key: summaries[key] for key in sorted(summaries)}
+
+
+class LoadProfiles:
+    """
+    A LoadSummary per day, filled while the rows stream in.
+
+    add() may run on a loader thread while another thread reads: readers
+    work on a snapshot of the days, and a day only changes while its rows
+    are still arriving.
+    """
+
+    def __init__(self, edges: Sequence[float] = LOAD_EDGES, relative_accuracy: float = 0.01) -> None:
+        self.edges = tuple(edges)
+        self.relative_accuracy = relative_accuracy
+        self.days: Dict[date, LoadSummary] = {}
+
+    def add(self, pairs: Iterable[Tuple[datetime, float]]) -> None:
+        """Adds a batch of (timestamp, value) pairs."""
+        self._merge_days(summarize(pairs, "day", self.edges, self.relative_accuracy))
+
+    def merge(self, other: "LoadProfiles") -> None:
+        """Adds the days of other, e.g. another file or worker."""
+        self._merge_days(other.days)
+
+    def _merge_days(self, days: Dict[date, LoadSummary]) -> None:
+        for day, summary in days.items():
+            current = self.days.get(day)
+            if current is None:
+                current = self.days[day] = LoadSummary(self.edges, self.relative_accuracy)
+            current.merge(summary)
+
+    def select(self, keep: Callable[[date], bool]) -> LoadSummary:
+        """The merge of every day for which keep(day) is true."""
+        days = list(self.days.items())
+        return LoadSummary.merged((summary for day, summary in days if keep(day)),
+                                  self.edges, self.relative_accuracy)
+
+    def between(self, first: date, last: date) -> LoadSummary:
+        """The merge of the days first through last."""
+        return self.select(lambda day: first <= day <= last)
+
+    def periods(self, freq: str = "month") -> Dict[Hashable, LoadSummary]:
+        """The days merged into day, ISO week, month or year summaries, in key order."""
+        key_of = key_function(freq)
+        periods: Dict[Hashable, LoadSummary] = {}
+        for day, summary in sorted(list(self.days.items()), key=lambda item: item[0]):
+            key = key_of(day.toordinal())
+            period = periods.get(key)
+            if period is None:
+                period = periods[key] = LoadSummary(self.edges, self.relative_accuracy)
+            period.merge(summary)
+        return periods
@@ -0,0 +1,91 @@
+# Copyright (c) 2026 Shaidul Islam
+# License: MIT
+
+"""
+Reads a growing text file like a log, for the follow modes of Task-f and
+Task-g.
+
+FileTail remembers the byte offset and inode it has consumed and, on
+every poll, returns only the lines appended since then. A half-written
+last line is left for the next poll. If the file is truncated or
+replaced (rotation), the tail starts over from byte 0 and counts a reset,
+so the caller can rebuild whatever it derived from the old lines.
+
+Only newline-terminated lines are ever consumed, also on a read from
+byte 0 (where the first non-blank line is the header): a writer may be
+in the middle of the last line. A tail can also start at an offset the
+caller has already read up to; complete_end() gives the right one for a
+file loaded in one go, just after its last newline.
+"""
+
+import os
+import time
+from typing import Iterator, List, Optional
+
+
+def complete_end(filename: str, size: int, block: int = 1 << 16) -> int:
+    """The offset just after the last newline in the first size bytes of a file (0 if none)."""
+    with open(filename, "rb") as file:
+        end = size
+        while end > 0:
+            start = max(0, end - block)
+            file.seek(start)
+            found = file.read(end - start).rfind(b"\n")
+            if found >= 0:
+                return start + found + 1
+            end = start
+    return 0
+
+
+class FileTail:
+    """Returns the non-blank data lines appended to a UTF-8 file since the last poll."""
+
+    def __init__(self, filename: str, offset: int = 0, inode: Optional[int] = None) -> None:
+        self.filename = filename
+        self.offset = offset
+        self.inode = inode
+        self.header: Optional[str] = None
+        # A tail that starts at byte 0 still has to see the header line
+        self._needs_header = offset == 0
+        self.resets = 0
+
+    def _reset(self) -> None:
+        self.offset = 0
+        self.header = None
+        self._needs_header = True
+        self.resets += 1
+
+    def poll(self) -> List[str]:
+        """Reads newly appended lines, stripped; the header of a read from byte 0 goes to self.header."""
+        try:
+            stat = os.stat(self.filename)
+        except FileNotFoundError:
+            return []  # rotated away; the new file is picked up on a later poll
+        if self.inode is not None and (stat.st_ino != self.inode or stat.st_size < self.offset):
+            self._reset()
+        self.inode = stat.st_ino
+        if stat.st_size == self.offset:
+            return []
+
+        with open(self.filename, "rb") as file:
+            file.seek(self.offset)
+            chunk = file.read(stat.st_size - self.offset)
+        end = chunk.rfind(b"\n") + 1
+        if end == 0:
+            return []  # no complete line yet
+
+        self.offset += end
+        lines = [line.strip() for line in chunk[:end].decode("utf-8").splitlines()]
+        lines = [line for line in lines if line]
+        if self._needs_header and lines:
+            self.header = lines.pop(0)
+            self._needs_header = False
+        return lines
+
+    def follow(self, interval: float = 1.0) -> Iterator[List[str]]:
+        """Polls forever, yielding each non-empty batch of new lines."""
+        while True:
+            lines = self.poll()
+            if lines:
+                yield lines
+            time.sleep(interval)
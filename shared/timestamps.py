@@ -0,0 +1,100 @@
+# Copyright (c) 2026 Shaidul Islam
+# License: MIT
+
+"""
+Timestamp decoding for the hourly energy CSVs.
+
+The meter exports use a fixed layout:
+
+    2025-10-13T00:00:00            (Task-d, Task-e)
+    2025-01-01T00:00:00.000+02:00  (Task-f, +03:00 during summer time)
+
+The UTC offset is cut off by position and the remaining local part is
+handed to datetime.fromisoformat, which is implemented in C. That is
+faster than the old replace("+02:00", "") + fromisoformat, and every row
+comes back the same way regardless of its offset: naive local time from
+parse_local, or aware UTC from parse_utc. Values must already be stripped.
+
+Run this file to benchmark against the old parse:
+
+    python shared/timestamps.py [path/to/2025.csv]
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Optional
+
+_fromisoformat = datetime.fromisoformat
+
+
+def _has_offset(text: str) -> bool:
+    return len(text) > 19 and text[-6] in "+-"
+
+
+def parse_local(text: str) -> datetime:
+    """Returns the naive local (wall clock) time, ignoring any UTC offset."""
+    if len(text) > 19:
+        if text[-6] in "+-":
+            return _fromisoformat(text[:-6])
+        if text[-1] == "Z":
+            return _fromisoformat(text[:-1])
+    return _fromisoformat(text)
+
+
+def parse_offset(text: str) -> Optional[timedelta]:
+    """Returns the UTC offset of a timestamp, or None if it has none."""
+    if _has_offset(text):
+        sign = -1 if text[-6] == "-" else 1
+        return sign * timedelta(hours=int(text[-5:-3]), minutes=int(text[-2:]))
+    if text[-1] == "Z":
+        return timedelta(0)
+    return None
+
+
+def parse_utc(text: str) -> datetime:
+    """Returns an aware UTC datetime. Timestamps without an offset are taken as UTC."""
+    if text[-1] == "Z":
+        text = text[:-1] + "+00:00"
+    if _has_offset(text):
+        return _fromisoformat(text).astimezone(timezone.utc)
+    return _fromisoformat(text).replace(tzinfo=timezone.utc)
+
+
+def parse_timestamps(texts: Iterable[str], to_utc: bool = False) -> List[datetime]:
+    """Decodes a batch of timestamps as local times, or as UTC when to_utc is set."""
+    if to_utc:
+        return [parse_utc(text) for text in texts]
+    parse = _fromisoformat
+    return [
+        parse(text[:-6]) if len(text) > 19 and text[-6] in "+-" else parse_local(text)
+        for text in texts
+    ]
+
+
+def _benchmark(filename: str) -> None:
+    import timeit
+
+    with open(filename, encoding="utf-8") as file:
+        file.readline()
+        texts = [line.split(";", 1)[0] for line in file if line.strip()]
+
+    def old() -> list:
+        return [datetime.fromisoformat(t.replace("+02:00", "")) for t in texts]
+
+    candidates = [
+        ("fromisoformat(replace)", old),
+        ("parse_timestamps", lambda: parse_timestamps(texts)),
+        ("parse_timestamps(to_utc)", lambda: parse_timestamps(texts, to_utc=True)),
+        ("parse_local per row", lambda: [parse_local(t) for t in texts]),
+    ]
+    print(f"{len(texts)} timestamps from {filename}")
+    for name, func in candidates:
+        seconds = min(timeit.repeat(func, number=5, repeat=5)) / 5
+        print(f"{name:<26} {seconds * 1000:8.2f} ms  {len(texts) / seconds / 1e6:6.2f} M rows/s")
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+
+    default = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Task-f", "2025.csv")
+    _benchmark(sys.argv[1] if len(sys.argv) > 1 else default)
@@ -0,0 +1,50 @@
+# Copyright (c) 2026 Shaidul Islam
+# License: MIT
+
+import importlib.util
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def load_module(task_dir: str, filename: str, name: str):
+    """Imports a task script by path; its own directory is put on sys.path for sibling imports."""
+    directory = os.path.join(ROOT, task_dir)
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+    spec = importlib.util.spec_from_file_location(name, os.path.join(directory, filename))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def task_d():
+    return load_module("Task-d", "task_d.py", "task_d")
+
+
+@pytest.fixture(scope="session")
+def task_e():
+    return load_module("Task-e", "task_e.py", "task_e")
+
+
+@pytest.fixture(scope="session")
+def task_f():
+    return load_module("Task-f", "task_f.py", "task_f")
+
+
+def task_path(task_dir: str, filename: str) -> str:
+    return os.path.join(ROOT, task_dir, filename)
+
+
+def expected(filename: str) -> str:
+    with open(os.path.join(DATA, filename), encoding="utf-8") as file:
+        return file.read()
@@ -0,0 +1,146 @@
+# Copyright (c) 2026 Shaidul Islam
+# License: MIT
+
+import math
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from conftest import task_path
+
+from shared.archive import (MIN_RUN, MeterArchive, archive_to_csv, csv_to_archive, decode_runs,
+                            encode_runs, open_lines)
+from shared.timestamps import parse_local
+
+
+def round_trip(tmp_path, source):
+    archive = str(tmp_path / "data.ema")
+    restored = str(tmp_path / "restored.csv")
+    rows = csv_to_archive(source, archive)
+    assert archive_to_csv(archive, restored) == rows
+    with open(source, "rb") as original, open(restored, "rb") as copy:
+        assert copy.read() == original.read()
+    return archive
+
+
+def decimal(value, places):
+    return f"{value:.{places}f}".replace(".", ",")
+
+
+def write_csv(tmp_path, header, lines, newline="\n", trailing=True):
+    path = tmp_path / "data.csv"
+    path.write_bytes((newline.join([header, *lines]) + (newline if trailing else "")).encode("utf-8"))
+    return str(path)
+
+
+def test_runs_round_trip():
+    rng = random.Random(5)
+    cases = [
+        [],
+        [0],
+        [0] * 10000,                                     # a long zero run
+        [-1, -1, -1, 2, -3, -3, 0, 0],
+        [0] * (MIN_RUN - 1) + [1] * MIN_RUN + [2] * (MIN_RUN + 1),
+        [2 ** 40, -(2 ** 40), 127, 128, -64, -65],       # multi-byte varints
+        [rng.randint(-5000, 5000) for _ in range(2000)],
+    ]
+    for values in cases:
+        data = encode_runs(values)
+        assert decode_runs(data) == values
+        # Decoding a window of a larger buffer
+        assert decode_runs(b"\xff" + data + b"\xff", 1, 1 + len(data)) == values
+    assert len(encode_runs([0] * 10000)) <= 4
+
+
+@pytest.mark.parametrize("filename", [
+    ("Task-f", "2025.csv"),      # net layout: offsets, milliseconds, decimals, negative temperatures
+    ("Task-e", "week41.csv"),    # per-phase layout: integer Wh, no offset
+    ("Task-d", "week42.csv"),
+])
+def test_exports_round_trip(tmp_path, filename):
+    source = task_path(*filename)
+    archive = round_trip(tmp_path, source)
+    with open(source, encoding="utf-8", newline="") as file, open_lines(archive) as lines:
+        assert list(lines) == file.read().splitlines(keepends=True)
+
+
+def test_zero_runs_and_negative_deltas_round_trip(tmp_path):
+    rng = random.Random(11)
+    header = "Time; Consumption (net) kWh; Production (net) kWh; Daily average temperature"
+    lines = []
+    start = datetime(2024, 10, 20)
+    for hour in range(24 * 70):
+        when = start + timedelta(hours=hour)
+        # +03:00 until the last Sunday of October, then +02:00
+        offset = "+03:00" if when < datetime(2024, 10, 27, 4) else "+02:00"
+        # Production is zero for weeks on end, then falls steadily
+        production = 0 if hour < 24 * 40 else max(0, 5000 - 7 * (hour - 24 * 40))
+        temperature = round(3 - hour / 200 + rng.uniform(-1, 1), 1) + 0.0  # no "-0,0", see shared.archive
+        lines.append(f"{when:%Y-%m-%dT%H:%M:%S}.000{offset};{decimal(rng.randint(0, 4000) / 1000, 3)};"
+                     f"{decimal(production / 1000, 3)};{decimal(temperature, 1)}")
+    source = write_csv(tmp_path, header, lines, newline="\r\n", trailing=False)
+    archive = MeterArchive(round_trip(tmp_path, source))
+
+    assert archive.meta["newline"] == "\r\n" and not archive.meta["trailing_newline"]
+    assert len(archive) == len(lines)
+    zero_weeks = [block for block in archive.blocks if block.maxs[1] == 0]
+    assert len(zero_weeks) >= 5
+    assert any(block.mins[2] < 0 for block in archive.blocks)
+
+
+def test_per_phase_layout_round_trips_with_gaps(tmp_path):
+    header = ("Time;Consumption phase 1 Wh;Consumption phase 2 Wh;Consumption phase 3 Wh;"
+              "Production phase 1 Wh;Production phase 2 Wh;Production phase 3 Wh")
+    lines = []
+    for first in (datetime(2024, 12, 30), datetime(2025, 3, 5)):
+        for hour in range(24 * 9):
+            when = first + timedelta(hours=hour)
+            lines.append(f"{when:%Y-%m-%dT%H:%M:%S};{900 - hour};{hour % 7};0;0;0;{hour // 24}")
+    archive = MeterArchive(round_trip(tmp_path, write_csv(tmp_path, header, lines)))
+    assert archive.scales == [0] * 6
+    # Blocks are ISO weeks and never span the gap
+    for block in archive.blocks:
+        assert block.first_day.isocalendar()[:2] == block.last_day.isocalendar()[:2]
+
+
+def brute_stats(source, start_date, end_date):
+    with open(source, encoding="utf-8") as file:
+        rows = [line.rstrip("\r\n").split(";") for line in file][1:]
+    inside = [row for row in rows if start_date <= parse_local(row[0]).date() <= end_date]
+    columns = list(zip(*(row[1:] for row in inside))) if inside else []
+    return len(inside), [[float(value.replace(",", ".")) for value in column] for column in columns]
+
+
+def test_range_stats_skip_only_whole_blocks(tmp_path, monkeypatch):
+    source = task_path("Task-f", "2025.csv")
+    archive = MeterArchive(round_trip(tmp_path, source))
+    decoded = []
+    original = MeterArchive.block
+    monkeypatch.setattr(MeterArchive, "block", lambda self, index: decoded.append(index) or original(self, index))
+
+    # (first day, last day, blocks decoded)
+    cases = [
+        (date(2025, 1, 6), date(2025, 1, 12), 0),     # exactly one ISO week
+        (date(2025, 1, 6), date(2025, 3, 30), 0),     # whole weeks only
+        (date(2025, 1, 1), date(2025, 1, 5), 0),      # the partial first week, which is a whole block
+        (date(2025, 1, 7), date(2025, 1, 12), 1),     # starts one day into a block
+        (date(2025, 1, 6), date(2025, 1, 11), 1),     # ends one day before a block ends
+        (date(2025, 1, 7), date(2025, 1, 18), 2),     # straddles two blocks
+        (date(2025, 6, 4), date(2025, 6, 4), 1),      # one day inside a block
+        (date(2025, 12, 29), date(2026, 1, 4), 0),    # the last block, past the end of the data
+        (date(2024, 12, 1), date(2024, 12, 31), 0),   # before the data
+        (date(2025, 1, 1), date(2025, 12, 31), 0),
+    ]
+    for start_date, end_date, expected_decodes in cases:
+        decoded.clear()
+        stats = archive.range_stats(start_date, end_date)
+        count, columns = brute_stats(source, start_date, end_date)
+
+        for stat, values in zip(stats.values(), columns or [[]] * len(stats)):
+            assert stat.count == count
+            assert stat.sum == pytest.approx(math.fsum(values), rel=1e-12)
+            assert stat.min == (min(values) if values else 0.0)
+            assert stat.max == (max(values) if values else 0.0)
+        # Only blocks that straddle an edge of the range are decoded
+        assert len(decoded) == expected_decodes, (start_date, end_date)
@@ -0,0 +1,54 @@
+# Copyright (c) 2026 Shaidul Islam
+# License: MIT
+
+import mmap
+import os
+import shutil
+import sys
+
+import pytest
+
+from conftest import task_path
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = str(tmp_path / "2025.csv")
+    shutil.copyfile(task_path("Task-f", "2025.csv"), path)
+    return path
+
+
+@pytest.fixture(scope="module")
+def cache(task_f):
+    # task_f.py imports its sibling modules by name
+    return sys.modules["cache"]
+
+
+def test_cache_is_read_in_place(task_f, cache, csv_file):
+    task_f.load_data(csv_file)  # parses and writes the cache
+    view = cache.read_cache(csv_file)
+    assert isinstance(view, memoryview) and isinstance(view.obj, mmap.mmap)
+    assert len(view) == 8760 * cache.RECORD.size
+    index = task_f.index_from_cache(view)
+    assert task_f.year_totals(index) == task_f.year_totals(task_f.read_data(csv_file))
+
+
+def test_edit_during_parse_invalidates_cache(task_f, cache, csv_file):
+    stamp = cache.source_stamp(csv_file)
+    rows = task_f.read_data(csv_file)
+    with open(csv_file, "a", encoding="utf-8") as file:
+        file.write("\n2026-01-01T00:00:00.000+02:00;1,000;0,000;-5,0")  # edited while parsing
+    cache.write_cache(csv_file, cache.records_from_rows(rows), stamp)
+    assert cache.read_cache(csv_file) is None
+    assert cache.read_cache(csv_file, stamp) is not None
+
+
+def test_start_loading_reads_cache_once(task_f, csv_file, monkeypatch):
+    task_f.load_data(csv_file)
+    calls = []
+    read_cache = task_f.read_cache
+    monkeypatch.setattr(task_f, "read_cache", lambda *args: calls.append(args) or read_cache(*args))
+    loader = task_f.start_loading(csv_file)
+    index = loader.data_through(None, show_progress=False)
+    assert len(calls) == 1
+    assert len(index) == 8760
@@ -0,0 +1,56 @@
+# Copyright (c) 2026 Shaidul Islam
+# License: MIT
+
+from datetime import datetime
+
+import pytest
+
+from conftest import load_module
+
+from shared.dates import decode_date, decode_datetime, decode_iso_datetime, decode_time
+
+CASES = {
+    "date": (decode_date, "%Y-%m-%d", datetime.date,
+             ["2025-11-12", "2025-1-2", "20251112", "2025-W46-3", "2025-11-1x", "2025-02-30"]),
+    "time": (decode_time, "%H:%M", datetime.time,
+             ["09:00", "9:00", "09:00:00", "0900", "09:00Z", "09:00+02:00", "24:00"]),
+    "datetime": (decode_datetime, "%Y-%m-%d %H:%M:%S", lambda value: value,
+                 ["2025-08-12 14:33:20", "2025-08-12T14:33:20", "2025-08-12 14:33:20+00:00",
+                  "2025-08-12 14:33", "20250812 143320", "2025-08-12 14:33:20.5"]),
+}
+
+
+@pytest.mark.parametrize("decode, layout, part, texts", CASES.values(), ids=CASES.keys())
+def test_decoders_accept_exactly_what_strptime_accepts(decode, layout, part, texts):
+    for text in texts:
+        try:
+            expected = part(datetime.strptime(text, layout))
+        except ValueError:
+            with pytest.raises(ValueError):
+                decode(text)
+        else:
+            assert decode(text) == expected, text
+
+
+@pytest.mark.parametrize("text", ["2025-08-12 14:33:20", "2025-08-12T14:33:20", "2025-08-12 14:33:20.5",
+                                  "2025-08-12 14:33:20+00:00", "20250812T143320", "2025-08-12 14:33:2"])
+def test_iso_decoder_accepts_exactly_what_fromisoformat_accepts(text):
+    # Task-g's baseline parsed createdAt with datetime.fromisoformat
+    try:
+        expected = datetime.fromisoformat(text)
+    except ValueError:
+        with pytest.raises(ValueError):
+            decode_iso_datetime(text)
+    else:
+        assert decode_iso_datetime(text) == expected
+
+
+def test_task_g_loads_iso_created_timestamps(tmp_path):
+    task_g_class = load_module("Task-g", "task_g_class.py", "task_g_class")
+    path = tmp_path / "reservations.txt"
+    path.write_text("id|name|email|phone|date|time|duration|price|confirmed|resource|created\n"
+                    "1|A|a@x.fi|040|2025-11-12|09:00|2|10.0|True|Sauna|2025-08-12T14:33:20\n"
+                    "2|B|b@x.fi|040|2025-11-12|11:00|1|10.0|False|Sauna|2025-08-12 14:33:20.250\n",
+                    encoding="utf-8")
+    assert len(task_g_class.fetch_reservations(str(path))) == 2
+    assert len(task_g_class.fetch_reservation_table(str(path))) == 2
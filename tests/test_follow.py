@@ -0,0 +1,99 @@
+# Copyright (c) 2026 Shaidul Islam
+# License: MIT
+
+import os
+import shutil
+
+import pytest
+
+from conftest import load_module, task_path
+from shared.tail import complete_end
+
+APPENDED = "210|New Person|n@x.fi|0401|2025-12-05|10:00|2|10.00|True|Sauna|2025-10-01 10:00:00"
+
+
+@pytest.fixture(scope="module")
+def task_g_class():
+    return load_module("Task-g", "task_g_class.py", "task_g_class")
+
+
+@pytest.fixture(scope="module")
+def follow(task_g_class):
+    return load_module("Task-g", "follow.py", "follow")
+
+
+@pytest.fixture(scope="module")
+def fetch_reservations(task_g_class):
+    return task_g_class.fetch_reservations
+
+
+@pytest.fixture
+def reservations_file(tmp_path):
+    path = str(tmp_path / "reservations.txt")
+    shutil.copyfile(task_path("Task-g", "reservations.txt"), path)
+    return path
+
+
+def append(path, text):
+    with open(path, "a", encoding="utf-8") as file:
+        file.write(text)
+
+
+def start_following(follow, fetch_reservations, path):
+    """What main does with --follow: load the whole lines present now and follow from there."""
+    stat = os.stat(path)
+    offset = complete_end(path, stat.st_size)
+    loaded = fetch_reservations(path, offset)
+    return loaded, follow.ReservationFollower(path, loaded, offset, stat.st_ino)
+
+
+def ids(reservations):
+    return [r.reservation_id for r in reservations]
+
+
+def test_first_poll_matches_fetch_reservations(follow, fetch_reservations, reservations_file):
+    append(reservations_file, "\n")
+    follower = follow.ReservationFollower(reservations_file)
+    follower.poll()
+    loaded = fetch_reservations(reservations_file)
+    assert ids(follower.reservations) == ids(loaded)
+    assert follower.cube.total_revenue() == pytest.approx(sum(r.total_price() for r in loaded))
+
+
+def test_seeded_follower_reads_only_appended_lines(follow, fetch_reservations, reservations_file):
+    append(reservations_file, "\n")
+    loaded, follower = start_following(follow, fetch_reservations, reservations_file)
+    assert follower.poll() == []
+    append(reservations_file, APPENDED[:40])
+    assert follower.poll() == []  # half-written line
+    append(reservations_file, APPENDED[40:] + "\n")
+    assert ids(follower.poll()) == [210]
+    assert len(follower.reservations) == len(loaded) + 1
+
+
+def test_line_split_across_startup(follow, fetch_reservations, reservations_file, capsys):
+    # The bundled file ends without a newline: its last reservation is still being written
+    last_id = ids(fetch_reservations(reservations_file))[-1]
+    loaded, follower = start_following(follow, fetch_reservations, reservations_file)
+    assert last_id not in ids(loaded)
+    append(reservations_file, "\n" + APPENDED[:40])
+    assert ids(follower.poll()) == [last_id]
+    append(reservations_file, APPENDED[40:] + "\n")
+    assert ids(follower.poll()) == [210]
+    assert "Skipping invalid line" not in capsys.readouterr().out
+
+
+def test_line_split_across_rotation(follow, fetch_reservations, reservations_file, capsys):
+    append(reservations_file, "\n")
+    loaded, follower = start_following(follow, fetch_reservations, reservations_file)
+    rotated = reservations_file + ".new"
+    shutil.copyfile(task_path("Task-g", "reservations.txt"), rotated)
+    append(rotated, "\n" + APPENDED[:40])
+    os.replace(rotated, reservations_file)
+    follower.poll()
+    assert follower.resets == 1
+    assert ids(follower.reservations) == ids(loaded)
+    append(reservations_file, APPENDED[40:] + "\n")
+    assert ids(follower.poll()) == [210]
+    assert ids(follower.reservations) == ids(loaded) + [210]
+    assert "Skipping invalid line" not in capsys.readouterr().out
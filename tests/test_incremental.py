@@ -0,0 +1,81 @@
+# Copyright (c) 2026 Shaidul Islam
+# License: MIT
+
+import json
+import os
+import shutil
+
+import pytest
+
+from conftest import task_path
+
+
+@pytest.fixture
+def weeks(tmp_path, monkeypatch, task_e):
+    data = tmp_path / "data"
+    data.mkdir()
+    for name in ("week41.csv", "week42.csv", "week43.csv"):
+        shutil.copy(task_path("Task-e", name), data / name)
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    monkeypatch.chdir(elsewhere)
+    return task_e.find_week_files(str(data))
+
+
+def counting(monkeypatch, task_e):
+    read = []
+    original = task_e.process_week_state
+
+    def process(item):
+        read.append(item[0])
+        return original(item)
+
+    monkeypatch.setattr(task_e, "process_week_state", process)
+    return read
+
+
+def test_state_sits_next_to_the_week_files(task_e, weeks):
+    sections = task_e.build_sections_incremental(weeks, workers=1)
+    assert sections == task_e.build_sections(weeks, workers=1)
+
+    state_path = os.path.join(os.path.dirname(weeks[41]), task_e.STATE_FILE)
+    assert not os.listdir(os.curdir)
+    with open(state_path, encoding="utf-8") as file:
+        state = json.load(file)
+    assert state["version"] == task_e.STATE_VERSION
+    assert sorted(state["weeks"]) == ["week41.csv", "week42.csv", "week43.csv"]
+    # Per-week daily totals only, no rendered text
+    entry = state["weeks"]["week41.csv"]
+    assert set(entry) == {"week", "size", "mtime_ns", "days"}
+
+
+def test_only_changed_weeks_are_read_again(task_e, weeks, monkeypatch):
+    expected = task_e.build_sections_incremental(weeks, workers=1)
+    read = counting(monkeypatch, task_e)
+
+    assert task_e.build_sections_incremental(weeks, workers=1) == expected
+    assert read == []
+
+    with open(weeks[42], encoding="utf-8") as file:
+        lines = file.read().splitlines(keepends=True)
+    with open(weeks[42], "w", encoding="utf-8") as file:
+        file.writelines(lines[:-24])
+    os.utime(weeks[42], ns=(0, 0))
+    sections = task_e.build_sections_incremental(weeks, workers=1)
+    assert read == [42]
+    assert sections == task_e.build_sections(weeks, workers=1)
+    assert sections[0] == expected[0] and sections[2] == expected[2]
+
+
+def test_state_of_another_version_is_ignored(task_e, weeks, monkeypatch):
+    task_e.build_sections_incremental(weeks, workers=1)
+    state_path = task_e.default_state_path(weeks)
+    with open(state_path, encoding="utf-8") as file:
+        state = json.load(file)
+    state["version"] = task_e.STATE_VERSION - 1
+    with open(state_path, "w", encoding="utf-8") as file:
+        json.dump(state, file)
+
+    read = counting(monkeypatch, task_e)
+    task_e.build_sections_incremental(weeks, workers=1)
+    assert read == [41, 42, 43]
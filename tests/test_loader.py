@@ -0,0 +1,34 @@
+# Copyright (c) 2026 Shaidul Islam
+# License: MIT
+
+import threading
+from datetime import date
+
+from conftest import task_path
+
+
+def test_totals_match_while_loading_and_after(task_f):
+    filename = task_path("Task-f", "2025.csv")
+    chunks = list(task_f.iter_data_chunks(filename))
+    release = threading.Event()
+
+    def gated():
+        # Every row is parsed, but loading only finishes once released
+        yield from chunks
+        release.wait()
+
+    loader = task_f.BackgroundLoader(gated(), task_f.RangeIndex,
+                                     last_day=task_f.peek_last_day(filename)).start()
+    september = date(2025, 9, 1), date(2025, 9, 30)
+
+    while_loading = (task_f.month_totals(loader, 9), task_f.range_totals(loader, *september))
+    assert not loader.done
+    assert loader.status().startswith("Data: loading")
+
+    release.set()
+    assert isinstance(loader.data_through(None, show_progress=False), task_f.RangeIndex)
+    after_loading = (task_f.month_totals(loader, 9), task_f.range_totals(loader, *september))
+
+    assert while_loading == after_loading
+    assert while_loading[0] == while_loading[1]
+    assert loader.status().startswith("Data: ready")
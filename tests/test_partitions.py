@@ -0,0 +1,61 @@
+# Copyright (c) 2026 Shaidul Islam
+# License: MIT
+
+import argparse
+from datetime import datetime, timedelta
+
+import pytest
+
+from shared.archive import csv_to_archive
+from shared.partitions import PartitionIndex
+
+
+HEADER = ("Time;Consumption phase 1 Wh;Consumption phase 2 Wh;Consumption phase 3 Wh;"
+          "Production phase 1 Wh;Production phase 2 Wh;Production phase 3 Wh\n")
+
+
+@pytest.fixture
+def export(tmp_path):
+    """A per-phase export with ISO week 2 of 2024 and of 2025."""
+    lines = [HEADER]
+    for monday in (datetime(2024, 1, 8), datetime(2025, 1, 6)):
+        for hour in range(7 * 24):
+            when = monday + timedelta(hours=hour)
+            base = when.year - 2000 + hour % 24
+            lines.append(f"{when:%Y-%m-%dT%H:%M:%S};{base};{base + 1};{base + 2};0;{hour % 5};0\n")
+    path = tmp_path / "year.csv"
+    path.write_text("".join(lines), encoding="utf-8")
+    return str(path)
+
+
+def section_dates(section):
+    return {line.split()[1] for line in section.splitlines()[4:] if line}
+
+
+def test_weeks_are_selected_by_iso_year_and_week(task_e, export):
+    sections = task_e.build_sections_yearly(export, workers=1)
+    assert [section.splitlines()[0].split()[1] for section in sections] == ["2", "2"]
+
+    [selected] = task_e.build_sections_yearly(export, [(2025, 2)], workers=1)
+    assert selected == sections[1]
+    assert all(day.endswith(".2025") for day in section_dates(selected))
+    assert task_e.build_sections_yearly(export, [(2026, 2)], workers=1) == []
+
+
+def test_archives_are_summarised_without_partitions(task_e, export, tmp_path):
+    archive = str(tmp_path / "year.ema")
+    csv_to_archive(export, archive)
+
+    with pytest.raises(ValueError, match="meter archive"):
+        PartitionIndex.build(archive)
+    assert task_e.build_sections_yearly(archive, workers=1) == \
+        task_e.build_sections_yearly(export, workers=1)
+    assert task_e.build_sections_yearly(archive, [(2024, 2)], workers=1) == \
+        task_e.build_sections_yearly(export, [(2024, 2)], workers=1)
+
+
+def test_parse_week(task_e):
+    assert task_e.parse_week("2025-W42") == (2025, 42)
+    assert task_e.parse_week("2026-W1") == (2026, 1)
+    with pytest.raises(argparse.ArgumentTypeError):
+        task_e.parse_week("42")
@@ -0,0 +1,78 @@
+# Copyright (c) 2026 Shaidul Islam
+# License: MIT
+
+import random
+from datetime import date
+
+import pytest
+
+from conftest import expected, task_path
+
+
+@pytest.fixture(scope="module")
+def rows(task_f):
+    return task_f.read_data(task_path("Task-f", "2025.csv"))
+
+
+@pytest.fixture(scope="module")
+def datasets(task_f, rows):
+    found = {"rows": rows, "index": task_f.RangeIndex(rows)}
+    if task_f.HAS_NUMPY:
+        found["columns"] = task_f.EnergyColumns.from_rows(rows)
+    return found
+
+
+def printed(task_f, totals):
+    consumption, production, temp_sum, count = totals
+    return (task_f.format_value(consumption), task_f.format_value(production),
+            task_f.format_value(temp_sum / count if count else 0), count)
+
+
+def random_ranges(rows, n=300, seed=7):
+    rng = random.Random(seed)
+    days = sorted({row["time"].date() for row in rows})
+    return [tuple(sorted(rng.sample(days, 2))) for _ in range(n)]
+
+
+def test_ranges_include_half_cent_ties(task_f, rows):
+    def milli(first, last):
+        return sum(task_f.to_milli(row["consumption"]) for row in rows if first <= row["time"].date() <= last)
+    assert milli(date(2025, 9, 1), date(2025, 9, 30)) % 10 == 5
+    assert any(milli(first, last) % 10 == 5 for first, last in random_ranges(rows))
+
+
+def test_range_totals_agree_on_every_path(task_f, rows, datasets):
+    for first, last in [(date(2025, 9, 1), date(2025, 9, 30)), *random_ranges(rows)]:
+        results = {name: printed(task_f, task_f.range_totals(data, first, last)) for name, data in datasets.items()}
+        assert len(set(results.values())) == 1, (first, last, results)
+
+
+def test_month_and_year_totals_agree_on_every_path(task_f, datasets):
+    for month in range(1, 13):
+        results = {name: printed(task_f, task_f.month_totals(data, month)) for name, data in datasets.items()}
+        assert len(set(results.values())) == 1, (month, results)
+    results = {name: printed(task_f, task_f.year_totals(data)) for name, data in datasets.items()}
+    assert len(set(results.values())) == 1, results
+
+
+def test_month_totals_match_date_range(task_f, datasets):
+    index = datasets["index"]
+    assert task_f.month_totals(index, 9) == task_f.range_totals(index, date(2025, 9, 1), date(2025, 9, 30))
+
+
+def baseline_reports():
+    """(menu answers, total lines) of every report in the baseline run, see tests/data."""
+    lines = expected("task_f_reports.txt").splitlines()
+    return [(lines[i].split(), lines[i + 1:i + 4]) for i in range(0, len(lines), 4)]
+
+
+def test_reports_match_baseline_on_every_path(task_f, datasets, monkeypatch):
+    # 53 weeks, 12 months, the year and 100 random ranges, as printed by the
+    # original row-by-row loop; several of them sit on a half cent
+    reports = {"1": task_f.create_daily_report, "2": task_f.create_monthly_report,
+               "3": task_f.create_yearly_report}
+    for name, data in datasets.items():
+        for (choice, *answers), lines in baseline_reports():
+            replies = iter(answers)
+            monkeypatch.setattr("builtins.input", lambda prompt="": next(replies))
+            assert reports[choice](data)[2:5] == lines, (name, choice, answers)
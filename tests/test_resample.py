@@ -0,0 +1,84 @@
+# Copyright (c) 2026 Shaidul Islam
+# License: MIT
+
+import contextlib
+import io
+import json
+import os
+import random
+import subprocess
+import sys
+from datetime import date
+
+from conftest import ROOT, expected, task_path
+from shared.resample import Resampler, resample
+
+
+def loop_sum(values, divisor=1.0):
+    total = 0.0
+    for value in values:
+        total += value / divisor
+    return total
+
+
+def test_sum_matches_row_by_row_loop():
+    # Compensated summation (sum() on Python 3.12+) gives 1.0 here
+    values = [0.1] * 10
+    day = date(2025, 10, 13).toordinal()
+    result = resample([day] * len(values), {"x": values})
+    assert result[date(2025, 10, 13)]["x"].sum == loop_sum(values) == 0.9999999999999999
+
+
+def test_sum_continues_across_batches():
+    values = [0.1, 0.2, 0.3, 1e16, 1.0, -1e16, 0.7] * 3
+    day = date(2025, 10, 13).toordinal()
+    resampler = Resampler(["x"], "day", divisor=1000)
+    for start in range(0, len(values), 4):
+        chunk = values[start:start + 4]
+        resampler.add_batch([day] * len(chunk), {"x": chunk})
+    assert resampler.result()[date(2025, 10, 13)]["x"].sum == loop_sum(values, 1000)
+
+
+def test_unsorted_rows_match_row_by_row_loop():
+    rng = random.Random(3)
+    first = date(2025, 1, 1).toordinal()
+    ordinals = [first + rng.randrange(60) for _ in range(5000)]
+    values = [rng.random() for _ in ordinals]
+    expected_stats = {}
+    for ordinal, value in zip(ordinals, values):
+        key = date.fromordinal(ordinal).isocalendar()[:2]
+        total, count, low, high = expected_stats.get(key, (0.0, 0, value, value))
+        expected_stats[key] = (total + value, count + 1, min(low, value), max(high, value))
+    result = resample(ordinals, {"x": values}, "week")
+    assert {key: (s["x"].sum, s["x"].count, s["x"].min, s["x"].max) for key, s in result.items()} == expected_stats
+
+
+def test_task_d_report_matches_baseline(task_d):
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        task_d.display_report(task_d.calculate_daily_totals(task_d.iter_csv_data(task_path("Task-d", "week42.csv"))))
+    assert output.getvalue() == expected("task_d_week42.txt")
+
+
+def test_task_e_summary_matches_baseline(task_e):
+    files = task_e.find_week_files(task_path("Task-e", ""))
+    sections = task_e.build_sections(files, workers=1)
+    with open(task_path("Task-e", "summary.txt"), encoding="utf-8") as file:
+        baseline = file.read().replace("\r", "")
+    assert "".join(section + "\n" for section in sections) == baseline
+
+
+def test_task_d_counts_rows_of_a_generator(task_d):
+    records = task_d.read_csv_data(task_path("Task-d", "week42.csv"))
+    resampler = task_d.resample_days(record for record in records)
+    assert resampler.rows == len(records) == 168
+    assert resampler.sums() == task_d.calculate_daily_totals(records)
+
+
+def test_task_d_profile_reports_aggregated_rows(tmp_path):
+    profile = tmp_path / "profile.json"
+    # main() streams the CSV into the aggregate stage as a generator
+    subprocess.run([sys.executable, os.path.join(ROOT, "Task-d", "task_d.py")], check=True,
+                   capture_output=True, env={**os.environ, "TASK_PROFILE": str(profile)})
+    stages = {entry["stage"]: entry for entry in json.loads(profile.read_text())["stages"]}
+    assert stages["aggregate:resample_days"]["rows"] == 168
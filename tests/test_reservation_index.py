@@ -0,0 +1,94 @@
+# Copyright (c) 2026 Shaidul Islam
+# License: MIT
+
+import math
+import random
+from datetime import date, datetime, time, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from conftest import load_module, task_path
+
+
+@pytest.fixture(scope="module")
+def reservation_index():
+    return load_module("Task-g", "reservation_index.py", "reservation_index")
+
+
+def random_intervals(rng, n):
+    intervals = []
+    for item in range(n):
+        start = rng.randrange(200)
+        intervals.append((start, start + rng.choice([0, 1, 1, 2, 3, 8, 40]), item))
+    return intervals
+
+
+def depth(node):
+    return 0 if node is None else 1 + max(depth(node[3]), depth(node[4]))
+
+
+def test_tree_matches_pairwise_scan(reservation_index):
+    rng = random.Random(8)
+    for n in (0, 1, 2, 7, 50, 500):
+        intervals = random_intervals(rng, n)
+        tree = reservation_index.IntervalTree(intervals)
+        assert len(tree) == n
+        assert depth(tree._root) <= math.log2(n + 1) + 1
+        for _ in range(200):
+            start = rng.randrange(-5, 210)
+            end = start + rng.choice([-1, 0, 1, 2, 5, 30])
+            found = sorted(interval[2] for interval in tree.overlapping(start, end))
+            assert found == sorted(item for s, e, item in intervals if s < end and e > start), (start, end)
+
+
+def reservations(rng, n):
+    first = date(2025, 11, 1)
+    return [
+        SimpleNamespace(
+            date=first + timedelta(days=rng.randrange(10)), time=time(rng.randrange(8, 20)),
+            duration=rng.choice([1, 1, 2, 3]), confirmed=rng.random() < 0.7,
+            resource=rng.choice(["Sauna", "Red Room", "Gym"]), number=number,
+        )
+        for number in range(n)
+    ]
+
+
+def slot(r):
+    start = datetime.combine(r.date, r.time)
+    return start, start + timedelta(hours=r.duration)
+
+
+def test_index_queries_match_pairwise_scan(reservation_index):
+    rng = random.Random(5)
+    items = reservations(rng, 400)
+    index = reservation_index.ReservationIndex(items)
+    for _ in range(200):
+        resource = rng.choice(["Sauna", "Red Room", "Gym", "Attic"])
+        start = datetime(2025, 11, 1, 8) + timedelta(hours=rng.randrange(24 * 10))
+        end = start + timedelta(hours=rng.choice([1, 2, 4]))
+        expected = [r for r in items
+                    if r.resource == resource and slot(r)[0] < end and slot(r)[1] > start]
+        found = index.overlapping(resource, start, end)
+        assert sorted(r.number for r in found) == sorted(r.number for r in expected)
+        assert index.is_free(resource, start, end) == (not expected)
+
+    for confirmed_only in (False, True):
+        pairs = {frozenset((a.number, b.number)) for a, b in index.double_bookings(confirmed_only)}
+        expected = {
+            frozenset((a.number, b.number)) for i, a in enumerate(items) for b in items[i + 1:]
+            if a.resource == b.resource and slot(a)[0] < slot(b)[1] and slot(b)[0] < slot(a)[1]
+            and (not confirmed_only or (a.confirmed and b.confirmed))
+        }
+        assert pairs == expected
+        assert len(index.double_bookings(confirmed_only)) == len(expected)
+
+
+def test_index_over_bundled_reservations(reservation_index):
+    task_g_class = load_module("Task-g", "task_g_class.py", "task_g_class")
+    table = task_g_class.fetch_reservation_table(task_path("Task-g", "reservations.txt"))
+    index = reservation_index.ReservationIndex(table)
+    for r in table:
+        start, end = slot(r)
+        assert r.reservation_id in [other.reservation_id for other in index.overlapping(r.resource, start, end)]
+        assert not index.is_free(r.resource, start, end)
@@ -0,0 +1,51 @@
+# Copyright (c) 2026 Shaidul Islam
+# License: MIT
+
+import pytest
+
+from conftest import load_module, task_path
+
+
+@pytest.fixture(scope="module")
+def task_g_class():
+    return load_module("Task-g", "task_g_class.py", "task_g_class")
+
+
+@pytest.fixture(scope="module")
+def revenue_cube(task_g_class):
+    return load_module("Task-g", "revenue_cube.py", "revenue_cube")
+
+
+@pytest.fixture
+def table(task_g_class):
+    return task_g_class.fetch_reservation_table(task_path("Task-g", "reservations.txt"))
+
+
+def snapshot(cube):
+    return {key: (cell.count, cell.hours, cell.revenue) for key, cell in cube._cells.items()}
+
+
+def test_set_confirmed_on_read_only_rows(revenue_cube, table):
+    cube = revenue_cube.RevenueCube(table)
+    before = snapshot(cube)
+    row = next(r for r in table if not r.confirmed)
+    cube.set_confirmed(row, False, True)
+    assert row.confirmed is False
+    assert cube.get(confirmed=True).revenue == pytest.approx(
+        sum(r.total_price() for r in table if r.confirmed) + row.total_price())
+    assert cube.get().count == len(table)
+    cube.set_confirmed(row, True, False)
+    assert snapshot(cube) == pytest.approx(before)
+
+
+def test_removals_that_would_go_negative_leave_the_cube_unchanged(revenue_cube, table):
+    cube = revenue_cube.RevenueCube(table)
+    before = snapshot(cube)
+    row = next(r for r in table if not r.confirmed)
+    with pytest.raises(ValueError):
+        revenue_cube.RevenueCube([row]).set_confirmed(row, True, False)  # it is not confirmed
+    cube.remove(row)
+    with pytest.raises(ValueError):
+        cube.remove(row)
+    cube.add(row)
+    assert snapshot(cube) == pytest.approx(before)
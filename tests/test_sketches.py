@@ -0,0 +1,101 @@
+# Copyright (c) 2026 Shaidul Islam
+# License: MIT
+
+import random
+import threading
+from datetime import date, datetime, timedelta
+
+from conftest import task_path
+
+from shared.sketches import LoadProfiles, LoadSummary, summarize
+
+
+def hourly_pairs(days, seed=7):
+    rng = random.Random(seed)
+    start = datetime(2024, 12, 30)
+    return [(start + timedelta(hours=h), round(rng.lognormvariate(-0.5, 0.8), 3))
+            for h in range(days * 24)]
+
+
+def state(summary):
+    return (summary.count, round(summary.total, 6), summary.peak.high, summary.peak.high_at,
+            summary.peak.low, summary.peak.low_at, summary.histogram.counts,
+            summary.sketch.positive, summary.sketch.negative, summary.sketch.zero_count,
+            summary.percentiles((0.01, 0.25, 0.5, 0.75, 0.95, 0.99)))
+
+
+def test_merging_batches_equals_one_pass():
+    pairs = hourly_pairs(70)
+    whole = LoadSummary.merged(summarize(pairs, "year").values())
+
+    profiles = LoadProfiles()
+    # Batches that split days, as loader chunks do
+    for start in range(0, len(pairs), 500):
+        profiles.add(pairs[start:start + 500])
+    assert state(profiles.select(lambda day: True)) == state(whole)
+
+    first, second = LoadProfiles(), LoadProfiles()
+    first.add(pairs[:777])
+    second.add(pairs[777:])
+    first.merge(second)
+    assert state(first.select(lambda day: True)) == state(whole)
+
+
+def test_periods_match_summarize():
+    pairs = hourly_pairs(70)
+    profiles = LoadProfiles()
+    profiles.add(pairs)
+    for freq in ("day", "week", "month", "year"):
+        expected = summarize(pairs, freq)
+        periods = profiles.periods(freq)
+        assert list(periods) == list(expected)
+        assert [state(s) for s in periods.values()] == [state(s) for s in expected.values()]
+
+    first, last = date(2025, 1, 3), date(2025, 1, 9)
+    in_range = [(when, value) for when, value in pairs if first <= when.date() <= last]
+    assert state(profiles.between(first, last)) == \
+        state(LoadSummary.merged(summarize(in_range, "year").values()))
+
+
+def test_quantiles_within_relative_accuracy():
+    rng = random.Random(3)
+    values = [rng.lognormvariate(0, 1.5) for _ in range(20000)] + [-rng.expovariate(2) for _ in range(500)]
+    start = datetime(2025, 1, 1)
+    profiles = LoadProfiles(relative_accuracy=0.01)
+    for start_hour in range(0, len(values), 3000):
+        profiles.add((start + timedelta(hours=h), values[h])
+                     for h in range(start_hour, min(start_hour + 3000, len(values))))
+    summary = profiles.select(lambda day: True)
+
+    ordered = sorted(values)
+    for q in (0.0, 0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99, 1.0):
+        exact = ordered[int(q * (len(ordered) - 1))]
+        assert abs(summary.quantile(q) - exact) <= 0.01 * abs(exact) + 1e-12, q
+    assert summary.peak.high == max(values) and summary.peak.low == min(values)
+
+
+def test_task_f_profiles_come_from_the_loading_stream(task_f):
+    filename = task_path("Task-f", "2025.csv")
+    chunks = list(task_f.iter_data_chunks(filename))
+    release = threading.Event()
+
+    def gated():
+        yield from chunks
+        release.wait()
+
+    profiles = LoadProfiles()
+    loader = task_f.BackgroundLoader(task_f.profiled(gated(), profiles), task_f.RangeIndex,
+                                     last_day=task_f.peek_last_day(filename))
+    task_f._with_profiles(loader, profiles).start()
+
+    while_loading = state(task_f.month_profile(loader, 9))
+    assert not loader.done
+    release.set()
+    index = loader.data_through(None, show_progress=False)
+
+    # The same numbers as a separate pass over the loaded index
+    assert state(task_f.month_profile(loader, 9)) == while_loading
+    assert while_loading == state(task_f.month_profile(index, 9))
+    assert state(task_f.year_profile(loader)) == state(task_f.year_profile(index))
+    september = date(2025, 9, 1), date(2025, 9, 30)
+    assert state(task_f.range_profile(loader, *september)) == while_loading
@@ -0,0 +1,63 @@
+# Copyright (c) 2026 Shaidul Islam
+# License: MIT
+
+import os
+
+from shared.tail import FileTail, complete_end
+
+
+def write(path, text, mode="w"):
+    with open(path, mode, encoding="utf-8") as file:
+        file.write(text)
+
+
+def test_first_read_leaves_unterminated_last_line(tmp_path):
+    path = str(tmp_path / "log.csv")
+    write(path, "\ntime;value\n\n1;a\n2;b")
+    tail = FileTail(path)
+    assert tail.poll() == ["1;a"]
+    assert tail.header == "time;value"
+    write(path, "\n", "a")
+    assert tail.poll() == ["2;b"]
+
+
+def test_complete_end_is_after_last_newline(tmp_path):
+    path = str(tmp_path / "log.csv")
+    write(path, "time;value\n1;a\n2;")
+    size = os.path.getsize(path)
+    assert complete_end(path, size) == complete_end(path, size, block=3) == len("time;value\n1;a\n")
+    assert complete_end(path, 5) == 0
+
+
+def test_later_reads_wait_for_complete_lines(tmp_path):
+    path = str(tmp_path / "log.csv")
+    write(path, "time;value\n1;a\n")
+    tail = FileTail(path)
+    tail.poll()
+    write(path, "2;", "a")
+    assert tail.poll() == []
+    write(path, "b\n3;c\n", "a")
+    assert tail.poll() == ["2;b", "3;c"]
+    assert tail.poll() == []
+
+
+def test_seeded_tail_continues_after_offset(tmp_path):
+    path = str(tmp_path / "log.csv")
+    write(path, "time;value\n1;a\n")
+    stat = os.stat(path)
+    tail = FileTail(path, stat.st_size, stat.st_ino)
+    write(path, "2;b\n", "a")
+    assert tail.poll() == ["2;b"]
+    assert tail.header is None
+
+
+def test_truncated_file_is_read_again_from_the_start(tmp_path):
+    path = str(tmp_path / "log.csv")
+    write(path, "time;value\n1;a\n2;b\n")
+    tail = FileTail(path)
+    tail.poll()
+    write(path, "when;value\n9;z")
+    assert tail.poll() == []
+    assert (tail.header, tail.resets) == ("when;value", 1)
+    write(path, "\n", "a")
+    assert tail.poll() == ["9;z"]